@@ -13,6 +13,9 @@ SCHEMA_DIR: Path = Path("class_generator") / "schema"
 RESOURCES_MAPPING_FILE: Path = SCHEMA_DIR / "__resources-mappings.json"
 RESOURCES_MAPPING_ARCHIVE: Path = SCHEMA_DIR / "__resources-mappings.json.gz"
 DEFINITIONS_FILE: Path = SCHEMA_DIR / "_definitions.json"
+# Per-kind indexes of the files above, see ocp_resources.utils.archive_utils.save_json_index
+RESOURCES_MAPPING_INDEX: Path = SCHEMA_DIR / "__resources-mappings.idx"
+DEFINITIONS_INDEX: Path = SCHEMA_DIR / "_definitions.idx"
 
 # Description constants
 MISSING_DESCRIPTION_STR: str = "No field description from API"
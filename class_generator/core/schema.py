@@ -11,9 +11,16 @@ from packaging.version import Version
 from pyhelper_utils.shell import run_command
 from simple_logger.logger import get_logger
 
-from class_generator.constants import DEFINITIONS_FILE, RESOURCES_MAPPING_FILE, SCHEMA_DIR
+from class_generator.constants import (
+    DEFINITIONS_FILE,
+    DEFINITIONS_INDEX,
+    RESOURCES_MAPPING_ARCHIVE,
+    RESOURCES_MAPPING_FILE,
+    RESOURCES_MAPPING_INDEX,
+    SCHEMA_DIR,
+)
 from class_generator.utils import execute_parallel_with_mapping, execute_parallel_tasks
-from ocp_resources.utils.archive_utils import save_json_archive
+from ocp_resources.utils.archive_utils import save_json_archive, save_json_index
 from ocp_resources.utils.schema_validator import SchemaValidator
 
 LOGGER = get_logger(name=__name__)
@@ -1405,6 +1412,8 @@ def write_schema_files(
             LOGGER.error(error_msg)
             raise IOError(error_msg) from e
 
+        _write_schema_index(data=definitions, index_file=DEFINITIONS_INDEX, source_file=Path(definitions_file))
+
     # Write and archive resources mapping
     try:
         save_json_archive(resources_mapping, RESOURCES_MAPPING_FILE)
@@ -1413,6 +1422,19 @@ def write_schema_files(
         LOGGER.error(error_msg)
         raise IOError(error_msg) from e
 
+    _write_schema_index(
+        data=resources_mapping, index_file=RESOURCES_MAPPING_INDEX, source_file=RESOURCES_MAPPING_ARCHIVE
+    )
+
+
+def _write_schema_index(data: dict[str, Any], index_file: Path, source_file: Path) -> None:
+    """Write the per-kind index of a schema file; the index is optional, so failures are only logged."""
+    try:
+        save_json_index(data=data, index_file=index_file, source_file=source_file)
+    except (OSError, TypeError, ValueError) as e:
+        LOGGER.warning(f"Failed to write schema index {index_file}: {e}")
+        index_file.unlink(missing_ok=True)
+
 
 @dataclasses.dataclass
 class UpdateStrategy:
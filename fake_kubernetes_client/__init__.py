@@ -1,7 +1,9 @@
 """Fake Kubernetes client for testing"""
 
+from fake_kubernetes_client.cluster_profile import FakeClusterProfile
 from fake_kubernetes_client.configuration import FakeConfiguration
 from fake_kubernetes_client.dynamic_client import FakeDynamicClient
+from fake_kubernetes_client.event_recorder import FakeEventRecorder
 from fake_kubernetes_client.exceptions import (
     ApiException,
     ConflictError,
@@ -15,8 +17,10 @@ from fake_kubernetes_client.resource_registry import FakeResourceRegistry
 from fake_kubernetes_client.resource_storage import FakeResourceStorage
 
 __all__ = [
+    "FakeClusterProfile",
     "FakeConfiguration",
     "FakeDynamicClient",
+    "FakeEventRecorder",
     "FakeKubernetesClient",
     "FakeResourceField",
     "FakeResourceInstance",
@@ -0,0 +1,167 @@
+"""FakeClusterProfile implementation for fake Kubernetes client"""
+
+import heapq
+import itertools
+import math
+import random
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, NamedTuple, Union
+
+# Request verbs of the fake client, "list" is a get without a name
+VERBS = ("get", "list", "create", "patch", "replace", "delete", "watch")
+# Verbs failed by conflict_rate, like optimistic concurrency failures on a busy cluster
+CONFLICT_VERBS = frozenset(["patch", "replace"])
+DEFAULT_SERVER_ERROR_MESSAGE: str = "etcdserver: leader changed"
+
+# Seconds: a constant, a (low, high) uniform range, or a function of the profile random generator
+Latency = Union[float, tuple[float, float], Callable[[random.Random], float]]
+
+
+class InjectedFault(NamedTuple):
+    """A failure the profile injects into a request"""
+
+    status: int
+    message: str
+    retry_after: Union[int, None] = None
+
+
+class StatusTransition(NamedTuple):
+    """A delayed status transition of a stored resource"""
+
+    kind: str
+    api_version: str
+    namespace: Union[str, None]
+    name: str
+    uid: str
+
+
+class FakeClusterProfile:
+    """
+    Latency and failure behaviour of the fake cluster, to exercise wait and retry code offline
+
+    Set as `FakeDynamicClient.cluster_profile`. With a `seed` and a fake `clock`/`sleep`, the injected latencies and
+    failures are the same on every run.
+
+    Args:
+        latency (dict[str, Latency] | None): Seconds each verb takes, by verb name or "*" for all other verbs.
+        requests_per_second (float | None): Throttling limit, requests above it get 429 with Retry-After.
+        burst (int | None): Requests allowed at once before throttling, defaults to requests_per_second.
+        server_error_rate (float): Fraction of requests failing with 500 InternalServerError.
+        server_error_message (str): Message of the injected InternalServerError.
+        conflict_rate (float): Fraction of patch and replace requests failing with 409 ConflictError.
+        status_delays (dict[str, float] | None): Seconds resources of a kind are Pending / not ready after create.
+        seed (int | None): Seed of the random generator used for latencies and failures.
+        clock (Callable[[], float]): Monotonic clock, in seconds.
+        sleep (Callable[[float], None]): Called to wait for the request latency.
+    """
+
+    def __init__(
+        self,
+        latency: Union[dict[str, Latency], None] = None,
+        requests_per_second: Union[float, None] = None,
+        burst: Union[int, None] = None,
+        server_error_rate: float = 0.0,
+        server_error_message: str = DEFAULT_SERVER_ERROR_MESSAGE,
+        conflict_rate: float = 0.0,
+        status_delays: Union[dict[str, float], None] = None,
+        seed: Union[int, None] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.latency = latency or {}
+        self.requests_per_second = requests_per_second
+        self.burst = burst if burst is not None else max(1, math.ceil(requests_per_second or 1))
+        self.server_error_rate = server_error_rate
+        self.server_error_message = server_error_message
+        self.conflict_rate = conflict_rate
+        self.status_delays = status_delays or {}
+        self.clock = clock
+        self.sleep = sleep
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._tokens_updated = clock()
+        # Heap of (due time, sequence, transition)
+        self._transitions: list[tuple[float, int, StatusTransition]] = []
+        self._sequence = itertools.count()
+
+    def before_request(self, verb: str) -> Union[InjectedFault, None]:
+        """
+        Wait for the latency of a request.
+
+        Returns:
+            InjectedFault | None: The failure to answer the request with, None to serve it.
+        """
+        with self._lock:
+            delay = self._draw_latency(verb=verb)
+
+        if delay > 0:
+            self.sleep(delay)
+
+        with self._lock:
+            retry_after = self._take_token()
+            if retry_after is not None:
+                return InjectedFault(
+                    status=429, message="Too many requests, please try again later.", retry_after=retry_after
+                )
+
+            if self.server_error_rate and self._random.random() < self.server_error_rate:
+                return InjectedFault(status=500, message=self.server_error_message)
+
+            if verb in CONFLICT_VERBS and self.conflict_rate and self._random.random() < self.conflict_rate:
+                return InjectedFault(
+                    status=409,
+                    message="the object has been modified; please apply your changes to the latest version and try again",
+                )
+
+        return None
+
+    def schedule_status_transition(self, transition: StatusTransition) -> bool:
+        """Schedule the ready status of a created resource, returns False if its kind has no status delay"""
+        delay = self.status_delays.get(transition.kind)
+        if delay is None:
+            return False
+
+        with self._lock:
+            heapq.heappush(self._transitions, (self.clock() + delay, next(self._sequence), transition))
+        return True
+
+    def pop_due_transitions(self) -> list[StatusTransition]:
+        """Get the status transitions whose delay passed, in the order they became due"""
+        now = self.clock()
+        due: list[StatusTransition] = []
+        with self._lock:
+            while self._transitions and self._transitions[0][0] <= now:
+                due.append(heapq.heappop(self._transitions)[2])
+        return due
+
+    def next_transition_in(self) -> Union[float, None]:
+        """Seconds until the next status transition is due, None if none is scheduled"""
+        with self._lock:
+            if not self._transitions:
+                return None
+            return max(0.0, self._transitions[0][0] - self.clock())
+
+    def _draw_latency(self, verb: str) -> float:
+        latency: Any = self.latency.get(verb, self.latency.get("*", 0))
+        if callable(latency):
+            return float(latency(self._random))
+        if isinstance(latency, tuple):
+            return self._random.uniform(*latency)
+        return float(latency)
+
+    def _take_token(self) -> Union[int, None]:
+        """Take a request token, returns the Retry-After seconds when there is none left (caller holds the lock)"""
+        if not self.requests_per_second:
+            return None
+
+        now = self.clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._tokens_updated) * self.requests_per_second)
+        self._tokens_updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return None
+
+        return max(1, math.ceil((1 - self._tokens) / self.requests_per_second))
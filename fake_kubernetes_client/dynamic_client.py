@@ -1,7 +1,12 @@
 """FakeDynamicClient implementation for fake Kubernetes client"""
 
+import gzip
+import json
+from pathlib import Path
 from typing import Any, Union
 
+from fake_kubernetes_client.cluster_profile import FakeClusterProfile
+from fake_kubernetes_client.event_recorder import FakeEventRecorder
 from fake_kubernetes_client.exceptions import NotFoundError
 from fake_kubernetes_client.kubernetes_client import FakeKubernetesClient
 from fake_kubernetes_client.resource_field import FakeResourceField
@@ -10,6 +15,9 @@ from fake_kubernetes_client.resource_registry import FakeResourceRegistry
 from fake_kubernetes_client.resource_storage import FakeResourceStorage
 from fake_kubernetes_client.resource_instance import FakeResourceInstance
 
+# Version of the save_snapshot file layout
+SNAPSHOT_FORMAT_VERSION: int = 1
+
 
 class FakeDynamicClient:
     """Fake implementation of kubernetes.dynamic.DynamicClient"""
@@ -26,6 +34,10 @@ class FakeDynamicClient:
 
         self.configuration = self.client.configuration
         self.storage = FakeResourceStorage()
+        # Replace to change how Events are generated on resource changes, e.g. FakeEventRecorder(enabled=False)
+        self.event_recorder = FakeEventRecorder()
+        # Set to inject latency, throttling, failures and delayed status transitions, see FakeClusterProfile
+        self.cluster_profile: Union[FakeClusterProfile, None] = None
         self.registry = FakeResourceRegistry()
         self._resources_manager = FakeResourceManager(client=self)
 
@@ -134,6 +146,66 @@ class FakeDynamicClient:
         """
         self.registry.register_resources(resources=resources)
 
+    def save_snapshot(self, path: Union[str, Path]) -> Path:
+        """
+        Save the fake cluster state to a gzip compressed JSON file.
+
+        The snapshot holds all stored resources, the resourceVersion counter and the resources added with
+        `register_resources`, so a large fixture cluster can be built once and loaded in later test sessions.
+
+        Args:
+            path: File to write.
+
+        Returns:
+            Path: The written file.
+        """
+        path = Path(path)
+        snapshot = {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "registered_resources": self.registry.get_registered_resources(),
+            "storage": self.storage.dump(),
+        }
+        with gzip.open(path, "wt", encoding="utf-8", compresslevel=6) as fd:
+            json.dump(snapshot, fd, separators=(",", ":"))
+
+        return path
+
+    def load_snapshot(self, path: Union[str, Path]) -> None:
+        """
+        Replace the fake cluster state with a snapshot written by `save_snapshot`.
+
+        Args:
+            path: Snapshot file.
+
+        Raises:
+            ValueError: If the snapshot was written with an unsupported format version.
+        """
+        with gzip.open(Path(path), "rt", encoding="utf-8") as fd:
+            snapshot = json.load(fd)
+
+        if snapshot.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported fake cluster snapshot format: {snapshot.get('format_version')}")
+
+        registered = {
+            (definition["kind"], definition["group_version"]) for definition in self.registry.get_registered_resources()
+        }
+        new_resources = [
+            definition
+            for definition in snapshot["registered_resources"]
+            if (definition["kind"], definition["group_version"]) not in registered
+        ]
+        if new_resources:
+            self.register_resources(resources=new_resources)
+
+        self.storage.load(data=snapshot["storage"])
+
+    @classmethod
+    def from_snapshot(cls, path: Union[str, Path]) -> "FakeDynamicClient":
+        """Create a client with the fake cluster state of a snapshot written by `save_snapshot`"""
+        client = cls()
+        client.load_snapshot(path=path)
+        return client
+
     def get(self, resource: Any, *args: Any, **kwargs: Any) -> Any:
         """Get resources based on resource definition"""
         # Extract resource definition from FakeResourceField if needed
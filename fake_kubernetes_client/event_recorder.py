@@ -0,0 +1,105 @@
+"""FakeEventRecorder implementation for fake Kubernetes client"""
+
+import random
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, DefaultDict, Union
+
+if TYPE_CHECKING:
+    from fake_kubernetes_client.resource_storage import FakeResourceStorage
+
+# Events kept per namespace, the oldest are deleted first
+DEFAULT_MAX_EVENTS_PER_NAMESPACE: int = 1000
+# Same as the API server default --event-ttl (1 hour)
+DEFAULT_EVENT_TTL_SECONDS: float = 3600
+
+
+class FakeEventRecorder:
+    """
+    Policy for the Events the fake client generates on resource changes
+
+    Repeated events for the same object, reason and message update the `count` and `lastTimestamp` of the existing
+    Event instead of creating a new one. Each namespace keeps at most `max_events_per_namespace` Events, Events not
+    repeated for `ttl_seconds` are deleted.
+
+    Args:
+        enabled (bool): Record events at all.
+        sample_rate (float): Fraction of the events to record, between 0 and 1.
+        max_events_per_namespace (int | None): Maximum Events kept per namespace, None for no limit.
+        ttl_seconds (float | None): Seconds an Event is kept after it was last recorded, None to never expire.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        sample_rate: float = 1.0,
+        max_events_per_namespace: Union[int, None] = DEFAULT_MAX_EVENTS_PER_NAMESPACE,
+        ttl_seconds: Union[float, None] = DEFAULT_EVENT_TTL_SECONDS,
+    ) -> None:
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.max_events_per_namespace = max_events_per_namespace
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        # {namespace: {aggregation key: (event name, monotonic time last recorded)}}, least recently recorded first
+        self._events: DefaultDict[str, OrderedDict[tuple[Any, ...], tuple[str, float]]] = defaultdict(OrderedDict)
+
+    def record(self, storage: "FakeResourceStorage", event: dict[str, Any]) -> None:
+        """Store a new Event, or count it on the existing identical Event"""
+        if not self.enabled or (self.sample_rate < 1 and random.random() >= self.sample_rate):
+            return
+
+        namespace = event["metadata"]["namespace"]
+        involved_object = event.get("involvedObject", {})
+        key = (
+            involved_object.get("kind"),
+            involved_object.get("name"),
+            involved_object.get("uid"),
+            event.get("reason"),
+            event.get("message"),
+            event.get("type"),
+        )
+        now = time.monotonic()
+
+        with self._lock:
+            namespace_events = self._events[namespace]
+            self._expire(storage=storage, namespace=namespace, now=now)
+
+            existing = None
+            if key in namespace_events:
+                event_name, _ = namespace_events.pop(key)
+                existing = storage.get_resource(kind="Event", api_version="v1", name=event_name, namespace=namespace)
+
+            if existing:
+                event = {
+                    **existing,
+                    "count": existing.get("count", 1) + 1,
+                    "lastTimestamp": datetime.now(timezone.utc).isoformat(),
+                    "involvedObject": involved_object,
+                }
+
+            storage.store_resource(
+                kind="Event", api_version="v1", name=event["metadata"]["name"], namespace=namespace, resource=event
+            )
+            namespace_events[key] = (event["metadata"]["name"], now)
+
+            if self.max_events_per_namespace is not None:
+                while len(namespace_events) > self.max_events_per_namespace:
+                    event_name, _ = namespace_events.popitem(last=False)[1]
+                    storage.delete_resource(kind="Event", api_version="v1", name=event_name, namespace=namespace)
+
+    def _expire(self, storage: "FakeResourceStorage", namespace: str, now: float) -> None:
+        """Delete the Events of a namespace whose TTL passed (caller holds the lock)"""
+        if self.ttl_seconds is None:
+            return
+
+        namespace_events = self._events[namespace]
+        while namespace_events:
+            key, (event_name, last_recorded) = next(iter(namespace_events.items()))
+            if now - last_recorded < self.ttl_seconds:
+                break
+
+            del namespace_events[key]
+            storage.delete_resource(kind="Event", api_version="v1", name=event_name, namespace=namespace)
@@ -8,10 +8,14 @@ try:
         ApiException,
         ConflictError,
         ForbiddenError,
+        GoneError,
+        InternalServerError,
         MethodNotAllowedError,
         NotFoundError,
         ResourceNotFoundError,
         ServerTimeoutError,
+        TooManyRequestsError,
+        UnprocessibleEntityError,
     )
 except ImportError:
     # Fallback implementations if kubernetes module is not available
@@ -36,6 +40,10 @@ except ImportError:
         def __init__(self, reason: str = "Forbidden") -> None:
             super().__init__(status=403, reason=reason)
 
+    class FakeClientGoneError(FakeClientApiException):
+        def __init__(self, reason: str = "Gone") -> None:
+            super().__init__(status=410, reason=reason)
+
     class FakeClientMethodNotAllowedError(FakeClientApiException):
         def __init__(self, reason: str = "Method Not Allowed") -> None:
             super().__init__(status=405, reason=reason)
@@ -48,11 +56,27 @@ except ImportError:
         def __init__(self, reason: str = "Server Timeout") -> None:
             super().__init__(status=504, reason=reason)
 
+    class FakeClientUnprocessibleEntityError(FakeClientApiException):
+        def __init__(self, reason: str = "Unprocessable Entity") -> None:
+            super().__init__(status=422, reason=reason)
+
+    class FakeClientTooManyRequestsError(FakeClientApiException):
+        def __init__(self, reason: str = "Too Many Requests") -> None:
+            super().__init__(status=429, reason=reason)
+
+    class FakeClientInternalServerError(FakeClientApiException):
+        def __init__(self, reason: str = "Internal Server Error") -> None:
+            super().__init__(status=500, reason=reason)
+
     # Create aliases with expected names
     ApiException = FakeClientApiException
     NotFoundError = FakeClientNotFoundError
     ConflictError = FakeClientConflictError
     ForbiddenError = FakeClientForbiddenError
+    GoneError = FakeClientGoneError
     MethodNotAllowedError = FakeClientMethodNotAllowedError
     ResourceNotFoundError = FakeClientResourceNotFoundError
     ServerTimeoutError = FakeClientServerTimeoutError
+    UnprocessibleEntityError = FakeClientUnprocessibleEntityError
+    TooManyRequestsError = FakeClientTooManyRequestsError
+    InternalServerError = FakeClientInternalServerError
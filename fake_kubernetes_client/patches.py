@@ -0,0 +1,339 @@
+"""Patch and server-side apply semantics for fake Kubernetes client"""
+
+from typing import Any, NamedTuple, Union
+
+from fake_kubernetes_client.resource_storage import thaw
+
+MERGE_PATCH = "application/merge-patch+json"
+STRATEGIC_MERGE_PATCH = "application/strategic-merge-patch+json"
+JSON_PATCH = "application/json-patch+json"
+APPLY_PATCH = "application/apply-patch+yaml"
+
+# Top level fields and metadata fields set by the server, never owned by an apply field manager
+_UNMANAGED_FIELDS = frozenset(["apiVersion", "kind", "status"])
+_MANAGED_METADATA_FIELDS = frozenset(["labels", "annotations"])
+_MISSING = object()
+
+
+class ApplyConflict(NamedTuple):
+    """A field set by an apply configuration that another field manager owns with a different value"""
+
+    manager: str
+    api_version: str
+    path: tuple[str, ...]
+
+    def __str__(self) -> str:
+        return f'conflict with "{self.manager}" using {self.api_version}: .{".".join(self.path)}'
+
+
+class ApplyConflictError(ValueError):
+    """Server-side apply changes fields owned by other field managers"""
+
+    def __init__(self, conflicts: list[ApplyConflict]) -> None:
+        self.conflicts = conflicts
+        plural = "conflict" if len(conflicts) == 1 else "conflicts"
+        super().__init__(f"Apply failed with {len(conflicts)} {plural}: {'; '.join(str(conf) for conf in conflicts)}")
+
+
+def apply_merge_patch(target: dict[str, Any], patch: dict[str, Any]) -> dict[str, Any]:
+    """
+    Apply a JSON merge patch (RFC 7386), `null` deletes a field and lists are replaced.
+
+    `target` is not modified, the unchanged parts of the result are shared with it.
+    """
+    merged = dict(target)
+    for key, value in patch.items():
+        if value is None:
+            merged.pop(key, None)
+        elif isinstance(value, dict):
+            merged[key] = apply_merge_patch(target=_as_dict(value=merged.get(key)), patch=value)
+        else:
+            merged[key] = value
+
+    return merged
+
+
+def apply_strategic_merge_patch(target: dict[str, Any], patch: dict[str, Any]) -> dict[str, Any]:
+    """
+    Apply a strategic merge patch, like a JSON merge patch except for lists of named objects.
+
+    Lists whose items all have a `name` (containers, volumes, env, ports...) are merged by name, an item with
+    `"$patch": "delete"` removes the item of that name. Other lists are replaced.
+    """
+    merged = dict(target)
+    for key, value in patch.items():
+        if value is None:
+            merged.pop(key, None)
+        elif isinstance(value, dict):
+            merged[key] = apply_strategic_merge_patch(target=_as_dict(value=merged.get(key)), patch=value)
+        elif isinstance(value, list) and _is_named_list(value=value) and _is_named_list(value=merged.get(key)):
+            merged[key] = _merge_named_list(target=merged[key], patch=value)
+        else:
+            merged[key] = value
+
+    return merged
+
+
+def apply_json_patch(target: dict[str, Any], operations: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Apply a JSON patch (RFC 6902), supports add, remove, replace, move, copy and test.
+
+    Raises:
+        ValueError: If an operation is not valid, its path does not exist or a test operation fails.
+    """
+    document = thaw(value=target)
+    for operation in operations:
+        op = operation.get("op")
+        path = _parse_pointer(pointer=operation.get("path"))
+
+        if op == "add":
+            _add(document=document, path=path, value=_get_value(operation=operation))
+        elif op == "remove":
+            _remove(document=document, path=path)
+        elif op == "replace":
+            _remove(document=document, path=path)
+            _add(document=document, path=path, value=_get_value(operation=operation))
+        elif op in ("move", "copy"):
+            from_path = _parse_pointer(pointer=operation.get("from"))
+            value = thaw(value=_resolve(document=document, path=from_path))
+            if op == "move":
+                _remove(document=document, path=from_path)
+            _add(document=document, path=path, value=value)
+        elif op == "test":
+            if _resolve(document=document, path=path) != _get_value(operation=operation):
+                raise ValueError(f"JSON patch test operation failed for path {operation['path']!r}")
+        else:
+            raise ValueError(f"Unsupported JSON patch operation: {op!r}")
+
+    return document
+
+
+def server_side_apply(
+    target: dict[str, Any],
+    configuration: dict[str, Any],
+    field_manager: str,
+    force: bool = False,
+    timestamp: Union[str, None] = None,
+) -> dict[str, Any]:
+    """
+    Apply a configuration with server-side apply field ownership.
+
+    The fields in `configuration` become owned by `field_manager`, recorded in `metadata.managedFields`. Fields the
+    manager applied before and no longer sets are removed, unless another manager owns them. Lists are owned as a
+    whole, and only apply operations own fields.
+
+    Args:
+        target: Current resource, empty when the apply creates it.
+        configuration: Applied configuration.
+        field_manager: Name of the applying field manager.
+        force: Take the ownership of conflicting fields instead of failing.
+        timestamp: Time recorded on the managed fields entry.
+
+    Returns:
+        dict[str, Any]: The resource after the apply.
+
+    Raises:
+        ApplyConflictError: If the configuration changes fields owned by other managers, and `force` is False.
+    """
+    api_version = configuration.get("apiVersion", target.get("apiVersion", ""))
+    applied_fields = _field_paths(value=configuration)
+
+    # {manager: (apiVersion, time, owned field paths)}
+    managers: dict[str, tuple[str, Union[str, None], set[tuple[str, ...]]]] = {}
+    for entry in target.get("metadata", {}).get("managedFields") or []:
+        if entry.get("operation") == "Apply":
+            managers[entry["manager"]] = (
+                entry.get("apiVersion", api_version),
+                entry.get("time"),
+                _parse_fields_v1(fields=entry.get("fieldsV1", {})),
+            )
+
+    conflicts = [
+        ApplyConflict(manager=manager, api_version=manager_api_version, path=path)
+        for manager, (manager_api_version, _, fields) in managers.items()
+        if manager != field_manager
+        for path in sorted(applied_fields & fields)
+        if _get_path(value=target, path=path) != _get_path(value=configuration, path=path)
+    ]
+    if conflicts and not force:
+        raise ApplyConflictError(conflicts=conflicts)
+
+    for conflict in conflicts:
+        managers[conflict.manager][2].discard(conflict.path)
+
+    _, _, previous_fields = managers.pop(field_manager, (api_version, timestamp, set()))
+    other_fields = set().union(*(fields for _, _, fields in managers.values()))
+
+    applied = dict(configuration)
+    applied["metadata"] = {
+        key: value for key, value in configuration.get("metadata", {}).items() if key != "managedFields"
+    }
+    result = apply_merge_patch(target=target, patch=applied)
+    for path in sorted(previous_fields - applied_fields - other_fields, key=len, reverse=True):
+        result = _delete_path(value=result, path=path)
+
+    managers[field_manager] = (api_version, timestamp, applied_fields)
+    result["metadata"] = {
+        **result.get("metadata", {}),
+        "managedFields": [
+            {
+                "manager": manager,
+                "operation": "Apply",
+                "apiVersion": manager_api_version,
+                "time": manager_time,
+                "fieldsType": "FieldsV1",
+                "fieldsV1": _build_fields_v1(paths=fields),
+            }
+            for manager, (manager_api_version, manager_time, fields) in managers.items()
+            if fields
+        ],
+    }
+    return result
+
+
+def _as_dict(value: Any) -> dict[str, Any]:
+    return value if isinstance(value, dict) else {}
+
+
+def _is_named_list(value: Any) -> bool:
+    return isinstance(value, list) and all(isinstance(item, dict) and "name" in item for item in value)
+
+
+def _merge_named_list(target: list[dict[str, Any]], patch: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Merge lists of named objects by name, patched items keep their position and new items are appended"""
+    merged = {item["name"]: item for item in target}
+    for item in patch:
+        if item.get("$patch") == "delete":
+            merged.pop(item["name"], None)
+        elif item["name"] in merged:
+            merged[item["name"]] = apply_strategic_merge_patch(target=merged[item["name"]], patch=item)
+        else:
+            merged[item["name"]] = item
+
+    return list(merged.values())
+
+
+def _parse_pointer(pointer: Any) -> list[str]:
+    """Split a JSON pointer (RFC 6901) into its unescaped parts"""
+    if not isinstance(pointer, str) or (pointer and not pointer.startswith("/")):
+        raise ValueError(f"Invalid JSON pointer: {pointer!r}")
+
+    return [part.replace("~1", "/").replace("~0", "~") for part in pointer.split("/")[1:]]
+
+
+def _get_value(operation: dict[str, Any]) -> Any:
+    if "value" not in operation:
+        raise ValueError(f"JSON patch {operation.get('op')} operation requires a value")
+
+    return operation["value"]
+
+
+def _resolve(document: Any, path: list[str]) -> Any:
+    for part in path:
+        if isinstance(document, dict) and part in document:
+            document = document[part]
+        elif isinstance(document, list) and part.isdigit() and int(part) < len(document):
+            document = document[int(part)]
+        else:
+            raise ValueError(f"JSON patch path does not exist: /{'/'.join(path)}")
+
+    return document
+
+
+def _add(document: Any, path: list[str], value: Any) -> None:
+    if not path:
+        raise ValueError("JSON patch cannot replace the whole resource")
+
+    parent = _resolve(document=document, path=path[:-1])
+    key = path[-1]
+    if isinstance(parent, dict):
+        parent[key] = value
+    elif isinstance(parent, list) and key == "-":
+        parent.append(value)
+    elif isinstance(parent, list) and key.isdigit() and int(key) <= len(parent):
+        parent.insert(int(key), value)
+    else:
+        raise ValueError(f"JSON patch path does not exist: /{'/'.join(path)}")
+
+
+def _remove(document: Any, path: list[str]) -> None:
+    if not path:
+        raise ValueError("JSON patch cannot remove the whole resource")
+
+    _resolve(document=document, path=path)
+    parent = _resolve(document=document, path=path[:-1])
+    if isinstance(parent, dict):
+        del parent[path[-1]]
+    else:
+        del parent[int(path[-1])]
+
+
+def _field_paths(value: dict[str, Any]) -> set[tuple[str, ...]]:
+    """Get the paths of the fields an apply configuration sets, nested objects are not fields themselves"""
+    paths: set[tuple[str, ...]] = set()
+    for key, item in value.items():
+        if key in _UNMANAGED_FIELDS:
+            continue
+
+        if key == "metadata":
+            for metadata_key in _MANAGED_METADATA_FIELDS:
+                for name, metadata_value in (item.get(metadata_key) or {}).items():
+                    if metadata_value is not None:
+                        paths.add((key, metadata_key, name))
+        else:
+            paths.update(_leaf_paths(value=item, prefix=(key,)))
+
+    return paths
+
+
+def _leaf_paths(value: Any, prefix: tuple[str, ...]) -> set[tuple[str, ...]]:
+    if isinstance(value, dict) and value:
+        return set().union(*(_leaf_paths(value=item, prefix=(*prefix, key)) for key, item in value.items()))
+
+    return set() if value is None else {prefix}
+
+
+def _get_path(value: Any, path: tuple[str, ...]) -> Any:
+    for key in path:
+        if not isinstance(value, dict) or key not in value:
+            return _MISSING
+        value = value[key]
+
+    return value
+
+
+def _delete_path(value: dict[str, Any], path: tuple[str, ...]) -> dict[str, Any]:
+    """Get a copy of `value` without the field at `path`, only the dicts along the path are copied"""
+    if path[0] not in value:
+        return value
+
+    result = dict(value)
+    if len(path) == 1:
+        del result[path[0]]
+    elif isinstance(result[path[0]], dict):
+        result[path[0]] = _delete_path(value=result[path[0]], path=path[1:])
+
+    return result
+
+
+def _build_fields_v1(paths: set[tuple[str, ...]]) -> dict[str, Any]:
+    """Build the `fieldsV1` tree of `metadata.managedFields`, e.g. {"f:spec": {"f:replicas": {}}}"""
+    tree: dict[str, Any] = {}
+    for path in sorted(paths):
+        node = tree
+        for key in path:
+            node = node.setdefault(f"f:{key}", {})
+
+    return tree
+
+
+def _parse_fields_v1(fields: dict[str, Any], prefix: tuple[str, ...] = ()) -> set[tuple[str, ...]]:
+    paths: set[tuple[str, ...]] = set()
+    for key, children in fields.items():
+        if not key.startswith("f:"):
+            continue
+
+        path = (*prefix, key[2:])
+        paths.update(_parse_fields_v1(fields=children, prefix=path) if children else {path})
+
+    return paths
@@ -1,74 +1,109 @@
 """FakeResourceField implementation for fake Kubernetes client"""
 
-import copy
 from typing import Any, Iterator, Union
 
+from fake_kubernetes_client.resource_storage import FrozenList, thaw
+
+# Resource definition attributes returned as strings, "" when missing
+_DEFINITION_ATTRIBUTES = frozenset(["api_version", "group_version", "kind", "plural", "singular", "group", "version"])
+
+
+def _wrap(value: Any) -> Any:
+    """Wrap a data value the way attribute access returns it"""
+    if value is None:
+        return FakeResourceField(data={})
+    if isinstance(value, dict):
+        return FakeResourceField(data=value)
+    if isinstance(value, list):
+        return FakeResourceFieldList(value)
+    return value
+
+
+class FakeResourceFieldList(list):
+    """
+    List value of a FakeResourceField, its dict items are wrapped in FakeResourceField when accessed
+
+    The list holds the raw items, so comparing it with a list of dicts compares the data. Each wrapper is built once.
+    """
+
+    __slots__ = ("_wrapped",)
+
+    def __init__(self, items: list[Any]) -> None:
+        super().__init__(items)
+        self._wrapped: dict[int, FakeResourceField] = {}
+
+    def _wrap_item(self, index: int) -> Any:
+        # The raw item, not the wrapped one
+        item = super().__getitem__(index)
+        if not isinstance(item, dict):
+            return item
+
+        wrapped = self._wrapped.get(index)
+        if wrapped is None:
+            wrapped = self._wrapped[index] = FakeResourceField(data=item)
+        return wrapped
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self._wrap_item(index=idx) for idx in range(len(self))[index]]
+        return self._wrap_item(index=index if index >= 0 else index + len(self))
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self)):
+            yield self._wrap_item(index=index)
+
+    def __reversed__(self) -> Iterator[Any]:
+        for index in reversed(range(len(self))):
+            yield self._wrap_item(index=index)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return list, (self.to_list(),)
+
+    def to_list(self) -> list[Any]:
+        """Convert to list"""
+        # The raw items, not the wrapped ones
+        return thaw(value=list(super().__iter__()))
+
 
 class FakeResourceField:
-    """Fake implementation of kubernetes.dynamic.resource.ResourceField"""
+    """
+    Fake implementation of kubernetes.dynamic.resource.ResourceField
+
+    Child wrappers are built on first access and reused while the underlying value is unchanged, so walking the same
+    fields in a loop does not allocate.
+    """
+
+    __slots__ = ("_children", "_data")
 
     def __init__(self, data: Union[dict[str, Any], None]) -> None:
         self._data = data if data is not None else {}
+        # {key: (raw value, wrapped value)}
+        self._children: dict[str, tuple[Any, Any]] = {}
 
-    def __getattribute__(self, name: str) -> Any:
-        # ONLY handle essential internal attributes and methods here
-        # Let __getattr__ handle all dynamic attribute access
-        if name.startswith("_") or name in {"to_dict", "keys", "values", "get"}:
-            return object.__getattribute__(self, name)
-
-        # Special case: handle 'items' in __getattribute__ to override method lookup
-        if name == "items":
-            try:
-                data = object.__getattribute__(self, "_data")
-                if "items" in data:
-                    value = data["items"]
-                    if isinstance(value, list):
-                        return [FakeResourceField(item) if isinstance(item, dict) else item for item in value]
-                    return value
-            except AttributeError:
-                pass
-            # Fall back to the method if no items data
-            return object.__getattribute__(self, name)
-
-        # For all other attributes, let __getattr__ handle it
-        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+    def _child(self, key: str) -> Any:
+        value = self._data.get(key)
+        cached = self._children.get(key)
+        if cached is not None and cached[0] is value:
+            return cached[1]
 
-    def __getattr__(self, name: str) -> Any:
-        # This is called ONLY when __getattribute__ raises AttributeError
-        # Handle all dynamic attribute access here
+        wrapped = _wrap(value=value)
+        # A list wrapper holds a copy of the items, only a frozen list can't change under it
+        if value is None or isinstance(value, (dict, FrozenList)):
+            self._children[key] = (value, wrapped)
+        return wrapped
 
-        # Direct access to _data without using hasattr (avoids recursion)
-        try:
-            data = object.__getattribute__(self, "_data")
-        except AttributeError:
-            data = {}
+    def __getattr__(self, name: str) -> Any:
+        # Called only for names that are not methods or slots, i.e. resource data
 
         # For resource definition access, return simple values for common attributes
         # This ensures compatibility with ocp_resources code that expects strings
-        if name in ["api_version", "group_version", "kind", "plural", "singular", "group", "version"]:
-            return data.get(name, "")
-
-        # Handle general data access
-        value = data.get(name)
-        if value is None:
-            return FakeResourceField(data={})
-        elif isinstance(value, dict):
-            return FakeResourceField(data=value)
-        elif isinstance(value, list):
-            return [FakeResourceField(data=item) if isinstance(item, dict) else item for item in value]
-        else:
-            return value
+        if name in _DEFINITION_ATTRIBUTES:
+            return self._data.get(name, "")
+
+        return self._child(key=name)
 
     def __getitem__(self, key: str) -> Any:
-        value = self._data.get(key)
-        if value is None:
-            return FakeResourceField(data={})
-        elif isinstance(value, dict):
-            return FakeResourceField(data=value)
-        elif isinstance(value, list):
-            return [FakeResourceField(data=item) if isinstance(item, dict) else item for item in value]
-        else:
-            return value
+        return self._child(key=key)
 
     def __contains__(self, key: str) -> bool:
         return key in self._data
@@ -85,12 +120,12 @@ class FakeResourceField:
     def get(self, key: str, default: Any = None) -> Any:
         value = self._data.get(key, default)
         if isinstance(value, dict) and value != default:
-            return FakeResourceField(data=value)
+            return self._child(key=key)
         return value
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary"""
-        return copy.deepcopy(self._data)
+        return thaw(value=self._data)
 
     def keys(self) -> Any:
         """Get dictionary keys"""
@@ -100,16 +135,16 @@ class FakeResourceField:
         """Get dictionary values"""
         return self._data.values()
 
+    @property
     def items(self) -> Any:
-        """Get dictionary items - but handle special case where 'items' is data"""
-        # If 'items' key exists in data, return that instead of dict.items()
+        """
+        Get the 'items' data of list responses, or the dict.items method when there is no such data
+
+        `resp.items` is the list of resources while `field.items()` still works like a dictionary.
+        """
         if "items" in self._data:
-            value = self._data["items"]
-            if isinstance(value, list):
-                return [FakeResourceField(data=item) if isinstance(item, dict) else item for item in value]
-            return value
-        # Otherwise return dict.items()
-        return self._data.items()
+            return self._child(key="items")
+        return self._data.items
 
     def __iter__(self) -> Iterator[str]:
         """Make it iterable like a dictionary"""
@@ -1,14 +1,36 @@
 """FakeResourceInstance implementation for fake Kubernetes client"""
 
-import copy
+import json
 import time
 import uuid
+from collections.abc import Mapping
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Iterator, Union
 
-from fake_kubernetes_client.exceptions import ConflictError, MethodNotAllowedError, NotFoundError
+from fake_kubernetes_client.cluster_profile import FakeClusterProfile, InjectedFault, StatusTransition
+from fake_kubernetes_client.exceptions import (
+    ConflictError,
+    GoneError,
+    InternalServerError,
+    MethodNotAllowedError,
+    NotFoundError,
+    TooManyRequestsError,
+    UnprocessibleEntityError,
+)
+from fake_kubernetes_client.patches import (
+    APPLY_PATCH,
+    JSON_PATCH,
+    MERGE_PATCH,
+    STRATEGIC_MERGE_PATCH,
+    ApplyConflictError,
+    apply_json_patch,
+    apply_merge_patch,
+    apply_strategic_merge_patch,
+    server_side_apply,
+)
 from fake_kubernetes_client.resource_field import FakeResourceField
-from fake_kubernetes_client.status_templates import add_realistic_status
+from fake_kubernetes_client.resource_storage import merge_patch, thaw
+from fake_kubernetes_client.status_templates import add_realistic_status, get_pending_status_template
 
 if TYPE_CHECKING:
     from fake_kubernetes_client.dynamic_client import FakeDynamicClient
@@ -59,9 +81,129 @@ class FakeResourceInstance:
             # Use our fake ConflictError which has status attribute
             raise ConflictError(f"{self.resource_def['kind']} '{name}' already exists")
 
+    def _create_gone_error(self, resource_version: int) -> None:
+        """Create proper GoneError for a resource version compacted out of the event journal"""
+        reason = f"too old resource version: {resource_version} ({self.storage.compacted_resource_version})"
+        try:
+            raise GoneError(K8sApiException(status=410, reason=reason))
+        except (NameError, TypeError):
+            # K8sApiException not available (ImportError at module level)
+            raise GoneError(reason)
+
+    def _create_resource_version_conflict_error(self, name: str) -> None:
+        """Create proper ConflictError for a write with an outdated resourceVersion"""
+        try:
+            api_exception = K8sApiException(status=409, reason="Conflict")
+            api_exception.body = f'{{"kind":"Status","apiVersion":"v1","metadata":{{}},"status":"Failure","message":"Operation cannot be fulfilled on {self.resource_def["kind"].lower()}s.{self.resource_def.get("group", "")} \\"{name}\\": the object has been modified; please apply your changes to the latest version and try again","reason":"Conflict","code":409}}'
+            raise ConflictError(api_exception)
+        except (NameError, TypeError):
+            # Use our fake ConflictError which has status attribute
+            raise ConflictError(
+                f"Operation cannot be fulfilled on {self.resource_def['kind']} '{name}': the object has been modified"
+            )
+
+    def _create_apply_conflict_error(self, error: ApplyConflictError) -> None:
+        """Create proper ConflictError for a server-side apply changing fields owned by other field managers"""
+        try:
+            api_exception = K8sApiException(status=409, reason="Conflict")
+            api_exception.body = json.dumps({
+                "kind": "Status",
+                "apiVersion": "v1",
+                "metadata": {},
+                "status": "Failure",
+                "message": str(error),
+                "reason": "Conflict",
+                "details": {
+                    "causes": [
+                        {"reason": "FieldManagerConflict", "message": str(conflict), "field": ".".join(conflict.path)}
+                        for conflict in error.conflicts
+                    ]
+                },
+                "code": 409,
+            })
+            raise ConflictError(api_exception)
+        except (NameError, TypeError):
+            # Use our fake ConflictError which has status attribute
+            raise ConflictError(str(error))
+
+    def _create_unprocessable_error(self, name: str, message: str) -> None:
+        """Create proper UnprocessibleEntityError for a patch that cannot be applied"""
+        reason = f"{self.resource_def['kind']} '{name}' is invalid: {message}"
+        try:
+            raise UnprocessibleEntityError(K8sApiException(status=422, reason=reason))
+        except (NameError, TypeError):
+            # K8sApiException not available (ImportError at module level)
+            raise UnprocessibleEntityError(reason)
+
+    def _create_injected_error(self, fault: InjectedFault) -> None:
+        """Create the error of a failure injected by the cluster profile"""
+        exception_class = {409: ConflictError, 429: TooManyRequestsError}.get(fault.status, InternalServerError)
+        try:
+            api_exception = K8sApiException(status=fault.status, reason=fault.message)
+            api_exception.body = json.dumps({
+                "kind": "Status",
+                "apiVersion": "v1",
+                "metadata": {},
+                "status": "Failure",
+                "message": fault.message,
+                "code": fault.status,
+            })
+            if fault.retry_after is not None:
+                api_exception.headers = {"Retry-After": str(fault.retry_after)}
+            raise exception_class(api_exception)
+        except (NameError, TypeError):
+            # K8sApiException not available (ImportError at module level)
+            raise exception_class(fault.message)
+
+    def _get_cluster_profile(self) -> Union[FakeClusterProfile, None]:
+        return getattr(self.client, "cluster_profile", None)
+
+    def _before_request(self, verb: str) -> None:
+        """Apply the cluster profile to a request: due status transitions, latency and injected failures"""
+        cluster_profile = self._get_cluster_profile()
+        if cluster_profile is None:
+            return
+
+        self._apply_status_transitions(cluster_profile=cluster_profile)
+        fault = cluster_profile.before_request(verb=verb)
+        if fault:
+            self._create_injected_error(fault=fault)
+
+    def _apply_status_transitions(self, cluster_profile: FakeClusterProfile) -> None:
+        """Store the ready status of the resources whose status delay passed"""
+        for transition in cluster_profile.pop_due_transitions():
+            with self.storage.resource_lock(
+                kind=transition.kind, api_version=transition.api_version, namespace=transition.namespace
+            ):
+                existing = self.storage.get_resource(
+                    kind=transition.kind,
+                    api_version=transition.api_version,
+                    name=transition.name,
+                    namespace=transition.namespace,
+                )
+                # Skip resources deleted, or deleted and created again, in the meantime
+                if not existing or existing["metadata"].get("uid") != transition.uid:
+                    continue
+
+                ready = thaw(value=existing)
+                add_realistic_status(body=ready, resource_mappings=self._get_resource_mappings())
+                self.storage.store_resource(
+                    kind=transition.kind,
+                    api_version=transition.api_version,
+                    name=transition.name,
+                    namespace=transition.namespace,
+                    resource=merge_patch(target=existing, patch={"status": ready.get("status", {})}),
+                )
+
+    def _get_resource_mappings(self) -> Union[Mapping[str, Any], None]:
+        """Get resource mappings from the registry if available"""
+        if self.client and hasattr(self.client, "registry"):
+            return self.client.registry._get_resource_mappings()
+        return None
+
     def _generate_resource_version(self) -> str:
-        """Generate unique resource version"""
-        return str(int(time.time() * 1000))
+        """Get the current resource version of the storage, each stored change gets the next one"""
+        return str(self.storage.resource_version)
 
     def _generate_timestamp(self) -> str:
         """Generate current UTC timestamp in ISO format"""
@@ -71,6 +213,7 @@ class FakeResourceInstance:
         self, body: Union[dict[str, Any], None] = None, namespace: Union[str, None] = None, **kwargs: Any
     ) -> FakeResourceField:
         """Create a resource"""
+        self._before_request(verb="create")
         if body is None:
             raise ValueError("body is required for create")
 
@@ -97,57 +240,80 @@ class FakeResourceInstance:
         # Use group_version for storage operations (consistent full API version)
         storage_api_version = self._get_storage_api_version()
 
-        # Check if resource already exists
-        existing = self.storage.get_resource(
-            kind=self.resource_def["kind"], api_version=storage_api_version, name=name, namespace=resource_namespace
-        )
-        if existing:
-            self._create_conflict_error(name)
-
-        # Add generated metadata
-        body["metadata"].update({
-            "uid": str(uuid.uuid4()),
-            "resourceVersion": self._generate_resource_version(),
-            "creationTimestamp": self._generate_timestamp(),
-            "generation": 1,
-            "labels": body["metadata"].get("labels", {}),
-            "annotations": body["metadata"].get("annotations", {}),
-        })
-
-        # Set API version and kind
-        body["apiVersion"] = storage_api_version  # Use the same full API version for body
-        body["kind"] = self.resource_def["kind"]
-
-        # Add realistic status for resources that need it
-        # Pass resource mappings from registry if available
-        resource_mappings = None
-        if self.client and hasattr(self.client, "registry"):
-            resource_mappings = self.client.registry._get_resource_mappings()
-
-        add_realistic_status(body=body, resource_mappings=resource_mappings)
-
-        # Special case: ProjectRequest is ephemeral - only creates Project (matches real cluster behavior)
-        if self.resource_def["kind"] == "ProjectRequest":
-            # Don't store ProjectRequest - it's ephemeral
-            project_body = self._create_corresponding_project(body)
-            # Generate events for the Project creation, not ProjectRequest
-            self._generate_resource_events(project_body, "Created", "created")
-            # Return Project data, not ProjectRequest (ProjectRequest is ephemeral)
-            return FakeResourceField(data=project_body)
-
-        # Store resource with initial metadata and status
-        self.storage.store_resource(
-            api_version=storage_api_version,  # Use consistent API version for storage
+        # Check and store under the lock so concurrent creates of the same name conflict
+        with self.storage.resource_lock(
             kind=self.resource_def["kind"],
-            name=name,
-            namespace=self._normalize_namespace(namespace),  # Normalize namespace (empty string -> None)
-            resource=body,
-        )
+            api_version=storage_api_version,
+            namespace=self._normalize_namespace(namespace),
+        ):
+            # Check if resource already exists
+            existing = self.storage.get_resource(
+                kind=self.resource_def["kind"], api_version=storage_api_version, name=name, namespace=resource_namespace
+            )
+            if existing:
+                self._create_conflict_error(name)
+
+            # Add generated metadata
+            body["metadata"].update({
+                "uid": str(uuid.uuid4()),
+                "creationTimestamp": self._generate_timestamp(),
+                "generation": 1,
+                "labels": body["metadata"].get("labels", {}),
+                "annotations": body["metadata"].get("annotations", {}),
+            })
+
+            # Set API version and kind
+            body["apiVersion"] = storage_api_version  # Use the same full API version for body
+            body["kind"] = self.resource_def["kind"]
+
+            # Add realistic status for resources that need it
+            # Pass resource mappings from registry if available
+            resource_mappings = self._get_resource_mappings()
+
+            # Resources of kinds the cluster profile delays start as Pending, see _apply_status_transitions
+            cluster_profile = self._get_cluster_profile()
+            pending_status = None
+            if cluster_profile and self.resource_def["kind"] in cluster_profile.status_delays:
+                pending_status = get_pending_status_template(body=body, resource_mappings=resource_mappings)
+
+            add_realistic_status(body=body, resource_mappings=resource_mappings)
+            if pending_status is not None:
+                body["status"] = pending_status
+
+            # Special case: ProjectRequest is ephemeral - only creates Project (matches real cluster behavior)
+            if self.resource_def["kind"] == "ProjectRequest":
+                # Don't store ProjectRequest - it's ephemeral
+                project_body = self._create_corresponding_project(body)
+                # Generate events for the Project creation, not ProjectRequest
+                self._generate_resource_events(project_body, "Created", "created")
+                # Return Project data, not ProjectRequest (ProjectRequest is ephemeral)
+                return FakeResourceField(data=project_body)
+
+            # Store resource with initial metadata and status, storage sets its resourceVersion
+            stored = self.storage.store_resource(
+                api_version=storage_api_version,  # Use consistent API version for storage
+                kind=self.resource_def["kind"],
+                name=name,
+                namespace=self._normalize_namespace(namespace),  # Normalize namespace (empty string -> None)
+                resource=body,
+            )
+            body["metadata"]["resourceVersion"] = stored["metadata"]["resourceVersion"]
+
+            if pending_status is not None and cluster_profile:
+                cluster_profile.schedule_status_transition(
+                    transition=StatusTransition(
+                        kind=self.resource_def["kind"],
+                        api_version=storage_api_version,
+                        namespace=self._normalize_namespace(namespace),
+                        name=name,
+                        uid=stored["metadata"]["uid"],
+                    )
+                )
 
         # Generate automatic events for resource creation
-        self._generate_resource_events(body, "Created", "created")
+        self._generate_resource_events(stored, "Created", "created")
 
-        return FakeResourceField(data=body)
+        return FakeResourceField(data=stored)
 
     def _create_corresponding_project(self, project_request_body: dict[str, Any]) -> dict[str, Any]:
         """Create a corresponding Project when ProjectRequest is created (simulates real OpenShift behavior)"""
@@ -160,7 +326,6 @@ class FakeResourceInstance:
             "metadata": {
                 "name": project_name,
                 "uid": str(uuid.uuid4()),
-                "resourceVersion": self._generate_resource_version(),
                 "creationTimestamp": self._generate_timestamp(),
                 "generation": 1,
                 "labels": project_request_body["metadata"].get("labels", {}),
@@ -171,7 +336,7 @@ class FakeResourceInstance:
         }
 
         # Store the Project (cluster-scoped resource)
-        self.storage.store_resource(
+        project_body = self.storage.store_resource(
             kind="Project",
             api_version="project.openshift.io/v1",
             name=project_name,
@@ -183,7 +348,7 @@ class FakeResourceInstance:
         return project_body
 
     def _generate_resource_events(self, resource: dict[str, Any], reason: str, action: str) -> None:
-        """Generate automatic events for resource operations - completely resource-agnostic"""
+        """Generate automatic events for resource operations - completely resource-agnostic, see FakeEventRecorder"""
         if not resource or not resource.get("metadata"):
             return
 
@@ -192,11 +357,12 @@ class FakeResourceInstance:
         resource_kind = resource.get("kind")
         resource_uid = resource["metadata"].get("uid")
 
-        if not resource_name or not resource_kind:
+        event_recorder = getattr(self.client, "event_recorder", None)
+        if not resource_name or not resource_kind or not event_recorder or not event_recorder.enabled:
             return
 
         # Generate event name (Kubernetes pattern)
-        event_name = f"{resource_name}.{int(time.time() * 1000000)}"
+        event_name = f"{resource_name}.{uuid.uuid4().hex[:16]}"
 
         # Create realistic event
         event = {
@@ -206,7 +372,6 @@ class FakeResourceInstance:
                 "name": event_name,
                 "namespace": resource_namespace or "default",
                 "uid": str(uuid.uuid4()),
-                "resourceVersion": str(int(time.time() * 1000)),
                 "creationTimestamp": datetime.now(timezone.utc).isoformat(),
                 "generation": 1,
             },
@@ -227,11 +392,8 @@ class FakeResourceInstance:
             "type": "Normal",
         }
 
-        # Store the event
-        event_namespace = resource_namespace or "default"
-        self.storage.store_resource(
-            kind="Event", api_version="v1", name=event_name, namespace=event_namespace, resource=event
-        )
+        # Store the event, or count it on an identical one, according to the client event recording policy
+        event_recorder.record(storage=self.storage, event=event)
 
     def get(
         self,
@@ -242,6 +404,7 @@ class FakeResourceInstance:
         **kwargs: Any,
     ) -> FakeResourceField:
         """Get resource(s)"""
+        self._before_request(verb="get" if name else "list")
         if name:
             # Get specific resource
             namespace = self._normalize_namespace(namespace)
@@ -275,6 +438,16 @@ class FakeResourceInstance:
             "items": resources,
         }
 
+        # Paginate like the API server: the continue token is the offset of the next page
+        limit = kwargs.get("limit")
+        if limit:
+            offset = int(kwargs.get("_continue") or 0)
+            response["items"] = resources[offset : offset + limit]
+            remaining = len(resources) - offset - limit
+            if remaining > 0:
+                response["metadata"]["continue"] = str(offset + limit)
+                response["metadata"]["remainingItemCount"] = remaining
+
         return FakeResourceField(data=response)
 
     def delete(
@@ -285,14 +458,19 @@ class FakeResourceInstance:
         **kwargs: Any,
     ) -> FakeResourceField:
         """Delete resource(s)"""
+        self._before_request(verb="delete")
         if name:
             # Delete specific resource
             namespace = self._normalize_namespace(namespace)
 
             storage_api_version = self._get_storage_api_version()
-            deleted = self.storage.delete_resource(
-                kind=self.resource_def["kind"], api_version=storage_api_version, name=name, namespace=namespace
-            )
+            # Delete under the lock so a concurrent patch or replace cannot store the deleted resource again
+            with self.storage.resource_lock(
+                kind=self.resource_def["kind"], api_version=storage_api_version, namespace=namespace
+            ):
+                deleted = self.storage.delete_resource(
+                    kind=self.resource_def["kind"], api_version=storage_api_version, name=name, namespace=namespace
+                )
             if not deleted:
                 self._create_not_found_error(name)
             # Generate automatic events for resource deletion
@@ -311,50 +489,101 @@ class FakeResourceInstance:
         namespace: Union[str, None] = None,
         **kwargs: Any,
     ) -> FakeResourceField:
-        """Patch a resource"""
+        """
+        Patch a resource
+
+        The `content_type` selects the patch semantics, like the API server: JSON merge patch, strategic merge patch
+        (the dynamic client default), JSON patch or server-side apply (see `server_side_apply`).
+        """
+        self._before_request(verb="patch")
         if not body:
             raise ValueError("body is required for patch")
 
-        # Extract name from body if not provided (like real Kubernetes client)
+        content_type = kwargs.get("content_type", STRATEGIC_MERGE_PATCH)
+        if content_type == JSON_PATCH and not isinstance(body, list):
+            raise ValueError("body must be a list of operations for JSON patch")
+        if content_type == APPLY_PATCH and not kwargs.get("field_manager"):
+            raise ValueError("field_manager is required for apply")
+
+        # Extract name and namespace from body if not provided (like real Kubernetes client)
+        body_metadata = body.get("metadata", {}) if isinstance(body, dict) else {}
         if not name:
-            name = body.get("metadata", {}).get("name")
+            name = body_metadata.get("name")
             if not name:
                 raise ValueError("name is required for patch")
+        if not namespace and self.resource_def.get("namespaced"):
+            namespace = body_metadata.get("namespace")
 
         namespace = self._normalize_namespace(namespace)
 
         storage_api_version = self._get_storage_api_version()
-        existing = self.storage.get_resource(
-            kind=self.resource_def["kind"], api_version=storage_api_version, name=name, namespace=namespace
-        )
-        if not existing:
-            self._create_not_found_error(name)
-            # This line is unreachable but satisfies type checker
-            return FakeResourceField(data={})
-
-        # Simple merge patch implementation
-        patched = copy.deepcopy(existing)
-        self._merge_patch(patched, body)
-
-        # Update metadata
-        patched["metadata"]["resourceVersion"] = self._generate_resource_version()
-        if "generation" in patched["metadata"]:
-            patched["metadata"]["generation"] += 1
-
-        # Store updated resource
-        self.storage.store_resource(
-            kind=self.resource_def["kind"],
-            api_version=storage_api_version,
-            name=name,
-            namespace=namespace,
-            resource=patched,
-        )
+        # Read, merge and store under the lock so concurrent patches are not lost
+        with self.storage.resource_lock(
+            kind=self.resource_def["kind"], api_version=storage_api_version, namespace=namespace
+        ):
+            existing = self.storage.get_resource(
+                kind=self.resource_def["kind"], api_version=storage_api_version, name=name, namespace=namespace
+            )
+            if not existing:
+                if content_type == APPLY_PATCH:
+                    # Apply creates missing resources
+                    applied = self._apply_patch(
+                        name=name, existing={}, body=body, content_type=content_type, apply_options=kwargs
+                    )
+                    return self.create(body=thaw(value=applied), namespace=namespace)
+
+                self._create_not_found_error(name)
+                # This line is unreachable but satisfies type checker
+                return FakeResourceField(data={})
+
+            # A patch carrying a resourceVersion only applies to that version, like the API server precondition
+            patch_resource_version = body_metadata.get("resourceVersion")
+            if patch_resource_version and patch_resource_version != existing["metadata"]["resourceVersion"]:
+                self._create_resource_version_conflict_error(name)
+
+            # Unchanged parts are shared with the stored snapshot
+            patched = self._apply_patch(
+                name=name, existing=existing, body=body, content_type=content_type, apply_options=kwargs
+            )
+
+            # Update metadata, storage sets the resourceVersion
+            if "generation" in patched["metadata"]:
+                patched = self._merge_patch(
+                    patched, {"metadata": {"generation": patched["metadata"]["generation"] + 1}}
+                )
+
+            # Store updated resource
+            patched = self.storage.store_resource(
+                kind=self.resource_def["kind"],
+                api_version=storage_api_version,
+                name=name,
+                namespace=namespace,
+                resource=patched,
+            )
 
         # Generate automatic events for resource patch
         self._generate_resource_events(patched, "Updated", "updated")
 
         return FakeResourceField(data=patched)
 
+    def server_side_apply(
+        self,
+        body: Union[dict[str, Any], None] = None,
+        name: Union[str, None] = None,
+        namespace: Union[str, None] = None,
+        force_conflicts: Union[bool, None] = None,
+        **kwargs: Any,
+    ) -> FakeResourceField:
+        """
+        Server-side apply a resource configuration, creating the resource if it does not exist
+
+        The applied fields are owned by the `field_manager` kwarg and recorded in `metadata.managedFields`. Changing
+        a field another manager applied with a different value raises ConflictError (409) unless `force_conflicts`
+        is set, which takes the field ownership instead.
+        """
+        kwargs["content_type"] = APPLY_PATCH
+        return self.patch(name=name, body=body, namespace=namespace, force_conflicts=force_conflicts, **kwargs)
+
     def replace(
         self,
         name: Union[str, None] = None,
@@ -363,6 +592,7 @@ class FakeResourceInstance:
         **kwargs: Any,
     ) -> FakeResourceField:
         """Replace a resource"""
+        self._before_request(verb="replace")
         if not name:
             raise ValueError("name is required for replace")
         if not body:
@@ -371,61 +601,52 @@ class FakeResourceInstance:
         namespace = self._normalize_namespace(namespace)
 
         storage_api_version = self._get_storage_api_version()
-        existing = self.storage.get_resource(
-            kind=self.resource_def["kind"], api_version=storage_api_version, name=name, namespace=namespace
-        )
-        if not existing:
-            self._create_not_found_error(name)
-            # This line is unreachable but satisfies type checker
-            return FakeResourceField(data={})
-
-        # Check for resourceVersion conflict - this is what Kubernetes does
-        if "metadata" in body and "resourceVersion" in body["metadata"]:
-            if body["metadata"]["resourceVersion"] != existing["metadata"]["resourceVersion"]:
-                # Create conflict error with proper message
-                try:
-                    api_exception = K8sApiException(status=409, reason="Conflict")
-                    api_exception.body = f'{{"kind":"Status","apiVersion":"v1","metadata":{{}},"status":"Failure","message":"Operation cannot be fulfilled on {self.resource_def["kind"].lower()}s.{self.resource_def.get("group", "")} \\"{name}\\": the object has been modified; please apply your changes to the latest version and try again","reason":"Conflict","code":409}}'
-                    raise ConflictError(api_exception)
-                except (NameError, TypeError):
-                    # Use our fake ConflictError which has status attribute
-                    raise ConflictError(
-                        f"Operation cannot be fulfilled on {self.resource_def['kind']} '{name}': the object has been modified"
-                    )
-
-        # Ensure metadata is preserved
-        if "metadata" not in body:
-            body["metadata"] = {}
-
-        body["metadata"].update({
-            "uid": existing["metadata"]["uid"],
-            "resourceVersion": self._generate_resource_version(),
-            "creationTimestamp": existing["metadata"]["creationTimestamp"],
-            "generation": existing["metadata"].get("generation", 1) + 1,
-        })
-
-        # Set API version and kind
-        body["apiVersion"] = self.resource_def["api_version"]
-        body["kind"] = self.resource_def["kind"]
-
-        # Store replaced resource
-        self.storage.store_resource(
-            kind=self.resource_def["kind"],
-            api_version=storage_api_version,
-            name=name,
-            namespace=namespace,
-            resource=body,
-        )
+        # Compare resourceVersion and store under the lock, making replace an atomic compare-and-swap
+        with self.storage.resource_lock(
+            kind=self.resource_def["kind"], api_version=storage_api_version, namespace=namespace
+        ):
+            existing = self.storage.get_resource(
+                kind=self.resource_def["kind"], api_version=storage_api_version, name=name, namespace=namespace
+            )
+            if not existing:
+                self._create_not_found_error(name)
+                # This line is unreachable but satisfies type checker
+                return FakeResourceField(data={})
+
+            # Check for resourceVersion conflict - this is what Kubernetes does
+            if "metadata" in body and "resourceVersion" in body["metadata"]:
+                if body["metadata"]["resourceVersion"] != existing["metadata"]["resourceVersion"]:
+                    self._create_resource_version_conflict_error(name)
+
+            # Ensure metadata is preserved
+            if "metadata" not in body:
+                body["metadata"] = {}
+
+            body["metadata"].update({
+                "uid": existing["metadata"]["uid"],
+                "creationTimestamp": existing["metadata"]["creationTimestamp"],
+                "generation": existing["metadata"].get("generation", 1) + 1,
+            })
+
+            # Set API version and kind
+            body["apiVersion"] = self.resource_def["api_version"]
+            body["kind"] = self.resource_def["kind"]
+
+            # Store replaced resource
+            stored = self.storage.store_resource(
+                kind=self.resource_def["kind"],
+                api_version=storage_api_version,
+                name=name,
+                namespace=namespace,
+                resource=body,
+            )
+            body["metadata"]["resourceVersion"] = stored["metadata"]["resourceVersion"]
 
         # Generate automatic events for resource replacement
-        self._generate_resource_events(body, "Updated", "replaced")
+        self._generate_resource_events(stored, "Updated", "replaced")
 
         # Return the stored resource (which has the updated metadata)
-        return FakeResourceField(
-            data=self.storage.get_resource(
-                kind=self.resource_def["kind"], api_version=storage_api_version, name=name, namespace=namespace
-            )
-        )
+        return FakeResourceField(data=stored)
 
     def update(
         self,
@@ -438,32 +659,127 @@ class FakeResourceInstance:
         return self.replace(name=name, body=body, namespace=namespace, **kwargs)
 
     def watch(
-        self, namespace: Union[str, None] = None, timeout: Union[int, None] = None, **kwargs: Any
+        self,
+        namespace: Union[str, None] = None,
+        timeout: Union[int, None] = None,
+        resource_version: Union[str, None] = None,
+        **kwargs: Any,
     ) -> Iterator[dict[str, Any]]:
-        """Watch for resource changes"""
-        # Simple implementation - yields existing resources as ADDED events
-        storage_api_version = self.resource_def.get("group_version", self.resource_def["api_version"])
+        """
+        Watch for resource changes
+
+        Without a resource_version the existing resources are yielded as ADDED events first. The watch then streams
+        the changes newer than the resource version until `timeout` seconds pass, without a timeout it stops once
+        there are no more changes. A resource version already compacted out of the storage event journal raises
+        GoneError (410), like the API server.
+        """
+        self._before_request(verb="watch")
+        storage_api_version = self._get_storage_api_version()
+        namespace = self._normalize_namespace(namespace)
+        cluster_profile = self._get_cluster_profile()
 
-        # Extract label and field selectors from kwargs
+        # Extract name, label and field selectors from kwargs
+        name = kwargs.get("name")
         label_selector = kwargs.get("label_selector")
         field_selector = kwargs.get("field_selector")
+        if name:
+            field_selector = f"metadata.name={name},{field_selector}" if field_selector else f"metadata.name={name}"
+
+        deadline = time.monotonic() + timeout if timeout else None
+
+        if not resource_version or resource_version == "0":
+            # Read the resource version first, changes racing with the list are streamed again rather than lost
+            last_resource_version = self.storage.resource_version
+            resources = self.storage.list_resources(
+                kind=self.resource_def["kind"],
+                api_version=storage_api_version,
+                namespace=namespace,
+                label_selector=label_selector,
+                field_selector=field_selector,
+            )
 
-        resources = self.storage.list_resources(
-            kind=self.resource_def["kind"],
-            api_version=storage_api_version,
-            namespace=self._normalize_namespace(namespace),  # Normalize namespace here too
-            label_selector=label_selector,
-            field_selector=field_selector,
-        )
-
-        for resource in resources:
-            yield {"type": "ADDED", "object": FakeResourceField(data=resource), "raw_object": resource}
-
-    def _merge_patch(self, target: dict[str, Any], patch: dict[str, Any]) -> None:
-        """Simple merge patch implementation"""
+            for resource in resources:
+                yield {"type": "ADDED", "object": FakeResourceField(data=resource), "raw_object": resource}
+        else:
+            last_resource_version = int(resource_version)
+
+        while True:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return
+
+            wait = remaining
+            if cluster_profile is not None:
+                # Wake up for delayed status transitions, they are stored by the requests that see them due
+                self._apply_status_transitions(cluster_profile=cluster_profile)
+                next_transition = cluster_profile.next_transition_in()
+                # Without a deadline the watch does not wait, for changes nor for transitions
+                if next_transition is not None and remaining is not None:
+                    wait = min(remaining, next_transition)
+
+            events = self.storage.get_events(resource_version=last_resource_version, timeout=wait)
+            if events is None:
+                self._create_gone_error(resource_version=last_resource_version)
+                return
+
+            if not events:
+                if deadline is None:
+                    return
+                continue
+
+            for event in events:
+                last_resource_version = event["resourceVersion"]
+                if (
+                    event["kind"] != self.resource_def["kind"]
+                    or event["api_version"] != storage_api_version
+                    or (namespace is not None and event["namespace"] != namespace)
+                ):
+                    continue
+
+                resource = event["object"]
+                if not self.storage.matches_selectors(
+                    resource=resource, label_selector=label_selector, field_selector=field_selector
+                ):
+                    continue
+
+                yield {"type": event["type"], "object": FakeResourceField(data=resource), "raw_object": resource}
+
+    def _apply_patch(
+        self, name: str, existing: dict[str, Any], body: Any, content_type: str, apply_options: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Apply a patch body with the semantics of its content type, returns a new resource"""
+        try:
+            if content_type == JSON_PATCH:
+                patched = apply_json_patch(target=existing, operations=body)
+            elif content_type == MERGE_PATCH:
+                patched = apply_merge_patch(target=existing, patch=body)
+            elif content_type == APPLY_PATCH:
+                patched = server_side_apply(
+                    target=existing,
+                    configuration=body,
+                    field_manager=apply_options["field_manager"],
+                    force=bool(apply_options.get("force_conflicts")),
+                    timestamp=self._generate_timestamp(),
+                )
+            else:
+                patched = apply_strategic_merge_patch(target=existing, patch=body)
+
+            # e.g. a JSON patch removing /metadata, the API server rejects the result like any invalid object
+            metadata = patched.get("metadata") if isinstance(patched, Mapping) else None
+            if not isinstance(metadata, Mapping) or not metadata.get("name"):
+                raise ValueError("metadata.name: Required value: name is required")
+
+            return patched
+        except ApplyConflictError as exp:
+            self._create_apply_conflict_error(error=exp)
+        except ValueError as exp:
+            self._create_unprocessable_error(name=name, message=str(exp))
+
+        # This line is unreachable but satisfies type checker
+        return existing
+
+    def _merge_patch(self, target: dict[str, Any], patch: dict[str, Any]) -> dict[str, Any]:
+        """Simple merge patch implementation, returns a new resource and leaves `target` unchanged"""
         if isinstance(patch, dict):
-            for key, value in patch.items():
-                if key in target and isinstance(target[key], dict) and isinstance(value, dict):
-                    self._merge_patch(target[key], value)
-                else:
-                    target[key] = value
+            return merge_patch(target=target, patch=patch)
+        return target
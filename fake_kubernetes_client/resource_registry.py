@@ -1,7 +1,9 @@
 """FakeResourceRegistry implementation for fake Kubernetes client"""
 
 import logging
+import threading
 from collections import defaultdict
+from collections.abc import Iterator, Mapping
 from typing import Any, DefaultDict, Union
 
 from fake_kubernetes_client.resource_field import FakeResourceField
@@ -9,203 +11,251 @@ from ocp_resources.utils.schema_validator import SchemaValidator
 
 logger = logging.getLogger(__name__)
 
+# Known corrections for incorrect data in the JSON file
+KNOWN_CORRECTIONS: dict[str, dict[str, Any]] = {
+    # Service is incorrectly marked as non-namespaced in the JSON
+    "Service": {"namespaced": True},
+    # Event is incorrectly marked as non-namespaced in the JSON
+    "Event": {"namespaced": True},
+    # Add other known corrections here as needed
+}
+
+# Additional resources that are not in OpenShift schema
+ADDITIONAL_RESOURCES: tuple[dict[str, Any], ...] = (
+    # MTQ resources (not in OpenShift schema)
+    {
+        "kind": "MigrationToolkitQuota",
+        "api_version": "v1alpha1",
+        "group": "mtq.kubevirt.io",
+        "version": "v1alpha1",
+        "group_version": "mtq.kubevirt.io/v1alpha1",
+        "plural": "migrationtoolkitquotas",
+        "singular": "migrationtoolkitquota",
+        "namespaced": False,
+        "shortNames": ["mtq"],
+        "categories": ["all"],
+        "schema_source": "additional",
+    },
+    {
+        "kind": "MTQ",
+        "api_version": "v1alpha1",
+        "group": "mtq.kubevirt.io",
+        "version": "v1alpha1",
+        "group_version": "mtq.kubevirt.io/v1alpha1",
+        "plural": "mtqs",
+        "singular": "mtq",
+        "namespaced": False,
+        "shortNames": [],
+        "categories": ["all"],
+        "schema_source": "additional",
+    },
+    {
+        "kind": "Service",
+        "api_version": "v1",
+        "group": "serving.knative.dev",
+        "version": "v1",
+        "group_version": "serving.knative.dev/v1",
+        "plural": "services",
+        "singular": "service",
+        "namespaced": True,
+        "shortNames": ["ksvc"],
+        "categories": ["all"],
+        "schema_source": "additional",
+    },
+    {
+        "kind": "PodMetrics",
+        "api_version": "v1beta1",
+        "group": "metrics.k8s.io",
+        "version": "v1beta1",
+        "group_version": "metrics.k8s.io/v1beta1",
+        "plural": "podmetrics",
+        "singular": "podmetrics",
+        "namespaced": True,
+        "shortNames": [],
+        "categories": ["all"],
+        "schema_source": "additional",
+    },
+    {
+        "kind": "Image",
+        "api_version": "v1alpha1",
+        "group": "caching.internal.knative.dev",
+        "version": "v1alpha1",
+        "group_version": "caching.internal.knative.dev/v1alpha1",
+        "plural": "images",
+        "singular": "image",
+        "namespaced": True,
+        "shortNames": [],
+        "categories": ["all"],
+        "schema_source": "additional",
+    },
+)
+
+
+def generate_plural_form(kind: str) -> str:
+    """Generate plural form of resource kind using standard Kubernetes rules"""
+    kind_lower = kind.lower()
+    if kind_lower.endswith("s"):
+        return kind_lower
+    elif kind_lower.endswith("y"):
+        return kind_lower[:-1] + "ies"
+    elif kind_lower.endswith(("sh", "ch", "x", "z")):
+        return kind_lower + "es"
+    else:
+        return kind_lower + "s"
+
+
+class BuiltinResourceDefinitions:
+    """
+    Resource definitions parsed from the mappings file, shared by all registries.
+
+    Definitions are built per kind on first lookup. They are shared between fake clients and must not be modified.
+    """
+
+    _lock = threading.Lock()
+    # Mappings the definitions were built from; rebuilt when SchemaValidator loads other mappings
+    _source: Union[Mapping[str, Any], None] = None
+    _definitions: dict[str, list[dict[str, Any]]] = {}
+    _loaded_kinds: set[str] = set()
+    _fully_loaded: bool = False
+
+    @classmethod
+    def _get_source(cls) -> Union[Mapping[str, Any], None]:
+        """Get the mappings, dropping definitions built from previously loaded mappings (caller holds the lock)"""
+        source = SchemaValidator.get_mappings_source()
+        if source is not cls._source:
+            cls._source = source
+            cls._definitions = {}
+            cls._loaded_kinds = set()
+            cls._fully_loaded = False
+
+        return source
+
+    @classmethod
+    def _load_kind(cls, kind_lower: str, resource_mappings: Any) -> None:
+        """Build the definitions of a single mappings entry (caller holds the lock)"""
+        cls._loaded_kinds.add(kind_lower)
+        if not isinstance(resource_mappings, list) or not resource_mappings:
+            return
+
+        # Process all mappings for this kind (there might be multiple API groups)
+        for mapping in resource_mappings:
+            # Extract kubernetes metadata from x-kubernetes-group-version-kind
+            k8s_gvk = mapping.get("x-kubernetes-group-version-kind", [])
+            if not k8s_gvk or not isinstance(k8s_gvk, list):
+                continue
+
+            # Process each group-version-kind entry
+            for gvk in k8s_gvk:
+                schema_group = gvk.get("group", "")
+                schema_version = gvk.get("version")
+                schema_kind = gvk.get("kind", kind_lower.title())
+
+                # Skip if no version found in mappings
+                if not schema_version:
+                    continue
+
+                # Build full API version
+                if schema_group:
+                    full_api_version = f"{schema_group}/{schema_version}"
+                else:
+                    full_api_version = schema_version
+
+                # Get namespace info from mappings
+                is_namespaced = mapping.get("namespaced")
+                if is_namespaced is None:
+                    continue
+
+                resource_def = {
+                    "kind": schema_kind,
+                    "api_version": schema_version,  # Just version part for KubeAPIVersion compatibility
+                    "group": schema_group,
+                    "version": schema_version,
+                    "group_version": full_api_version,  # Full group/version for storage operations
+                    "plural": generate_plural_form(schema_kind),
+                    "singular": schema_kind.lower(),
+                    "namespaced": is_namespaced,
+                    "shortNames": [],
+                    "categories": ["all"],
+                    "schema_source": "mappings",
+                }
+
+                # Apply known corrections
+                resource_def.update(KNOWN_CORRECTIONS.get(schema_kind, {}))
+                cls._definitions.setdefault(schema_kind, []).append(resource_def)
+
+    @classmethod
+    def get_kind(cls, kind: str) -> list[dict[str, Any]]:
+        """Get the definitions of a kind, building them on first lookup"""
+        with cls._lock:
+            source = cls._get_source()
+            kind_lower = kind.lower()
+            if source and not cls._fully_loaded and kind_lower not in cls._loaded_kinds:
+                cls._load_kind(kind_lower=kind_lower, resource_mappings=source.get(kind_lower))
+
+            return cls._definitions.get(kind, [])
+
+    @classmethod
+    def get_all(cls) -> dict[str, list[dict[str, Any]]]:
+        """Get the definitions of all kinds, building the ones not looked up yet"""
+        with cls._lock:
+            source = cls._get_source()
+            if source and not cls._fully_loaded:
+                for kind_lower in source:
+                    if kind_lower not in cls._loaded_kinds:
+                        cls._load_kind(kind_lower=kind_lower, resource_mappings=source[kind_lower])
+
+                cls._fully_loaded = True
+
+            return cls._definitions
+
 
 class FakeResourceRegistry:
     """Registry for resource definitions"""
 
     def __init__(self) -> None:
-        # Store by kind to allow searching across API groups
-        self.resources: DefaultDict[str, list[dict[str, Any]]] = defaultdict(list)
-        self._resource_mappings_cache: Union[dict[str, Any], None] = None
-        self._builtin_resources: dict[tuple[str, str], dict[str, Any]] = {}
-        self._additional_resources: dict[str, list[dict[str, Any]]] = {}
-        self._load_resource_definitions()
+        # Definitions from the mappings file are shared by all registries and built lazily per kind,
+        # only additional and user registered resources are kept per registry
+        self._additional_resources: DefaultDict[str, list[dict[str, Any]]] = defaultdict(list)
         self._register_additional_resources()
 
-    def _generate_plural_form(self, kind: str) -> str:
-        """Generate plural form of resource kind using standard Kubernetes rules"""
-        kind_lower = kind.lower()
-        if kind_lower.endswith("s"):
-            return kind_lower
-        elif kind_lower.endswith("y"):
-            return kind_lower[:-1] + "ies"
-        elif kind_lower.endswith(("sh", "ch", "x", "z")):
-            return kind_lower + "es"
-        else:
-            return kind_lower + "s"
-
-    def _get_resource_mappings(self) -> dict[str, Any]:
-        """Load and cache the resource mappings file using SchemaValidator"""
-        if self._resource_mappings_cache is None:
-            # Use SchemaValidator to load the mappings - single source of truth
-            if SchemaValidator.load_mappings_data():
-                self._resource_mappings_cache = SchemaValidator.get_mappings_data() or {}
-                logger.debug(f"Loaded {len(self._resource_mappings_cache)} resource mappings from SchemaValidator")
-            else:
-                logger.error("Failed to load resource mappings from SchemaValidator")
-                self._resource_mappings_cache = {}
-
-        return self._resource_mappings_cache
-
-    def _apply_known_corrections(self, kind: str, resource_def: dict[str, Any]) -> dict[str, Any]:
-        """Apply known corrections to resource definitions"""
-        # Known corrections for incorrect data in the JSON file
-        corrections = {
-            # Service is incorrectly marked as non-namespaced in the JSON
-            "Service": {"namespaced": True},
-            # Event is incorrectly marked as non-namespaced in the JSON
-            "Event": {"namespaced": True},
-            # Add other known corrections here as needed
+    @property
+    def resources(self) -> dict[str, list[dict[str, Any]]]:
+        """All resource definitions by kind"""
+        resources: dict[str, list[dict[str, Any]]] = {
+            kind: list(definitions) for kind, definitions in BuiltinResourceDefinitions.get_all().items()
         }
+        for kind, definitions in self._additional_resources.items():
+            resources.setdefault(kind, []).extend(definitions)
 
-        if kind in corrections:
-            resource_def.update(corrections[kind])
-
-        return resource_def
-
-    def _load_resource_definitions(self) -> None:
-        """Load resource definitions from JSON file - single source of truth"""
-        mappings = self._get_resource_mappings()
-        if not mappings:
-            # If no mappings file found, registry will be empty
-            # This will cause proper errors when resources are requested
-            return
-
-        for kind_lower, resource_mappings in mappings.items():
-            if not isinstance(resource_mappings, list) or not resource_mappings:
-                continue
-
-            # Process all mappings for this kind (there might be multiple API groups)
-            for mapping in resource_mappings:
-                # Extract kubernetes metadata from x-kubernetes-group-version-kind
-                k8s_gvk = mapping.get("x-kubernetes-group-version-kind", [])
-                if not k8s_gvk or not isinstance(k8s_gvk, list) or not k8s_gvk:
-                    continue
+        return resources
 
-                # Process each group-version-kind entry
-                for gvk in k8s_gvk:
-                    schema_group = gvk.get("group", "")
-                    schema_version = gvk.get("version")
-                    schema_kind = gvk.get("kind", kind_lower.title())
+    def _iter_definitions(self) -> Iterator[tuple[str, list[dict[str, Any]]]]:
+        """Iterate over the definitions of all kinds without merging them"""
+        yield from BuiltinResourceDefinitions.get_all().items()
+        yield from self._additional_resources.items()
 
-                    # Skip if no version found in mappings
-                    if not schema_version:
-                        continue
+    def _generate_plural_form(self, kind: str) -> str:
+        """Generate plural form of resource kind using standard Kubernetes rules"""
+        return generate_plural_form(kind)
 
-                    # Build full API version
-                    if schema_group:
-                        full_api_version = f"{schema_group}/{schema_version}"
-                    else:
-                        full_api_version = schema_version
+    def _get_resource_mappings(self) -> Mapping[str, Any]:
+        """
+        Get the resource mappings from SchemaValidator, which caches them.
 
-                    # Get namespace info from mappings
-                    is_namespaced = mapping.get("namespaced")
-                    if is_namespaced is None:
-                        continue
+        The mappings are read one kind at a time from the index when available, the whole mappings file is not loaded.
+        """
+        # Use SchemaValidator to load the mappings - single source of truth
+        source = SchemaValidator.get_mappings_source()
+        if source is not None:
+            return source
 
-                    # Generate plural form
-                    plural = self._generate_plural_form(schema_kind)
-
-                    resource_def = {
-                        "kind": schema_kind,
-                        "api_version": schema_version,  # Just version part for KubeAPIVersion compatibility
-                        "group": schema_group,
-                        "version": schema_version,
-                        "group_version": full_api_version,  # Full group/version for storage operations
-                        "plural": plural,
-                        "singular": schema_kind.lower(),
-                        "namespaced": is_namespaced,
-                        "shortNames": [],
-                        "categories": ["all"],
-                        "schema_source": "mappings",
-                    }
-
-                    # Apply known corrections
-                    resource_def = self._apply_known_corrections(schema_kind, resource_def)
-
-                    # Store in both places for compatibility
-                    self.resources[schema_kind].append(resource_def)
-                    key = (full_api_version, schema_kind)
-                    self._builtin_resources[key] = resource_def
+        logger.error("Failed to load resource mappings from SchemaValidator")
+        return {}
 
     def _register_additional_resources(self) -> None:
         """Register additional resources that are not in OpenShift schema"""
-        # MTQ resources (not in OpenShift schema)
-        additional_resources = [
-            {
-                "kind": "MigrationToolkitQuota",
-                "api_version": "v1alpha1",
-                "group": "mtq.kubevirt.io",
-                "version": "v1alpha1",
-                "group_version": "mtq.kubevirt.io/v1alpha1",
-                "plural": "migrationtoolkitquotas",
-                "singular": "migrationtoolkitquota",
-                "namespaced": False,
-                "shortNames": ["mtq"],
-                "categories": ["all"],
-                "schema_source": "additional",
-            },
-            {
-                "kind": "MTQ",
-                "api_version": "v1alpha1",
-                "group": "mtq.kubevirt.io",
-                "version": "v1alpha1",
-                "group_version": "mtq.kubevirt.io/v1alpha1",
-                "plural": "mtqs",
-                "singular": "mtq",
-                "namespaced": False,
-                "shortNames": [],
-                "categories": ["all"],
-                "schema_source": "additional",
-            },
-            {
-                "kind": "Service",
-                "api_version": "v1",
-                "group": "serving.knative.dev",
-                "version": "v1",
-                "group_version": "serving.knative.dev/v1",
-                "plural": "services",
-                "singular": "service",
-                "namespaced": True,
-                "shortNames": ["ksvc"],
-                "categories": ["all"],
-                "schema_source": "additional",
-            },
-            {
-                "kind": "PodMetrics",
-                "api_version": "v1beta1",
-                "group": "metrics.k8s.io",
-                "version": "v1beta1",
-                "group_version": "metrics.k8s.io/v1beta1",
-                "plural": "podmetrics",
-                "singular": "podmetrics",
-                "namespaced": True,
-                "shortNames": [],
-                "categories": ["all"],
-                "schema_source": "additional",
-            },
-            {
-                "kind": "Image",
-                "api_version": "v1alpha1",
-                "group": "caching.internal.knative.dev",
-                "version": "v1alpha1",
-                "group_version": "caching.internal.knative.dev/v1alpha1",
-                "plural": "images",
-                "singular": "image",
-                "namespaced": True,
-                "shortNames": [],
-                "categories": ["all"],
-                "schema_source": "additional",
-            },
-        ]
-
-        for resource_def in additional_resources:
-            kind = str(resource_def["kind"])
-            group_version = str(resource_def["group_version"])
-            self.resources[kind].append(resource_def)
-            key = (group_version, kind)
-            self._builtin_resources[key] = resource_def
-            self._additional_resources.setdefault(kind, []).append(resource_def)
+        for resource_def in ADDITIONAL_RESOURCES:
+            self._additional_resources[str(resource_def["kind"])].append(resource_def)
 
     def register_resources(self, resources: Union[dict[str, Any], list[dict[str, Any]]]) -> None:
         """
@@ -284,10 +334,16 @@ class FakeResourceRegistry:
             }
 
             # Register the resource
-            self.resources[kind].append(complete_def)
-            key = (str(group_version), str(kind))
-            self._builtin_resources[key] = complete_def
-            self._additional_resources.setdefault(kind, []).append(complete_def)
+            self._additional_resources[kind].append(complete_def)
+
+    def get_registered_resources(self) -> list[dict[str, Any]]:
+        """Get the resource definitions added with `register_resources`"""
+        return [
+            definition
+            for definitions in self._additional_resources.values()
+            for definition in definitions
+            if definition.get("schema_source") == "user_defined"
+        ]
 
     def search(
         self,
@@ -301,17 +357,14 @@ class FakeResourceRegistry:
 
         # If searching by kind and group, look for that specific combination
         if kind and group is not None:
-            definitions = self.resources.get(kind, [])
+            definitions = self.get_resource_definitions(kind=kind)
             for definition in definitions:
                 if definition.get("group") == group:
                     results.append(FakeResourceField(data=definition))
         else:
             # General search through all resources
-            for resource_kind, definitions in self.resources.items():
-                # Filter by kind if specified
-                if kind and resource_kind != kind:
-                    continue
-
+            resources = [(kind, self.get_resource_definitions(kind=kind))] if kind else self._iter_definitions()
+            for _, definitions in resources:
                 for definition in definitions:
                     # Filter by group if specified
                     if group and definition.get("group") != group:
@@ -326,11 +379,11 @@ class FakeResourceRegistry:
 
     def get_resource_definitions(self, kind: str) -> list[dict[str, Any]]:
         """Get all resource definitions for a kind"""
-        return self.resources.get(kind, [])
+        return [*BuiltinResourceDefinitions.get_kind(kind=kind), *self._additional_resources.get(kind, [])]
 
     def get_resource_definition(self, kind: str, api_version: str) -> Union[dict[str, Any], None]:
         """Get specific resource definition by kind and API version"""
-        definitions = self.resources.get(kind, [])
+        definitions = self.get_resource_definitions(kind=kind)
 
         # If api_version doesn't contain '/', it's a core resource (no group)
         if "/" not in api_version:
@@ -353,7 +406,7 @@ class FakeResourceRegistry:
 
     def get_resource_definition_by_plural(self, plural: str, api_version: str) -> Union[dict[str, Any], None]:
         """Get resource definition by plural name and API version"""
-        for kind, definitions in self.resources.items():
+        for kind, definitions in self._iter_definitions():
             for definition in definitions:
                 if definition.get("plural") == plural and (
                     definition["api_version"] == api_version or definition.get("group_version") == api_version
@@ -364,7 +417,7 @@ class FakeResourceRegistry:
     def list_api_resources(self, api_version: str) -> FakeResourceField:
         """List all resources for an API version"""
         resources = []
-        for kind, definitions in self.resources.items():
+        for kind, definitions in self._iter_definitions():
             for definition in definitions:
                 # Check both api_version and group_version
                 if definition["api_version"] == api_version or definition.get("group_version") == api_version:
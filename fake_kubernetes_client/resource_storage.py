@@ -1,29 +1,260 @@
 """FakeResourceStorage implementation for fake Kubernetes client"""
 
-import copy
-from collections import defaultdict
-from typing import Any, DefaultDict, Union
+import itertools
+import threading
+from collections import defaultdict, deque
+from collections.abc import Mapping
+from typing import Any, DefaultDict, NoReturn, Union
+
+from fake_kubernetes_client.selectors import (
+    EXISTS,
+    IN,
+    FieldRequirement,
+    LabelRequirement,
+    matches_labels,
+    parse_field_selector,
+    parse_label_selector,
+)
+
+# Number of watch events kept in the journal before the oldest ones are compacted
+DEFAULT_EVENT_JOURNAL_SIZE: int = 1000
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict holding a stored resource snapshot.
+
+    Snapshots are returned to callers without copying and share unchanged subtrees between resource versions,
+    so they must never be modified. `copy.copy` and `copy.deepcopy` return mutable plain dicts.
+    """
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(f"'{type(self).__name__}' object is immutable, use a copy to modify it")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __copy__(self) -> dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[str, Any]:
+        return thaw(value=self)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return dict, (thaw(value=self),)
+
+
+class FrozenList(list):
+    """Read-only list holding part of a stored resource snapshot, see `FrozenDict`"""
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(f"'{type(self).__name__}' object is immutable, use a copy to modify it")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = clear = extend = insert = pop = remove = reverse = sort = _immutable
+
+    def __copy__(self) -> list[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> list[Any]:
+        return thaw(value=self)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return list, (thaw(value=self),)
+
+
+def freeze(value: Any) -> Any:
+    """
+    Get a read-only snapshot of a value.
+
+    Already frozen subtrees are reused as is, so only the parts that changed since the last snapshot are copied.
+    """
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(value=item)) for key, item in value.items())
+
+    if isinstance(value, (list, tuple)):
+        return FrozenList(freeze(value=item) for item in value)
+
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Get a mutable deep copy of a value"""
+    if isinstance(value, dict):
+        return {key: thaw(value=item) for key, item in value.items()}
+
+    if isinstance(value, list):
+        return [thaw(value=item) for item in value]
+
+    return value
+
+
+def merge_patch(target: dict[str, Any], patch: dict[str, Any]) -> dict[str, Any]:
+    """
+    Merge a patch into a resource without modifying either of them.
+
+    Only the dicts along the patched paths are copied, the rest of the result is shared with `target`.
+    """
+    merged = dict(target)
+    for key, value in patch.items():
+        if isinstance(merged.get(key), dict) and isinstance(value, dict):
+            merged[key] = merge_patch(target=merged[key], patch=value)
+        else:
+            merged[key] = value
+
+    return merged
 
 
 class FakeResourceStorage:
-    """In-memory storage for Kubernetes resources"""
+    """
+    In-memory storage for Kubernetes resources
+
+    Resources are kept as frozen snapshots (see `FrozenDict`) which are returned without copying.
 
-    def __init__(self) -> None:
+    The storage is thread-safe: writes and listing take a short storage-wide lock, and `resource_lock` gives a lock
+    per kind and namespace for read-modify-write operations such as compare-and-swap on resourceVersion.
+    """
+
+    def __init__(self, event_journal_size: int = DEFAULT_EVENT_JOURNAL_SIZE) -> None:
         # Storage structure: {api_version: {kind: {namespace: {name: resource}}}}
         self.resources: DefaultDict[str, DefaultDict[str, DefaultDict[Union[str, None], dict[str, Any]]]] = defaultdict(
             lambda: defaultdict(lambda: defaultdict(dict))
         )
+        # Every write gets the next resourceVersion and adds one event to the journal,
+        # so the journal holds the events of resourceVersions compacted_resource_version+1 .. resource_version
+        self.resource_version: int = 0
+        self.compacted_resource_version: int = 0
+        self._events: deque[dict[str, Any]] = deque(maxlen=event_journal_size)
+        self._lock = threading.RLock()
+        self._events_condition = threading.Condition(self._lock)
+        self._resource_locks: dict[tuple[str, str, Union[str, None]], threading.RLock] = {}
+        # Inverted label index: {(api_version, kind): {label key: {label value: {(namespace, name): None}}}}
+        self._label_index: DefaultDict[
+            tuple[str, str], DefaultDict[str, DefaultDict[str, dict[tuple[Union[str, None], str], None]]]
+        ] = defaultdict(lambda: defaultdict(lambda: defaultdict(dict)))
+
+    def resource_lock(self, kind: str, api_version: str, namespace: Union[str, None]) -> threading.RLock:
+        """Get the lock serializing read-modify-write operations on the resources of a kind in a namespace"""
+        key = (api_version, kind, namespace)
+        with self._lock:
+            return self._resource_locks.setdefault(key, threading.RLock())
+
+    def _update_label_index(
+        self,
+        kind: str,
+        api_version: str,
+        name: str,
+        namespace: Union[str, None],
+        old_resource: Union[dict[str, Any], None],
+        new_resource: Union[dict[str, Any], None],
+    ) -> None:
+        """Move a resource between label index entries when its labels change (caller holds the lock)"""
+        old_labels = (old_resource or {}).get("metadata", {}).get("labels") or {}
+        new_labels = (new_resource or {}).get("metadata", {}).get("labels") or {}
+        if old_labels == new_labels:
+            return
+
+        key_index = self._label_index[(api_version, kind)]
+        resource_key = (namespace, name)
+        for label_key, label_value in old_labels.items():
+            if new_labels.get(label_key) == label_value:
+                continue
+
+            value_index = key_index[label_key]
+            value_index[label_value].pop(resource_key, None)
+            if not value_index[label_value]:
+                del value_index[label_value]
+                if not value_index:
+                    del key_index[label_key]
+
+        for label_key, label_value in new_labels.items():
+            if old_labels.get(label_key) != label_value:
+                key_index[label_key][label_value][resource_key] = None
+
+    def _record_event(
+        self, event_type: str, kind: str, api_version: str, namespace: Union[str, None], resource: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Stamp a resource with the next resourceVersion and add its event to the journal (caller holds the lock)"""
+        self.resource_version += 1
+        if isinstance(resource.get("metadata"), dict):
+            resource = merge_patch(target=resource, patch={"metadata": {"resourceVersion": str(self.resource_version)}})
+
+        snapshot = freeze(value=resource)
+        if len(self._events) == self._events.maxlen:
+            self.compacted_resource_version = self._events[0]["resourceVersion"]
+
+        self._events.append({
+            "resourceVersion": self.resource_version,
+            "type": event_type,
+            "kind": kind,
+            "api_version": api_version,
+            "namespace": namespace,
+            "object": snapshot,
+        })
+        self._events_condition.notify_all()
+        return snapshot
 
     def store_resource(
         self, kind: str, api_version: str, name: str, namespace: Union[str, None], resource: dict[str, Any]
-    ) -> None:
-        """Store a resource"""
-        self.resources[api_version][kind][namespace][name] = copy.deepcopy(resource)
+    ) -> dict[str, Any]:
+        """
+        Store a snapshot of a resource, later changes to `resource` are not reflected in storage.
+
+        Returns:
+            dict[str, Any]: The stored snapshot, with the new metadata.resourceVersion.
+        """
+        with self._events_condition:
+            namespace_resources = self.resources[api_version][kind][namespace]
+            existing = namespace_resources.get(name)
+            snapshot = self._record_event(
+                event_type="MODIFIED" if existing is not None else "ADDED",
+                kind=kind,
+                api_version=api_version,
+                namespace=namespace,
+                resource=resource,
+            )
+            namespace_resources[name] = snapshot
+            self._update_label_index(
+                kind=kind,
+                api_version=api_version,
+                name=name,
+                namespace=namespace,
+                old_resource=existing,
+                new_resource=snapshot,
+            )
+
+        return snapshot
+
+    def get_events(
+        self, resource_version: int, timeout: Union[float, None] = None
+    ) -> Union[list[dict[str, Any]], None]:
+        """
+        Get the journal events that happened after a resourceVersion.
+
+        Args:
+            resource_version (int): Last resourceVersion seen by the caller.
+            timeout (float | None): Seconds to wait for a new event if there is none yet, do not wait if not set.
+
+        Returns:
+            list[dict[str, Any]] | None: Events in resourceVersion order, None if some of the requested events
+                were already compacted out of the journal.
+        """
+        with self._events_condition:
+            if timeout:
+                self._events_condition.wait_for(lambda: self.resource_version > resource_version, timeout=timeout)
+
+            if resource_version < self.compacted_resource_version:
+                return None
+
+            return list(itertools.islice(self._events, resource_version - self.compacted_resource_version, None))
 
     def get_resource(
         self, kind: str, api_version: str, name: str, namespace: Union[str, None]
     ) -> Union[dict[str, Any], None]:
-        """Get a specific resource"""
+        """Get a specific resource snapshot"""
         api_resources = self.resources.get(api_version)
         if not api_resources:
             return None
@@ -34,7 +265,7 @@ class FakeResourceStorage:
         if not namespace_resources:
             return None
         resource = namespace_resources.get(name)
-        return copy.deepcopy(resource) if resource else None
+        return resource or None
 
     def list_resources(
         self,
@@ -44,105 +275,188 @@ class FakeResourceStorage:
         label_selector: Union[str, None] = None,
         field_selector: Union[str, None] = None,
     ) -> list[dict[str, Any]]:
-        """List resources with optional filtering"""
+        """
+        List resource snapshots with optional filtering
+
+        Selective label and metadata.name selectors are served from indexes, so they cost O(matches).
+
+        Raises:
+            ValueError: If a selector is not valid.
+        """
+        label_requirements = parse_label_selector(label_selector) if label_selector else ()
+        field_requirements = parse_field_selector(field_selector) if field_selector else ()
         resources: list[dict[str, Any]] = []
 
-        api_resources = self.resources.get(api_version)
-        if not api_resources:
-            return resources
+        # Collect under the lock, other threads may be adding resources; filter the snapshots outside of it
+        with self._lock:
+            api_resources = self.resources.get(api_version)
+            if not api_resources:
+                return resources
 
-        kind_resources = api_resources.get(kind)
-        if not kind_resources:
-            return resources
+            kind_resources = api_resources.get(kind)
+            if not kind_resources:
+                return resources
 
-        if namespace is not None:
-            # List resources in specific namespace
-            namespace_resources = kind_resources.get(namespace, {})
-            resources = list(namespace_resources.values())
-        else:
-            # List resources across all namespaces
-            for ns_resources in kind_resources.values():
-                resources.extend(ns_resources.values())
+            candidate_keys = self._get_candidate_keys(
+                kind=kind,
+                api_version=api_version,
+                namespace=namespace,
+                namespaces=list(kind_resources),
+                label_requirements=label_requirements,
+                field_requirements=field_requirements,
+            )
+            if candidate_keys is not None:
+                for resource_namespace, name in candidate_keys:
+                    if namespace is not None and resource_namespace != namespace:
+                        continue
+                    resource = kind_resources.get(resource_namespace, {}).get(name)
+                    if resource is not None:
+                        resources.append(resource)
+            elif namespace is not None:
+                # List resources in specific namespace
+                namespace_resources = kind_resources.get(namespace, {})
+                resources = list(namespace_resources.values())
+            else:
+                # List resources across all namespaces
+                for ns_resources in kind_resources.values():
+                    resources.extend(ns_resources.values())
 
-        # Apply label selector filter
-        if label_selector:
-            resources = self._filter_by_labels(resources, label_selector)
+        return [
+            resource
+            for resource in resources
+            if matches_labels(requirements=label_requirements, resource=resource)
+            and self._matches_field_requirements(resource=resource, requirements=field_requirements)
+        ]
 
-        # Apply field selector filter
-        if field_selector:
-            resources = self._filter_by_fields(resources, field_selector)
+    def _get_candidate_keys(
+        self,
+        kind: str,
+        api_version: str,
+        namespace: Union[str, None],
+        namespaces: list[Union[str, None]],
+        label_requirements: tuple[LabelRequirement, ...],
+        field_requirements: tuple[FieldRequirement, ...],
+    ) -> Union[list[tuple[Union[str, None], str]], None]:
+        """
+        Get the (namespace, name) keys that may match the selectors from the indexes.
 
-        return [copy.deepcopy(r) for r in resources]
+        Returns:
+            list[tuple[str | None, str]] | None: Candidate keys, None if no selector can use an index.
+        """
+        for field_requirement in field_requirements:
+            if field_requirement.path == ("metadata", "name") and not field_requirement.negated:
+                search_namespaces = [namespace] if namespace is not None else namespaces
+                return [(search_namespace, field_requirement.value) for search_namespace in search_namespaces]
+
+        key_index: Mapping[str, Mapping[str, Mapping[tuple[Union[str, None], str], None]]] = self._label_index.get(
+            (api_version, kind), {}
+        )
+        candidate_keys: Union[list[tuple[Union[str, None], str]], None] = None
+        for label_requirement in label_requirements:
+            if label_requirement.operator not in (IN, EXISTS):
+                continue
+
+            value_index: Mapping[str, Mapping[tuple[Union[str, None], str], None]] = key_index.get(
+                label_requirement.key, {}
+            )
+            values = label_requirement.values if label_requirement.operator == IN else list(value_index)
+            keys = [key for value in values for key in value_index.get(value, {})]
+            if candidate_keys is None or len(keys) < len(candidate_keys):
+                candidate_keys = keys
+
+        return candidate_keys
 
     def delete_resource(
         self, kind: str, api_version: str, name: str, namespace: Union[str, None]
     ) -> Union[dict[str, Any], None]:
-        """Delete a resource"""
-        resource = self.get_resource(kind, api_version, name, namespace)
-        if resource:
-            del self.resources[api_version][kind][namespace][name]
-            # Clean up empty structures
-            if not self.resources[api_version][kind][namespace]:
-                del self.resources[api_version][kind][namespace]
-            if not self.resources[api_version][kind]:
-                del self.resources[api_version][kind]
-            if not self.resources[api_version]:
-                del self.resources[api_version]
+        """Delete a resource, returns its last snapshot with the resourceVersion of the deletion"""
+        with self._events_condition:
+            resource = self.get_resource(kind, api_version, name, namespace)
+            if resource:
+                del self.resources[api_version][kind][namespace][name]
+                # Clean up empty structures
+                if not self.resources[api_version][kind][namespace]:
+                    del self.resources[api_version][kind][namespace]
+                if not self.resources[api_version][kind]:
+                    del self.resources[api_version][kind]
+                if not self.resources[api_version]:
+                    del self.resources[api_version]
+                self._update_label_index(
+                    kind=kind,
+                    api_version=api_version,
+                    name=name,
+                    namespace=namespace,
+                    old_resource=resource,
+                    new_resource=None,
+                )
+
+                resource = self._record_event(
+                    event_type="DELETED", kind=kind, api_version=api_version, namespace=namespace, resource=resource
+                )
         return resource
 
-    def _filter_by_labels(self, resources: list[dict[str, Any]], label_selector: str) -> list[dict[str, Any]]:
-        """Filter resources by label selector"""
-        filtered = []
-        for resource in resources:
-            labels = resource.get("metadata", {}).get("labels", {})
-            if self._matches_label_selector(labels, label_selector):
-                filtered.append(resource)
-        return filtered
-
-    def _matches_label_selector(self, labels: dict[str, str], selector: str) -> bool:
-        """Check if labels match selector (simplified implementation)"""
-        # Handle simple equality selectors (key=value)
-        parts = selector.split(",")
-        for part in parts:
-            if "=" in part:
-                key, value = part.split("=", 1)
-                if labels.get(key.strip()) != value.strip():
-                    return False
-            elif "!=" in part:
-                key, value = part.split("!=", 1)
-                if labels.get(key.strip()) == value.strip():
-                    return False
-            else:
-                # Just key presence check
-                if part.strip() not in labels:
-                    return False
-        return True
+    def dump(self) -> dict[str, Any]:
+        """
+        Get the storage content as JSON serializable data, see `load`.
 
-    def _filter_by_fields(self, resources: list[dict[str, Any]], field_selector: str) -> list[dict[str, Any]]:
-        """Filter resources by field selector"""
-        filtered = []
-        for resource in resources:
-            if self._matches_field_selector(resource, field_selector):
-                filtered.append(resource)
-        return filtered
-
-    def _matches_field_selector(self, resource: dict[str, Any], selector: str) -> bool:
-        """Check if resource matches field selector"""
-        # Handle simple field selectors (field.path=value or field.path==value)
-        parts = selector.split(",")
-        for part in parts:
-            if "==" in part:
-                # Handle double equals
-                field_path, selector_value = part.split("==", 1)
-                field_value = self._get_field_value(resource, field_path.strip())
-                if not self._compare_field_values(field_value, selector_value.strip()):
-                    return False
-            elif "=" in part:
-                # Handle single equals
-                field_path, selector_value = part.split("=", 1)
-                field_value = self._get_field_value(resource, field_path.strip())
-                if not self._compare_field_values(field_value, selector_value.strip()):
-                    return False
+        Returns:
+            dict[str, Any]: The resourceVersion counter and all resources with their storage keys.
+        """
+        with self._lock:
+            resources = [
+                [api_version, kind, namespace, name, resource]
+                for api_version, api_resources in self.resources.items()
+                for kind, kind_resources in api_resources.items()
+                for namespace, namespace_resources in kind_resources.items()
+                for name, resource in namespace_resources.items()
+            ]
+            return {"resource_version": self.resource_version, "resources": resources}
+
+    def load(self, data: dict[str, Any]) -> None:
+        """
+        Replace the storage content with data from `dump`.
+
+        The event journal starts empty, watches from a resourceVersion before the load get GoneError.
+        """
+        with self._lock:
+            self.resources.clear()
+            self._label_index.clear()
+            self._events.clear()
+            for api_version, kind, namespace, name, resource in data["resources"]:
+                snapshot = freeze(value=resource)
+                self.resources[api_version][kind][namespace][name] = snapshot
+                self._update_label_index(
+                    kind=kind,
+                    api_version=api_version,
+                    name=name,
+                    namespace=namespace,
+                    old_resource=None,
+                    new_resource=snapshot,
+                )
+
+            self.resource_version = data["resource_version"]
+            self.compacted_resource_version = self.resource_version
+            self._events_condition.notify_all()
+
+    def matches_selectors(
+        self,
+        resource: dict[str, Any],
+        label_selector: Union[str, None] = None,
+        field_selector: Union[str, None] = None,
+    ) -> bool:
+        """Check if a resource matches label and field selectors"""
+        if label_selector and not matches_labels(requirements=parse_label_selector(label_selector), resource=resource):
+            return False
+        return not field_selector or self._matches_field_requirements(
+            resource=resource, requirements=parse_field_selector(field_selector)
+        )
+
+    def _matches_field_requirements(self, resource: dict[str, Any], requirements: tuple[FieldRequirement, ...]) -> bool:
+        """Check if resource matches all compiled field selector requirements"""
+        for requirement in requirements:
+            field_value = self._get_field_value(resource, ".".join(requirement.path))
+            if self._compare_field_values(field_value, requirement.value) == requirement.negated:
+                return False
         return True
 
     def _compare_field_values(self, field_value: Any, selector_value: str) -> bool:
@@ -0,0 +1,119 @@
+"""Label and field selector parsing for fake Kubernetes client"""
+
+import functools
+import re
+from typing import Any, NamedTuple
+
+# Label selector operators, `=` and `==` compile to IN and `!=` to NOT_IN
+IN = "in"
+NOT_IN = "notin"
+EXISTS = "exists"
+DOES_NOT_EXIST = "!"
+
+_KEY = r"[A-Za-z0-9]([-A-Za-z0-9_./]*[A-Za-z0-9])?"
+_VALUE = r"([A-Za-z0-9]([-A-Za-z0-9_.]*[A-Za-z0-9])?)?"
+_SET_REQUIREMENT = re.compile(rf"^(?P<key>{_KEY})\s+(?P<operator>in|notin)\s*\((?P<values>[^()]*)\)$")
+_EQUALITY_REQUIREMENT = re.compile(rf"^(?P<key>{_KEY})\s*(?P<operator>==|!=|=)\s*(?P<value>{_VALUE})$")
+_EXISTS_REQUIREMENT = re.compile(rf"^(?P<not>!)?\s*(?P<key>{_KEY})$")
+_FIELD_REQUIREMENT = re.compile(r"^(?P<path>[^=!\s]+)\s*(?P<operator>==|!=|=)\s*(?P<value>.*)$")
+
+
+class LabelRequirement(NamedTuple):
+    """A single label selector requirement, e.g. `app in (web,db)`"""
+
+    key: str
+    operator: str
+    values: frozenset[str] = frozenset()
+
+    def matches(self, labels: dict[str, str]) -> bool:
+        if self.operator == IN:
+            return labels.get(self.key) in self.values
+        if self.operator == NOT_IN:
+            return self.key not in labels or labels[self.key] not in self.values
+        if self.operator == EXISTS:
+            return self.key in labels
+        return self.key not in labels
+
+
+class FieldRequirement(NamedTuple):
+    """A single field selector requirement, e.g. `status.phase!=Running`"""
+
+    path: tuple[str, ...]
+    value: str
+    negated: bool = False
+
+
+def _split_requirements(selector: str) -> list[str]:
+    """Split a selector on the commas that are not inside a set of values"""
+    requirements: list[str] = []
+    depth = 0
+    start = 0
+    for idx, char in enumerate(selector):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            requirements.append(selector[start:idx])
+            start = idx + 1
+
+    requirements.append(selector[start:])
+    return [requirement.strip() for requirement in requirements if requirement.strip()]
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_label_selector(selector: str) -> tuple[LabelRequirement, ...]:
+    """
+    Compile a label selector, supports `=`, `==`, `!=`, `in`, `notin`, `key` (exists) and `!key`.
+
+    Raises:
+        ValueError: If the selector is not valid.
+    """
+    requirements: list[LabelRequirement] = []
+    for requirement in _split_requirements(selector):
+        if match := _SET_REQUIREMENT.match(requirement):
+            values = frozenset(value.strip() for value in match["values"].split(","))
+            requirements.append(LabelRequirement(key=match["key"], operator=match["operator"], values=values))
+        elif match := _EQUALITY_REQUIREMENT.match(requirement):
+            operator = NOT_IN if match["operator"] == "!=" else IN
+            requirements.append(
+                LabelRequirement(key=match["key"], operator=operator, values=frozenset([match["value"]]))
+            )
+        elif match := _EXISTS_REQUIREMENT.match(requirement):
+            operator = DOES_NOT_EXIST if match["not"] else EXISTS
+            requirements.append(LabelRequirement(key=match["key"], operator=operator))
+        else:
+            raise ValueError(f"Invalid label selector: {selector!r}")
+
+    return tuple(requirements)
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_field_selector(selector: str) -> tuple[FieldRequirement, ...]:
+    """
+    Compile a field selector, supports `=`, `==` and `!=`.
+
+    Raises:
+        ValueError: If the selector is not valid.
+    """
+    requirements: list[FieldRequirement] = []
+    for requirement in _split_requirements(selector):
+        match = _FIELD_REQUIREMENT.match(requirement)
+        if not match:
+            raise ValueError(f"Invalid field selector: {selector!r}")
+
+        requirements.append(
+            FieldRequirement(
+                path=tuple(match["path"].split(".")),
+                value=match["value"].strip(),
+                negated=match["operator"] == "!=",
+            )
+        )
+
+    return tuple(requirements)
+
+
+def matches_labels(requirements: tuple[LabelRequirement, ...], resource: dict[str, Any]) -> bool:
+    """Check if a resource matches all compiled label requirements"""
+    labels = resource.get("metadata", {}).get("labels") or {}
+    return all(requirement.matches(labels=labels) for requirement in requirements)
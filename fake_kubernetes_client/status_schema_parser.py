@@ -1,34 +1,54 @@
 """Status schema parser for generating dynamic status from resource schemas"""
 
-import json
-import os
 import random
+import threading
+from collections.abc import Callable, Mapping
 from datetime import datetime, timezone
-from typing import Any, Union
+from typing import Any, NamedTuple, Union
+
+from fake_kubernetes_client.resource_storage import thaw
+from ocp_resources.utils.schema_validator import SchemaValidator
+
+# Generates the status of a resource body
+StatusGenerator = Callable[[dict[str, Any]], dict[str, Any]]
+
+
+class _Constant(NamedTuple):
+    """Compiled status value that does not depend on the resource body"""
+
+    value: Any
+
+
+# Compiled status value, a constant or a function of the resource body
+_Compiled = Union[_Constant, Callable[[dict[str, Any]], Any]]
 
 
 class StatusSchemaParser:
     """Parser for generating status from resource schemas"""
 
-    def __init__(self, resource_mappings: dict[str, Any]) -> None:
+    # Parser of the last resource mappings used with `for_mappings`, (resource mappings, parser)
+    _shared: Union[tuple[Mapping[str, Any], "StatusSchemaParser"], None] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, resource_mappings: Mapping[str, Any]) -> None:
         self.resource_mappings = resource_mappings
         self._definitions_cache: dict[str, Any] = {}
-        self._definitions: dict[str, Any] = {}
+        self._definitions: Mapping[str, Any] = {}
+        # {(kind, api_version, is_ready): compiled status generator}
+        self._status_generators: dict[tuple[str, str, bool], Union[StatusGenerator, None]] = {}
         self._load_definitions()
 
+    @classmethod
+    def for_mappings(cls, resource_mappings: Mapping[str, Any]) -> "StatusSchemaParser":
+        """Get a parser for the resource mappings, reused (with its compiled generators) while they are the same"""
+        with cls._shared_lock:
+            if cls._shared is None or cls._shared[0] is not resource_mappings:
+                cls._shared = (resource_mappings, cls(resource_mappings=resource_mappings))
+            return cls._shared[1]
+
     def _load_definitions(self) -> None:
-        """Load the definitions file once"""
-        definitions_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-            "class_generator",
-            "schema",
-            "_definitions.json",
-        )
-
-        if os.path.exists(definitions_path):
-            with open(definitions_path, "r") as f:
-                data = json.load(f)
-                self._definitions = data.get("definitions", {})
+        """Use the definitions SchemaValidator loaded with the resource mappings, instead of reading them again"""
+        self._definitions = SchemaValidator.get_definitions_data() or {}
 
     def get_status_schema_for_resource(self, kind: str, api_version: str) -> Union[dict[str, Any], None]:
         """Get status schema for a specific resource"""
@@ -194,29 +214,41 @@ class StatusSchemaParser:
 
         return base_schema
 
-    def generate_status_from_schema(self, schema: dict[str, Any], resource_body: dict[str, Any]) -> dict[str, Any]:
-        """Generate a realistic status based on the schema"""
+    def get_status_generator(self, kind: str, api_version: str, is_ready: bool) -> Union[StatusGenerator, None]:
+        """
+        Get the compiled status generator of a resource kind, compiled on first use.
+
+        Returns:
+            StatusGenerator | None: Generator of the status for a resource body, None if the kind has no status schema.
+        """
+        key = (kind, api_version, is_ready)
+        if key not in self._status_generators:
+            schema = self.get_status_schema_for_resource(kind=kind, api_version=api_version)
+            self._status_generators[key] = (
+                self.compile_status_generator(schema=schema, is_ready=is_ready) if schema else None
+            )
+
+        return self._status_generators[key]
+
+    def compile_status_generator(self, schema: dict[str, Any], is_ready: bool) -> StatusGenerator:
+        """
+        Compile a status schema into a generator of the status for a resource body.
+
+        The schema is walked once, with `$ref`s resolved and the values that do not depend on the resource body
+        precomputed. The generator only fills in per-resource values like replica counts and timestamps.
+        """
         if not schema or schema.get("type") != "object":
-            return {}
-
-        status = {}
-        properties = schema.get("properties", {})
+            return lambda resource_body: {}
 
-        # Check if resource is configured as not ready
-        is_ready = self._is_resource_ready(resource_body)
-
-        for field_name, field_schema in properties.items():
-            # Resolve any $ref in the field schema
-            if "$ref" in field_schema:
-                resolved_schema = self._resolve_reference(field_schema["$ref"])
-                if resolved_schema:
-                    field_schema = resolved_schema
+        compiled = self._compile_properties(properties=schema.get("properties", {}), is_ready=is_ready)
+        if isinstance(compiled, _Constant):
+            return lambda resource_body: thaw(value=compiled.value)
+        return compiled
 
-            value = self._generate_value_for_field(field_name, field_schema, resource_body, is_ready)
-            if value is not None:
-                status[field_name] = value
-
-        return status
+    def generate_status_from_schema(self, schema: dict[str, Any], resource_body: dict[str, Any]) -> dict[str, Any]:
+        """Generate a realistic status based on the schema"""
+        generator = self.compile_status_generator(schema=schema, is_ready=self._is_resource_ready(resource_body))
+        return generator(resource_body)
 
     def _is_resource_ready(self, resource_body: dict[str, Any]) -> bool:
         """Check if resource should be generated as ready"""
@@ -235,26 +267,63 @@ class StatusSchemaParser:
         # Default to ready
         return True
 
-    def _generate_value_for_field(
-        self, field_name: str, field_schema: dict[str, Any], resource_body: dict[str, Any], is_ready: bool = True
-    ) -> Any:
-        """Generate a value for a specific field based on its schema"""
+    def _resolve_field_schema(self, field_schema: dict[str, Any]) -> dict[str, Any]:
+        """Resolve a $ref in a field schema, the field schema itself when it has none or it cannot be resolved"""
+        if "$ref" in field_schema:
+            resolved_schema = self._resolve_reference(field_schema["$ref"])
+            if resolved_schema:
+                return resolved_schema
+
+        return field_schema
+
+    def _compile_properties(self, properties: dict[str, Any], is_ready: bool) -> _Compiled:
+        """Compile the properties of an object schema, folded into a constant when no value is per-resource"""
+        fields: list[tuple[str, _Compiled]] = []
+        for field_name, field_schema in properties.items():
+            compiled = self._compile_field(
+                field_name=field_name, field_schema=self._resolve_field_schema(field_schema), is_ready=is_ready
+            )
+            if compiled is not None and not (isinstance(compiled, _Constant) and compiled.value is None):
+                fields.append((field_name, compiled))
+
+        constants: list[tuple[str, _Constant]] = [
+            (field_name, compiled) for field_name, compiled in fields if isinstance(compiled, _Constant)
+        ]
+        if len(constants) == len(fields):
+            return _Constant(value={field_name: constant.value for field_name, constant in constants})
+
+        def _generate(resource_body: dict[str, Any]) -> dict[str, Any]:
+            obj = {}
+            for field_name, compiled in fields:
+                value = thaw(value=compiled.value) if isinstance(compiled, _Constant) else compiled(resource_body)
+                if value is not None:
+                    obj[field_name] = value
+            return obj
+
+        return _generate
+
+    def _compile_field(self, field_name: str, field_schema: dict[str, Any], is_ready: bool) -> Union[_Compiled, None]:
+        """Compile the value of a field based on its schema, None if the field type is not supported"""
         field_type = field_schema.get("type", "string")
 
         if "enum" in field_schema:
             # For enums, pick an appropriate value
-            return self._pick_enum_value(field_name, field_schema["enum"], is_ready)
+            return _Constant(value=self._pick_enum_value(field_name, field_schema["enum"], is_ready))
 
         if field_type == "string":
-            return self._generate_string_value(field_name, is_ready)
+            if "time" in field_name.lower() or "timestamp" in field_name.lower() or field_name.endswith("IP"):
+                return lambda resource_body: self._generate_string_value(field_name, is_ready)
+            return _Constant(value=self._generate_string_value(field_name, is_ready))
         elif field_type == "integer":
-            return self._generate_integer_value(field_name, resource_body, is_ready)
+            if "replicas" in field_name or field_name == "observedGeneration":
+                return lambda resource_body: self._generate_integer_value(field_name, resource_body, is_ready)
+            return _Constant(value=self._generate_integer_value(field_name, {}, is_ready))
         elif field_type == "boolean":
-            return self._generate_boolean_value(field_name, is_ready)
+            return _Constant(value=self._generate_boolean_value(field_name, is_ready))
         elif field_type == "array":
-            return self._generate_array_value(field_name, field_schema, resource_body, is_ready)
+            return self._compile_array(field_name=field_name, field_schema=field_schema, is_ready=is_ready)
         elif field_type == "object":
-            return self._generate_object_value(field_name, field_schema, resource_body, is_ready)
+            return self._compile_object(field_name=field_name, field_schema=field_schema, is_ready=is_ready)
 
         return None
 
@@ -355,67 +424,54 @@ class StatusSchemaParser:
 
         return is_ready
 
-    def _generate_array_value(
-        self, field_name: str, field_schema: dict[str, Any], resource_body: dict[str, Any], is_ready: bool = True
-    ) -> list[Any]:
-        """Generate an array value based on field schema"""
-        items_schema = field_schema.get("items", {})
-
-        # Resolve $ref in items if present
-        if "$ref" in items_schema:
-            resolved_items = self._resolve_reference(items_schema["$ref"])
-            if resolved_items:
-                items_schema = resolved_items
-
+    def _compile_array(self, field_name: str, field_schema: dict[str, Any], is_ready: bool) -> _Compiled:
+        """Compile an array value based on field schema"""
         if field_name == "conditions":
             # Generate standard conditions
-            return self._generate_conditions(is_ready)
+            return lambda resource_body: self._generate_conditions(is_ready)
         elif field_name == "accessModes":
             # Use access modes from spec if available
-            spec_modes = resource_body.get("spec", {}).get("accessModes", ["ReadWriteOnce"])
-            return spec_modes
+            return lambda resource_body: thaw(value=resource_body.get("spec", {}).get("accessModes", ["ReadWriteOnce"]))
         elif field_name == "addresses":
-            return [{"type": "InternalIP", "address": "10.0.0.1"}]
+            return _Constant(value=[{"type": "InternalIP", "address": "10.0.0.1"}])
         elif field_name == "ports":
-            return resource_body.get("spec", {}).get("ports", [{"port": 80}])
-        else:
-            # Generate a single item based on the items schema
-            item = self._generate_value_for_field(f"{field_name}_item", items_schema, resource_body, is_ready)
-            return [item] if item is not None else []
-
-    def _generate_object_value(
-        self, field_name: str, field_schema: dict[str, Any], resource_body: dict[str, Any], is_ready: bool = True
-    ) -> dict[str, Any]:
-        """Generate an object value based on field schema"""
-        if field_name == "capacity":
-            # For PVC capacity, match the requested storage
-            requested = resource_body.get("spec", {}).get("resources", {}).get("requests", {})
-            return requested.copy() if requested else {"storage": "1Gi"}
-        elif field_name == "allocatedResources":
-            # Match capacity
-            return self._generate_object_value("capacity", field_schema, resource_body, is_ready)
+            return lambda resource_body: thaw(value=resource_body.get("spec", {}).get("ports", [{"port": 80}]))
+
+        # Generate a single item based on the items schema
+        items_schema = self._resolve_field_schema(field_schema.get("items", {}))
+        item = self._compile_field(field_name=f"{field_name}_item", field_schema=items_schema, is_ready=is_ready)
+        if item is None:
+            return _Constant(value=[])
+        if isinstance(item, _Constant):
+            return _Constant(value=[item.value] if item.value is not None else [])
+
+        def _generate(resource_body: dict[str, Any]) -> list[Any]:
+            value = item(resource_body)
+            return [value] if value is not None else []
+
+        return _generate
+
+    def _compile_object(self, field_name: str, field_schema: dict[str, Any], is_ready: bool) -> _Compiled:
+        """Compile an object value based on field schema"""
+        if field_name in ("capacity", "allocatedResources"):
+            # For PVC capacity (and allocated resources), match the requested storage
+            return self._generate_capacity
         elif "properties" in field_schema:
             # Generate based on properties
-            obj = {}
-            for prop_name, prop_schema in field_schema["properties"].items():
-                # Resolve any $ref in property schema
-                if "$ref" in prop_schema:
-                    resolved = self._resolve_reference(prop_schema["$ref"])
-                    if resolved:
-                        prop_schema = resolved
-
-                value = self._generate_value_for_field(prop_name, prop_schema, resource_body, is_ready)
-                if value is not None:
-                    obj[prop_name] = value
-            return obj
+            return self._compile_properties(properties=field_schema["properties"], is_ready=is_ready)
         elif "additionalProperties" in field_schema:
             # For maps like capacity, labels, etc.
-            if field_name in ["capacity", "allocatedResources", "requests", "limits"]:
-                return {"storage": "1Gi", "cpu": "100m", "memory": "128Mi"}
-            else:
-                return {"key1": "value1"}
-        else:
-            return {}
+            if field_name in ["requests", "limits"]:
+                return _Constant(value={"storage": "1Gi", "cpu": "100m", "memory": "128Mi"})
+            return _Constant(value={"key1": "value1"})
+
+        return _Constant(value={})
+
+    @staticmethod
+    def _generate_capacity(resource_body: dict[str, Any]) -> dict[str, Any]:
+        """Generate a capacity matching the requested storage"""
+        requested = resource_body.get("spec", {}).get("resources", {}).get("requests", {})
+        return thaw(value=requested) if requested else {"storage": "1Gi"}
 
     def _generate_conditions(self, is_ready: bool = True) -> list[dict[str, Any]]:
         """Generate standard Kubernetes conditions"""
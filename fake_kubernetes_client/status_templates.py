@@ -1,5 +1,6 @@
 """Status template methods for fake Kubernetes resources"""
 
+from collections.abc import Mapping
 from datetime import datetime, timezone
 from typing import Any, Union
 
@@ -42,7 +43,7 @@ def _get_ready_status_config(body: dict[str, Any]) -> tuple[str, str, str]:
     return status, reason, message
 
 
-def add_realistic_status(body: dict[str, Any], resource_mappings: Union[dict[str, Any], None] = None) -> None:
+def add_realistic_status(body: dict[str, Any], resource_mappings: Union[Mapping[str, Any], None] = None) -> None:
     """Add realistic status to resources that need it"""
     kind = body.get("kind", "")
 
@@ -67,16 +68,47 @@ def add_realistic_status(body: dict[str, Any], resource_mappings: Union[dict[str
         body["status"] = status
 
 
-def generate_dynamic_status(body: dict[str, Any], resource_mappings: dict[str, Any]) -> dict[str, Any]:
+def get_pending_status_template(
+    body: dict[str, Any], resource_mappings: Union[Mapping[str, Any], None] = None
+) -> Union[dict[str, Any], None]:
+    """
+    Get the status of a resource that is not ready yet, with phase Pending if its status has a phase.
+
+    Returns:
+        dict | None: The pending status, None if the resource is configured as not ready anyway.
+    """
+    if _get_ready_status_config(body=body)[0] != "True":
+        return None
+
+    annotations = {
+        **body.get("metadata", {}).get("annotations", {}),
+        "fake-client.io/ready": "false",
+        "fake-client.io/pod-ready": "false",
+    }
+    pending_body = {**body, "metadata": {**body.get("metadata", {}), "annotations": annotations}}
+    if "readyStatus" in body.get("spec", {}):
+        pending_body["spec"] = {**body["spec"], "readyStatus": False}
+
+    add_realistic_status(body=pending_body, resource_mappings=resource_mappings)
+    status = pending_body.get("status", {})
+    if "phase" in status:
+        status["phase"] = "Pending"
+    return status
+
+
+def generate_dynamic_status(body: dict[str, Any], resource_mappings: Mapping[str, Any]) -> dict[str, Any]:
     """Generate status dynamically based on resource schema"""
     kind = body.get("kind", "")
     api_version = body.get("apiVersion", "v1")
 
-    parser = StatusSchemaParser(resource_mappings=resource_mappings)
-    status_schema = parser.get_status_schema_for_resource(kind=kind, api_version=api_version)
+    # The status schema of each kind is compiled once, creates only fill in the per-resource values
+    parser = StatusSchemaParser.for_mappings(resource_mappings=resource_mappings)
+    generator = parser.get_status_generator(
+        kind=kind, api_version=api_version, is_ready=_get_ready_status_config(body=body)[0] == "True"
+    )
 
-    if status_schema:
-        return parser.generate_status_from_schema(schema=status_schema, resource_body=body)
+    if generator:
+        return generator(body)
     else:
         # Fallback to generic status
         return get_generic_status_template(body=body)
@@ -32,6 +32,11 @@ from ocp_resources.resource import NamespacedResource, Resource, get_client
 log_file = os.path.join(tempfile.gettempdir(), "mcp_server_debug.log")
 LOGGER = get_logger(name=__name__, filename=log_file, level=logging.DEBUG)
 
+# get_pod_logs reads at most this much log, so a huge log does not fill the memory
+POD_LOGS_LIMIT_BYTES: int = 1024 * 1024
+# get_pod_logs reads the end of the log when no tail_lines is given, the most recent lines matter for diagnostics
+POD_LOGS_TAIL_LINES: int = 500
+
 # Initialize the MCP server
 mcp = FastMCP(name="openshift-python-wrapper")
 
@@ -531,9 +536,10 @@ def get_pod_logs(
     previous: bool = False,
     since_seconds: int | None = None,
     tail_lines: int | None = None,
+    limit_bytes: int = POD_LOGS_LIMIT_BYTES,
 ) -> dict[str, Any]:
     """
-    Get logs from a pod container.
+    Get the last tail_lines (default 500) log lines of a pod container, at most limit_bytes of them.
     """
     try:
         client = get_dynamic_client()
@@ -542,20 +548,37 @@ def get_pod_logs(
         if not pod.exists:
             return _format_not_found_error(resource_type="Pod", name=name, namespace=namespace)
 
-        # Build kwargs for log method
-        kwargs: dict[str, Any] = {}
-        if container:
-            kwargs["container"] = container
-        if previous:
-            kwargs["previous"] = previous
-        if tail_lines:
-            kwargs["tail_lines"] = tail_lines
-        if since_seconds:
-            kwargs["since_seconds"] = since_seconds
-
-        logs = pod.log(**kwargs)
-
-        return {"pod": name, "namespace": namespace, "container": container, "logs": logs}
+        if tail_lines is None:
+            tail_lines = POD_LOGS_TAIL_LINES
+
+        kwargs: dict[str, Any] = {
+            "container": container or None,
+            "since_seconds": since_seconds,
+            "tail_lines": tail_lines,
+            "limit_bytes": limit_bytes,
+        }
+        # The response is at most limit_bytes, read the raw bytes to know whether the server cut it there
+        resp: Any = pod.log(
+            previous=previous,
+            _preload_content=False,
+            **{key: value for key, value in kwargs.items() if value is not None},
+        )
+        try:
+            raw_logs = resp.data
+        finally:
+            resp.release_conn()
+
+        truncated = len(raw_logs) >= limit_bytes
+        logs = raw_logs.decode("utf-8", errors="replace").removesuffix("\n")
+
+        return {
+            "pod": name,
+            "namespace": namespace,
+            "container": container,
+            "tail_lines": tail_lines,
+            "truncated": truncated,
+            "logs": logs,
+        }
     except Exception as e:
         return _format_exception_error("Failed to get logs for", f"pod '{name}'", e)
 
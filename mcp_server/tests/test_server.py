@@ -3,6 +3,8 @@
 Comprehensive tests for the OpenShift Python Wrapper MCP Server
 """
 
+from unittest.mock import PropertyMock, patch
+
 import pytest
 
 import mcp_server.server
@@ -12,6 +14,7 @@ from mcp_server.server import (
     get_resource_class,
 )
 from ocp_resources.config_map import ConfigMap
+from ocp_resources.pod import Pod
 
 # Get the actual function implementations from the decorated tools
 list_resources_func = mcp_server.server.list_resources.fn
@@ -256,6 +259,30 @@ class TestGetPodLogs:
 
         assert "error" in result
 
+    @pytest.mark.parametrize(
+        "tail_lines, raw_logs, expected_tail_lines, expected_truncated",
+        [
+            pytest.param(None, b"a" * 9 + b"\n" + b"b" * 11, mcp_server.server.POD_LOGS_TAIL_LINES, True, id="cut"),
+            pytest.param(0, b"", 0, False, id="explicit-zero-tail"),
+            pytest.param(2, b"a" * 9 + b"\n" + b"b" * 8 + b"\n", 2, False, id="whole-tail"),
+        ],
+    )
+    def test_get_pod_logs_tail_truncated(
+        self, use_fake_client, tail_lines, raw_logs, expected_tail_lines, expected_truncated
+    ):
+        """Test pod logs are read from the end and flagged when the server cut them at limit_bytes"""
+        with (
+            patch.object(Pod, "exists", new_callable=PropertyMock, return_value=True),
+            patch.object(Pod, "log") as mock_log,
+        ):
+            mock_log.return_value.data = raw_logs
+            result = get_pod_logs_func(name="test-pod", namespace="default", tail_lines=tail_lines, limit_bytes=20)
+
+        assert mock_log.call_args.kwargs["tail_lines"] == expected_tail_lines
+        assert result["logs"] == raw_logs.decode().removesuffix("\n")
+        assert result["truncated"] is expected_truncated
+        mock_log.return_value.release_conn.assert_called_once()
+
 
 class TestExecInPod:
     """Test exec_in_pod function"""
@@ -63,6 +63,38 @@ class ResourceTeardownError(Exception):
         return f"Failed to execute teardown for resource {self.resource}"
 
 
+class ResourceListError(Exception):
+    def __init__(self, action: str, errors: dict[str, BaseException]) -> None:
+        # The fields are the args, so the exception pickles and copies with them
+        super().__init__(action, errors)
+        self.action = action
+        self.errors = errors
+
+    def __str__(self) -> str:
+        failures = "; ".join(f"{resource}: {error}" for resource, error in self.errors.items())
+        return f"Failed to {self.action} {len(self.errors)} resource(s): {failures}"
+
+
+class ResourceEditorError(Exception):
+    def __init__(self, action: str, errors: dict[str, BaseException], applied: list[str]) -> None:
+        # The fields are the args, so the exception pickles and copies with them
+        super().__init__(action, errors, applied)
+        self.action = action
+        self.errors = errors
+        self.applied = applied
+
+    def __str__(self) -> str:
+        failures = "; ".join(f"{resource}: {error}" for resource, error in self.errors.items())
+        return (
+            f"ResourceEditor {self.action} failed for {len(self.errors)} of "
+            f"{len(self.errors) + len(self.applied)} resource(s): {failures}"
+        )
+
+
+class RetryableResourceEditorError(ResourceEditorError):
+    """ResourceEditorError whose errors are all cluster errors worth retrying, e.g. conflicts"""
+
+
 class ClientWithBasicAuthError(Exception):
     pass
 
@@ -1,6 +1,10 @@
 # Generated using https://github.com/RedHatQE/openshift-python-wrapper/blob/main/scripts/resource/README.md
 
+import codecs
+import datetime
 import json
+import math
+from collections.abc import Generator
 from typing import Any
 
 import kubernetes
@@ -10,6 +14,13 @@ from ocp_resources.exceptions import ExecOnPodError
 from ocp_resources.node import Node
 from ocp_resources.resource import MissingRequiredArgumentError, NamespacedResource
 from ocp_resources.utils.constants import TIMEOUT_5SEC
+from ocp_resources.utils.pod_exec_session import STREAM_CLOSED_ERROR, PodExecSession
+
+LOG_CHUNK_SIZE: int = 64 * 1024
+# Longer lines are yielded in pieces, so a log without newlines does not fill the memory
+MAX_LOG_LINE_LENGTH: int = 1024 * 1024
+TAIL_LOG_LINES: int = 500
+TAIL_LOG_LIMIT_BYTES: int = 1024 * 1024
 
 
 class Pod(NamespacedResource):
@@ -490,14 +501,14 @@ class Pod(NamespacedResource):
             ExecOnPodError: If the command failed.
         """
         error_channel: dict[Any, Any] = {}
-        stream_closed_error: str = "stream resp is closed"
-        self.logger.info(f"Execute {command} on {self.name} ({self.node.name})")
+        default_container, node_name = self._exec_metadata()
+        self.logger.info(f"Execute {command} on {self.name} ({node_name})")
         resp = kubernetes.stream.stream(
             api_method=self._kube_v1_api.connect_get_namespaced_pod_exec,
             name=self.name,
             namespace=self.namespace,
             command=command,
-            container=container or self.instance.spec.containers[0].name,
+            container=container or default_container,
             stderr=True,
             stdin=False,
             stdout=True,
@@ -515,11 +526,11 @@ class Pod(NamespacedResource):
                 # Check remaining time, in order to throw exception
                 # if remaining time reached zero
                 if timeout_watch.remaining_time() <= 0:
-                    raise ExecOnPodError(command=command, rc=-1, out="", err=stream_closed_error)
+                    raise ExecOnPodError(command=command, rc=-1, out="", err=STREAM_CLOSED_ERROR)
 
         rcstring = error_channel.get("status")
         if rcstring is None:
-            raise ExecOnPodError(command=command, rc=-1, out="", err=stream_closed_error)
+            raise ExecOnPodError(command=command, rc=-1, out="", err=STREAM_CLOSED_ERROR)
 
         stdout = resp.read_stdout(timeout=TIMEOUT_5SEC)
         stderr = resp.read_stderr(timeout=TIMEOUT_5SEC)
@@ -536,6 +547,39 @@ class Pod(NamespacedResource):
 
         raise ExecOnPodError(command=command, rc=returncode, out=stdout, err=stderr)
 
+    def exec_session(self, container: str = "", shell: str = "/bin/sh") -> PodExecSession:
+        """
+        Get a shell session in a Pod container, to run many commands over one exec websocket.
+
+        Args:
+            container (str): Container name where to exec the commands.
+            shell (str): Shell to start in the container.
+
+        Returns:
+            PodExecSession: The session, it opens on the first command.
+        """
+        return PodExecSession(pod=self, container=container, shell=shell)
+
+    def _exec_metadata(self) -> tuple[str, str]:
+        """
+        Get the default container and node names for exec, cached once the Pod is scheduled.
+
+        Both are immutable for a scheduled Pod, so repeated execs do not GET the Pod again.
+
+        Returns:
+            tuple: (first container name, node name or "" if not scheduled yet)
+        """
+        cached = self.__dict__.get("_exec_metadata_cache")
+        if cached:
+            return cached
+
+        spec = self.instance.spec
+        metadata = (spec.containers[0].name, spec.nodeName or "")
+        if spec.nodeName:
+            self._exec_metadata_cache = metadata
+
+        return metadata
+
     def log(self, **kwargs: Any) -> str:
         """
         Get Pod logs
@@ -545,6 +589,95 @@ class Pod(NamespacedResource):
         """
         return self._kube_v1_api.read_namespaced_pod_log(name=self.name, namespace=self.namespace, **kwargs)
 
+    def stream_log(
+        self,
+        container: str = "",
+        follow: bool = False,
+        since_time: datetime.datetime | None = None,
+        since_seconds: int | None = None,
+        tail_lines: int | None = None,
+        limit_bytes: int | None = None,
+        previous: bool = False,
+        timestamps: bool = False,
+    ) -> Generator[str, None, None]:
+        """
+        Stream Pod logs line by line, reading the response in chunks instead of loading the whole log.
+
+        Args:
+            container (str): Container name, may be omitted if the Pod has one container.
+            follow (bool): Keep streaming new log lines until the container stops or the generator is closed.
+            since_time (datetime): Only logs from this time; sent to the API as the seconds since then.
+            since_seconds (int): Only logs from the last seconds.
+            tail_lines (int): Only the last lines of the log.
+            limit_bytes (int): Stop after about this number of bytes of log.
+            previous (bool): Logs of the previous terminated container.
+            timestamps (bool): Prefix each line with its RFC3339 timestamp.
+
+        Yields:
+            str: Log lines, without the line break. Lines longer than MAX_LOG_LINE_LENGTH are yielded in pieces.
+        """
+        if since_time:
+            elapsed = datetime.datetime.now(tz=datetime.timezone.utc) - since_time.astimezone(datetime.timezone.utc)
+            since_seconds = max(1, math.ceil(elapsed.total_seconds()))
+
+        kwargs: dict[str, Any] = {
+            "container": container or None,
+            "since_seconds": since_seconds,
+            "tail_lines": tail_lines,
+            "limit_bytes": limit_bytes,
+        }
+        resp: Any = self._kube_v1_api.read_namespaced_pod_log(
+            name=self.name,
+            namespace=self.namespace,
+            follow=follow,
+            previous=previous,
+            timestamps=timestamps,
+            _preload_content=False,
+            **{key: value for key, value in kwargs.items() if value is not None},
+        )
+
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        pending = ""
+        try:
+            for chunk in resp.stream(amt=LOG_CHUNK_SIZE, decode_content=True):
+                pending += decoder.decode(chunk)
+                *lines, pending = pending.split("\n")
+                yield from lines
+
+                while len(pending) >= MAX_LOG_LINE_LENGTH:
+                    yield pending[:MAX_LOG_LINE_LENGTH]
+                    pending = pending[MAX_LOG_LINE_LENGTH:]
+
+            pending += decoder.decode(b"", final=True)
+            if pending:
+                yield pending
+        finally:
+            resp.close()
+            resp.release_conn()
+
+    def tail_log(
+        self,
+        container: str = "",
+        lines: int = TAIL_LOG_LINES,
+        limit_bytes: int = TAIL_LOG_LIMIT_BYTES,
+        previous: bool = False,
+    ) -> str:
+        """
+        Get the end of the Pod logs, the server only sends the last lines.
+
+        Args:
+            container (str): Container name, may be omitted if the Pod has one container.
+            lines (int): Number of lines from the end of the log.
+            limit_bytes (int): Maximum size of the returned log, in bytes.
+            previous (bool): Logs of the previous terminated container.
+
+        Returns:
+            str: The last log lines.
+        """
+        return "\n".join(
+            self.stream_log(container=container, tail_lines=lines, limit_bytes=limit_bytes, previous=previous)
+        )
+
     @property
     def node(self) -> Node:
         """
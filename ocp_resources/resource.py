@@ -1,13 +1,18 @@
 import base64
 import contextlib
 import copy
+import functools
+import hashlib
 import json
 import os
 import re
 import sys
 import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Generator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import StringIO
 from signal import SIGINT, signal
 from types import TracebackType
@@ -19,10 +24,12 @@ import kubernetes
 import requests
 import yaml
 from benedict import benedict
+from kubernetes.client.rest import ApiException
 from kubernetes.dynamic import DynamicClient, ResourceInstance
 from kubernetes.dynamic.exceptions import (
     ConflictError,
     ForbiddenError,
+    GoneError,
     MethodNotAllowedError,
     NotFoundError,
     ResourceNotFoundError,
@@ -35,7 +42,7 @@ from timeout_sampler import (
     TimeoutSampler,
     TimeoutWatch,
 )
-from urllib3.exceptions import MaxRetryError
+from urllib3.exceptions import MaxRetryError, ProtocolError
 
 from fake_kubernetes_client.dynamic_client import FakeDynamicClient
 from ocp_resources.event import Event
@@ -43,12 +50,17 @@ from ocp_resources.exceptions import (
     ClientWithBasicAuthError,
     MissingRequiredArgumentError,
     MissingResourceResError,
+    ResourceEditorError,
+    ResourceListError,
     ResourceTeardownError,
+    RetryableResourceEditorError,
     ValidationError,
 )
 from ocp_resources.utils.constants import (
     DEFAULT_CLUSTER_RETRY_EXCEPTIONS,
+    DEFAULT_FIELD_MANAGER,
     NOT_FOUND_ERROR_EXCEPTION_DICT,
+    PATCH_CONTENT_TYPES,
     PROTOCOL_ERROR_EXCEPTION_DICT,
     TIMEOUT_1MINUTE,
     TIMEOUT_1SEC,
@@ -57,25 +69,51 @@ from ocp_resources.utils.constants import (
     TIMEOUT_10SEC,
     TIMEOUT_30SEC,
 )
+from ocp_resources.utils.discovery_cache import CachedDiscoverer
+from ocp_resources.utils.informer import Informer, get_informer, parse_selectors, stop_informers
 from ocp_resources.utils.resource_constants import ResourceConstants
 from ocp_resources.utils.schema_validator import SchemaValidator
 from ocp_resources.utils.utils import skip_existing_resource_creation_teardown
 
 LOGGER = get_logger(name=__name__)
 MAX_SUPPORTED_API_VERSION = "v2"
+# Resource.get kwargs the informer cache can answer, the rest are sent to the server
+INFORMER_GET_KWARGS: set[str] = {"name", "namespace", "label_selector", "field_selector"}
+
+# Resolved group_version per client and (api_group, kind); entries go away with their client
+_API_VERSIONS_CACHE: "weakref.WeakKeyDictionary[Any, dict[tuple[str, str], str]]" = weakref.WeakKeyDictionary()
+_API_VERSIONS_CACHE_LOCK = threading.Lock()
+
+# Clients shared by get_client(shared=True), by config source, context, host, auth and pool settings, with the
+# kubeconfig modification time they were created from
+_SHARED_CLIENTS: dict[tuple[Any, ...], tuple[float | None, Any]] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+# Default urllib3 pool size per host for clients created by get_client, kubernetes default if not set
+CONNECTION_POOL_MAXSIZE_ENV: str = "OPENSHIFT_PYTHON_WRAPPER_CONNECTION_POOL_MAXSIZE"
+
+
+@functools.cache
+def _kube_api_version(api_version: str) -> "KubeAPIVersion":
+    return KubeAPIVersion(vstring=api_version)
 
 
 def _find_supported_resource(dyn_client: DynamicClient, api_group: str, kind: str) -> ResourceField | None:
     results = dyn_client.resources.search(group=api_group, kind=kind)
-    sorted_results = sorted(results, key=lambda result: KubeAPIVersion(result.api_version), reverse=True)
+    sorted_results = sorted(results, key=lambda result: _kube_api_version(result.api_version), reverse=True)
     for result in sorted_results:
-        if KubeAPIVersion(result.api_version) <= KubeAPIVersion(MAX_SUPPORTED_API_VERSION):
+        if _kube_api_version(result.api_version) <= _kube_api_version(MAX_SUPPORTED_API_VERSION):
             return result
     return None
 
 
 def _get_api_version(dyn_client: DynamicClient, api_group: str, kind: str) -> str:
     # Returns api_group/api_version
+    with _API_VERSIONS_CACHE_LOCK:
+        cached_api_version = _API_VERSIONS_CACHE.get(dyn_client, {}).get((api_group, kind))
+
+    if cached_api_version:
+        return cached_api_version
+
     res = _find_supported_resource(dyn_client=dyn_client, api_group=api_group, kind=kind)
     log = f"Couldn't find {kind} in {api_group} api group"
 
@@ -85,11 +123,83 @@ def _get_api_version(dyn_client: DynamicClient, api_group: str, kind: str) -> st
 
     if isinstance(res.group_version, str):
         LOGGER.info(f"kind: {kind} api version: {res.group_version}")
+        with _API_VERSIONS_CACHE_LOCK:
+            _API_VERSIONS_CACHE.setdefault(dyn_client, {})[(api_group, kind)] = res.group_version
+
         return res.group_version
 
     raise NotImplementedError(log)
 
 
+def invalidate_api_versions_cache(dyn_client: DynamicClient | None = None) -> None:
+    """
+    Drop cached api versions, e.g. after installing or upgrading CRDs.
+
+    Args:
+        dyn_client (DynamicClient | None): Only drop the api versions resolved with this client; all if None.
+    """
+    with _API_VERSIONS_CACHE_LOCK:
+        if dyn_client is None:
+            _API_VERSIONS_CACHE.clear()
+        else:
+            _API_VERSIONS_CACHE.pop(dyn_client, None)
+
+
+def _list_paginated(
+    list_func: Callable[..., Any], page_size: int, *args: Any, **kwargs: Any
+) -> Generator[ResourceField, None, None]:
+    """
+    Lazily walk a LIST call page by page using `limit` and `continue`.
+
+    Only one page is held in memory at a time. When the continue token expires (410 Gone) the LIST is
+    restarted from a fresh resourceVersion and items that were already yielded are skipped by UID.
+
+    A GET by `name` returns a single object, not a list, and is yielded as is without paging.
+
+    Args:
+        list_func (Callable): LIST call, e.g. `ResourceInstance.get` or `DynamicClient.get` bound to a resource.
+        page_size (int): Maximum number of items to request per page.
+        *args (tuple): args to pass to list_func.
+        **kwargs (dict): kwargs to pass to list_func.
+
+    Yields:
+        kubernetes.dynamic.resource.ResourceField: Listed resources.
+    """
+    if kwargs.get("name"):
+        yield list_func(*args, **kwargs)
+        return
+
+    seen_uids: set[str] = set()
+    restarted = False
+    _continue: str | None = None
+
+    while True:
+        try:
+            response = list_func(*args, limit=page_size, _continue=_continue, **kwargs)
+        except GoneError:
+            if not _continue:
+                raise
+
+            LOGGER.warning("LIST continue token expired, restarting from a fresh resourceVersion")
+            restarted = True
+            _continue = None
+            continue
+
+        for item in response.items:
+            uid = item.metadata.uid
+            if restarted and uid in seen_uids:
+                continue
+
+            if uid:
+                seen_uids.add(uid)
+
+            yield item
+
+        _continue = response.metadata["continue"] or None
+        if not _continue:
+            return
+
+
 def client_configuration_with_basic_auth(
     username: str,
     password: str,
@@ -203,6 +313,10 @@ def get_client(
     verify_ssl: bool | None = None,
     token: str | None = None,
     fake: bool = False,
+    shared: bool = False,
+    connection_pool_maxsize: int | None = None,
+    discovery_cache_dir: str | None = None,
+    discovery_cache_ttl: float | None = None,
 ) -> DynamicClient | FakeDynamicClient:
     """
     Get a kubernetes client.
@@ -227,6 +341,16 @@ def get_client(
         host (str): host for the cluster
         verify_ssl (bool): whether to verify ssl
         token (str): Use token to login
+        shared (bool): return the process-wide client of the same config source, context, host and auth, creating
+            it on first use, instead of a new client with its own connection pool and discovery cache.
+            Ignored when client_configuration is passed. Release shared clients with `close_clients()`.
+        connection_pool_maxsize (int): urllib3 connection pool size per host, defaults to the
+            OPENSHIFT_PYTHON_WRAPPER_CONNECTION_POOL_MAXSIZE environment variable, then the kubernetes default.
+        discovery_cache_dir (str): directory of the API discovery cache files, shared by all processes of the host.
+            Defaults to the OPENSHIFT_PYTHON_WRAPPER_DISCOVERY_CACHE_DIR environment variable, then
+            ~/.cache/openshift-python-wrapper/discovery.
+        discovery_cache_ttl (float): seconds the API discovery cache is used, 0 to not use a cache file. Defaults to
+            the OPENSHIFT_PYTHON_WRAPPER_DISCOVERY_CACHE_TTL environment variable, then 6 hours.
 
     Returns:
         DynamicClient: a kubernetes client.
@@ -235,9 +359,61 @@ def get_client(
         return FakeDynamicClient()
 
     proxy = os.environ.get("HTTPS_PROXY") or os.environ.get("HTTP_PROXY")
+    if connection_pool_maxsize is None and os.environ.get(CONNECTION_POOL_MAXSIZE_ENV):
+        connection_pool_maxsize = int(os.environ[CONNECTION_POOL_MAXSIZE_ENV])
+
+    if shared and client_configuration is None:
+        key, config_mtime = _shared_client_key(
+            config_file=config_file,
+            config_dict=config_dict,
+            context=context,
+            username=username,
+            password=password,
+            host=host,
+            verify_ssl=verify_ssl,
+            token=token,
+            proxy=proxy,
+            connection_pool_maxsize=connection_pool_maxsize,
+            discovery_cache_dir=discovery_cache_dir,
+            discovery_cache_ttl=discovery_cache_ttl,
+        )
+        superseded = None
+        # Creating a client runs discovery, hold the lock so concurrent callers don't create it twice
+        with _SHARED_CLIENTS_LOCK:
+            shared_client = _SHARED_CLIENTS.get(key)
+            if not shared_client or shared_client[0] != config_mtime:
+                superseded = shared_client
+                shared_client = _SHARED_CLIENTS[key] = (
+                    config_mtime,
+                    get_client(
+                        config_file=config_file,
+                        config_dict=config_dict,
+                        context=context,
+                        persist_config=persist_config,
+                        temp_file_path=temp_file_path,
+                        try_refresh_token=try_refresh_token,
+                        username=username,
+                        password=password,
+                        host=host,
+                        verify_ssl=verify_ssl,
+                        token=token,
+                        connection_pool_maxsize=connection_pool_maxsize,
+                        discovery_cache_dir=discovery_cache_dir,
+                        discovery_cache_ttl=discovery_cache_ttl,
+                    ),
+                )
+
+        if superseded:
+            # The kubeconfig was rewritten (e.g. after a login), drop the client of its previous content
+            _close_client(client=superseded[1])
+
+        return shared_client[1]
 
     client_configuration = client_configuration or kubernetes.client.Configuration()
 
+    if connection_pool_maxsize is not None:
+        client_configuration.connection_pool_maxsize = connection_pool_maxsize
+
     if verify_ssl is not None:
         client_configuration.verify_ssl = verify_ssl
 
@@ -281,9 +457,10 @@ def get_client(
         )
 
     kubernetes.client.Configuration.set_default(default=client_configuration)
+    discoverer = functools.partial(CachedDiscoverer, cache_dir=discovery_cache_dir, ttl=discovery_cache_ttl)
 
     try:
-        return kubernetes.dynamic.DynamicClient(client=_client)
+        return kubernetes.dynamic.DynamicClient(client=_client, discoverer=discoverer)
     except MaxRetryError:
         # Ref: https://github.com/kubernetes-client/python/blob/v26.1.0/kubernetes/base/config/incluster_config.py
         LOGGER.info("Trying to get client via incluster_config")
@@ -291,9 +468,81 @@ def get_client(
             client=kubernetes.config.incluster_config.load_incluster_config(
                 client_configuration=client_configuration, try_refresh_token=try_refresh_token
             ),
+            discoverer=discoverer,
         )
 
 
+def _shared_client_key(
+    config_file: str | None,
+    config_dict: dict[str, Any] | None,
+    context: str | None,
+    username: str | None,
+    password: str | None,
+    host: str | None,
+    verify_ssl: bool | None,
+    token: str | None,
+    proxy: str | None,
+    connection_pool_maxsize: int | None,
+    discovery_cache_dir: str | None,
+    discovery_cache_ttl: float | None,
+) -> tuple[tuple[Any, ...], float | None]:
+    """
+    Build the get_client(shared=True) registry key, following the same source precedence as get_client.
+
+    Secrets are only kept as digests. The modification time of a kubeconfig file is returned with the key, so a
+    rewritten kubeconfig (e.g. after a login) replaces the client of its key.
+
+    Returns:
+        tuple: The registry key, and the kubeconfig file modification time (None for other sources).
+    """
+
+    def _digest(value: str) -> str:
+        return hashlib.sha256(value.encode()).hexdigest()
+
+    config_mtime = None
+    if username and password and host:
+        source: tuple[Any, ...] = ("basic-auth", host, username, _digest(password))
+    elif host and token:
+        source = ("token", host, _digest(token))
+    elif config_dict:
+        source = ("config-dict", _digest(json.dumps(config_dict, sort_keys=True, default=str)))
+    else:
+        config_path = os.path.abspath(
+            os.path.expanduser(config_file or os.environ.get("KUBECONFIG") or "~/.kube/config")
+        )
+        source = ("config-file", config_path)
+        config_mtime = os.path.getmtime(config_path) if os.path.isfile(config_path) else None
+
+    return (
+        *source,
+        context,
+        verify_ssl,
+        proxy,
+        connection_pool_maxsize,
+        discovery_cache_dir,
+        discovery_cache_ttl,
+    ), config_mtime
+
+
+def _close_client(client: DynamicClient) -> None:
+    stop_informers(client=client)
+    client.client.close()
+
+
+def close_clients() -> None:
+    """
+    Close the clients shared by get_client(shared=True), their connection pools and informers.
+
+    The next get_client(shared=True) call creates a new client.
+    """
+    with _SHARED_CLIENTS_LOCK:
+        clients = [client for _, client in _SHARED_CLIENTS.values()]
+        _SHARED_CLIENTS.clear()
+
+    for client in clients:
+        _close_client(client=client)
+
+
 def sub_resource_level(current_class: Any, owner_class: Any, parent_class: Any) -> str | None:
     # return the name of the last class in MRO list that is not one of base
     # classes; otherwise return None
@@ -645,7 +894,9 @@ class Resource(ResourceConstants):
         self.context = context
         self.label = label
         self.annotations = annotations
-        self.client: DynamicClient = client or get_client(config_file=self.config_file, context=self.context)
+        self.client: DynamicClient = client or get_client(
+            config_file=self.config_file, context=self.context, shared=True
+        )
         self.api_group: str = api_group or self.api_group
         self.hash_log_data = hash_log_data
 
@@ -660,6 +911,10 @@ class Resource(ResourceConstants):
         self.res: dict[Any, Any] = self.kind_dict or {}
         self.yaml_file_contents: str = ""
         self.initial_resource_version: str = ""
+        # List item served by `instance` in place of the ResourceInstance, see _set_instance_snapshot
+        self._instance_snapshot: Any = None
+        self._instance_snapshot_expiry: float = 0.0
+        self._informer: Informer | None = None
         self.logger = self._set_logger()
         self.wait_for_resource = wait_for_resource
 
@@ -833,9 +1088,7 @@ class Resource(ResourceConstants):
         return self.delete(wait=wait, timeout=timeout or self.delete_timeout)
 
     @classmethod
-    def _prepare_resources(
-        cls, dyn_client: DynamicClient, singular_name: str, *args: Any, **kwargs: Any
-    ) -> ResourceInstance:
+    def _get_resource_api(cls, dyn_client: DynamicClient, singular_name: str) -> Any:
         if not cls.api_version:
             cls.api_version = _get_api_version(dyn_client=dyn_client, api_group=cls.api_group, kind=cls.kind)
 
@@ -844,7 +1097,63 @@ class Resource(ResourceConstants):
             kind=cls.kind,
             api_version=cls.api_version,
             **get_kwargs,
-        ).get(*args, **kwargs, timeout_seconds=cls.timeout_seconds)
+        )
+
+    @classmethod
+    def _prepare_resources(
+        cls, dyn_client: DynamicClient, singular_name: str, *args: Any, **kwargs: Any
+    ) -> ResourceInstance:
+        return cls._get_resource_api(dyn_client=dyn_client, singular_name=singular_name).get(
+            *args, **kwargs, timeout_seconds=cls.timeout_seconds
+        )
+
+    @classmethod
+    def _prepare_resources_pages(
+        cls, dyn_client: DynamicClient, singular_name: str, page_size: int, *args: Any, **kwargs: Any
+    ) -> Generator[ResourceField, None, None]:
+        return _list_paginated(
+            cls._get_resource_api(dyn_client=dyn_client, singular_name=singular_name).get,
+            page_size,
+            *args,
+            **kwargs,
+            timeout_seconds=cls.timeout_seconds,
+        )
+
+    @classmethod
+    def _list_from_informer(
+        cls, dyn_client: DynamicClient, singular_name: str, **kwargs: Any
+    ) -> tuple[Informer, list[Any]]:
+        """
+        List resources from the shared informer cache.
+
+        Raises:
+            ValueError: If the cache can't answer the query (unsupported kwargs or selectors, not synced, or
+                `name` not cached) and it should be sent to the server.
+        """
+        if unsupported := sorted(set(kwargs) - INFORMER_GET_KWARGS):
+            raise ValueError(f"Unsupported informer kwargs: {unsupported}")
+
+        # Selectors the cache can't evaluate go to the server without starting an informer
+        parse_selectors(label_selector=kwargs.get("label_selector"), field_selector=kwargs.get("field_selector"))
+        informer = get_informer(
+            client=dyn_client,
+            resource_api=cls._get_resource_api(dyn_client=dyn_client, singular_name=singular_name),
+            api_version=cls.api_version,
+            kind=cls.kind,
+            namespace=kwargs.get("namespace"),
+        )
+        cached_resources = informer.list_resources(
+            namespace=kwargs.get("namespace"),
+            label_selector=kwargs.get("label_selector"),
+            field_selector=kwargs.get("field_selector"),
+        )
+        if name := kwargs.get("name"):
+            cached_resources = [resource for resource in cached_resources if resource.metadata.name == name]
+            if not cached_resources:
+                # Let the server raise NotFoundError
+                raise ValueError(f"{cls.kind} {name} is not cached")
+
+        return informer, cached_resources
 
     def _prepare_singular_name_kwargs(self, **kwargs: Any) -> dict[str, Any]:
         kwargs = kwargs if kwargs else {}
@@ -855,7 +1164,7 @@ class Resource(ResourceConstants):
 
     def _set_client_and_api_version(self) -> None:
         if not self.client:
-            self.client = get_client(config_file=self.config_file, context=self.context)
+            self.client = get_client(config_file=self.config_file, context=self.context, shared=True)
 
         if not self.api_version:
             self.api_version = _get_api_version(dyn_client=self.client, api_group=self.api_group, kind=self.kind)
@@ -889,27 +1198,107 @@ class Resource(ResourceConstants):
     def api(self) -> ResourceInstance:
         return self.full_api()
 
+    def _poll_instance(
+        self, timeout: float, sleep: int, exceptions_dict: dict[type[Exception], list[str]]
+    ) -> Generator[ResourceInstance | None, None, None]:
+        yield from TimeoutSampler(
+            wait_timeout=timeout,
+            sleep=sleep,
+            exceptions_dict=exceptions_dict,
+            func=lambda: self.exists,
+        )
+
+    def watch_instance(
+        self,
+        timeout: int,
+        sleep: int = 1,
+        exceptions_dict: dict[type[Exception], list[str]] | None = None,
+    ) -> Generator[ResourceInstance | None, None, None]:
+        """
+        Yield the resource instance every time it changes on the server.
+
+        The resource is fetched once, then a single watch on the resource name is opened from its
+        resourceVersion and the object of every event is yielded (None when the resource does not exist
+        or was deleted). Polling with TimeoutSampler is used only if the watch fails (e.g. 410 Gone).
+
+        Args:
+            timeout (int): Time to watch the resource.
+            sleep (int): Polling interval, used only when falling back to polling.
+            exceptions_dict (dict): Exceptions dict for TimeoutSampler.
+
+        Yields:
+            ResourceInstance | None: The resource instance, None if it does not exist.
+
+        Raises:
+            TimeoutExpiredError: If timeout reached.
+        """
+        exceptions_dict = exceptions_dict or DEFAULT_CLUSTER_RETRY_EXCEPTIONS
+        watch_exceptions: tuple[type[BaseException], ...] = (ApiException, ProtocolError, *exceptions_dict.keys())
+        timeout_watcher = TimeoutWatch(timeout=timeout)
+
+        try:
+            instance = self.exists
+        except watch_exceptions:
+            yield from self._poll_instance(
+                timeout=timeout_watcher.remaining_time(), sleep=sleep, exceptions_dict=exceptions_dict
+            )
+            return
+
+        yield instance
+        resource_version = instance.metadata.resourceVersion if instance else None
+
+        while (remaining_time := timeout_watcher.remaining_time()) > 0:
+            try:
+                for event in self.api.watch(
+                    namespace=self.namespace,
+                    field_selector=f"metadata.name=={self.name}",
+                    resource_version=resource_version,
+                    timeout=max(int(remaining_time), 1),
+                ):
+                    if event["type"] == "ERROR":
+                        raise ApiException(status=event["raw_object"].get("code"), reason="Watch error event")
+
+                    resource_version = event["object"].metadata.resourceVersion or resource_version
+                    if event["type"] == "BOOKMARK":
+                        continue
+
+                    yield None if event["type"] == "DELETED" else event["object"]
+
+                    if timeout_watcher.remaining_time() <= 0:
+                        break
+
+            except watch_exceptions as exp:
+                self.logger.warning(f"Watch on {self.kind} {self.name} failed, falling back to polling: {exp}")
+                yield from self._poll_instance(
+                    timeout=timeout_watcher.remaining_time(), sleep=sleep, exceptions_dict=exceptions_dict
+                )
+                return
+
+            # The watch was closed before timeout, re-open it from the last seen resourceVersion
+            time.sleep(min(sleep, timeout_watcher.remaining_time()))
+
+        raise TimeoutExpiredError(value=f"Watching {self.kind} {self.name}", elapsed_time=timeout)
+
     def wait(self, timeout: int = TIMEOUT_4MINUTES, sleep: int = 1) -> None:
         """
         Wait for resource
 
         Args:
             timeout (int): Time to wait for the resource.
-            sleep (int): Time to wait between retries
+            sleep (int): Time to wait between retries, used only if the watch falls back to polling.
 
         Raises:
             TimeoutExpiredError: If resource not exists.
         """
         self.logger.info(f"Wait until {self.kind} {self.name} is created")
-        samples = TimeoutSampler(
-            wait_timeout=timeout,
+        samples = self.watch_instance(
+            timeout=timeout,
             sleep=sleep,
             exceptions_dict={
                 **PROTOCOL_ERROR_EXCEPTION_DICT,
                 **NOT_FOUND_ERROR_EXCEPTION_DICT,
                 **DEFAULT_CLUSTER_RETRY_EXCEPTIONS,
             },
-            func=lambda: self.exists,
         )
         for sample in samples:
             if sample:
@@ -927,7 +1316,7 @@ class Resource(ResourceConstants):
         """
         self.logger.info(f"Wait until {self.kind} {self.name} is deleted")
         try:
-            for sample in TimeoutSampler(wait_timeout=timeout, sleep=1, func=lambda: self.exists):
+            for sample in self.watch_instance(timeout=timeout):
                 if not sample:
                     return True
         except TimeoutExpiredError:
@@ -960,20 +1349,20 @@ class Resource(ResourceConstants):
             status (str): Expected status.
             timeout (int): Time to wait for the resource.
             stop_status (str): Status which should stop the wait and failed.
+            sleep (int): Time to wait between retries, used only if the watch falls back to polling.
 
         Raises:
             TimeoutExpiredError: If resource in not in desire status.
         """
         stop_status = stop_status if stop_status else self.Status.FAILED
         self.logger.info(f"Wait for {self.kind} {self.name} status to be {status}")
-        samples = TimeoutSampler(
-            wait_timeout=timeout,
+        samples = self.watch_instance(
+            timeout=timeout,
             sleep=sleep,
             exceptions_dict={
                 **PROTOCOL_ERROR_EXCEPTION_DICT,
                 **DEFAULT_CLUSTER_RETRY_EXCEPTIONS,
             },
-            func=lambda: self.exists,
         )
         current_status = None
         last_logged_status = None
@@ -1021,6 +1410,7 @@ class Resource(ResourceConstants):
         resource_kwargs = {"body": self.res, "namespace": self.namespace}
         if self.dry_run:
             resource_kwargs["dry_run"] = "All"
+        self._instance_snapshot = None
         resource_ = self.api.create(**resource_kwargs)
         with contextlib.suppress(ForbiddenError, AttributeError, NotFoundError):
             # some resources do not support get() (no instance) or the client do not have permissions
@@ -1043,6 +1433,7 @@ class Resource(ResourceConstants):
             else:
                 self.logger.warning(f"{self.kind}: {self.name} instance.to_dict() return was not a dict")
 
+            self._instance_snapshot = None
             self.api.delete(name=self.name, namespace=self.namespace, body=body)
 
             if wait:
@@ -1066,26 +1457,93 @@ class Resource(ResourceConstants):
         self.logger.info(f"Get {self.kind} {self.name} status")
         return self.instance.status.phase
 
-    def update(self, resource_dict: dict[str, Any]) -> None:
+    def update(self, resource_dict: dict[str, Any] | list[dict[str, Any]], patch_type: str = "merge") -> None:
         """
         Update resource with resource dict
 
         Args:
-            resource_dict: Resource dictionary
+            resource_dict: Resource dictionary, or a list of JSON patch operations when patch_type is "json"
+                (e.g. [{"op": "remove", "path": "/metadata/labels/app"}])
+            patch_type: "merge" (JSON merge patch), "strategic" (strategic merge patch) or "json" (JSON patch)
+
+        Raises:
+            ValueError: If patch_type is not supported.
+            TypeError: If resource_dict is a list and patch_type is not "json".
         """
         # Note: We don't validate on update() because this method sends a patch,
         # not a complete resource. Patches are partial updates that would fail
         # full schema validation.
+        if patch_type not in PATCH_CONTENT_TYPES:
+            raise ValueError(f"Unsupported patch type {patch_type}, supported: {', '.join(PATCH_CONTENT_TYPES)}")
+
+        if patch_type == "json":
+            self.logger.info(f"Update {self.kind} {self.name} with JSON patch:\n{resource_dict}")
+            self._instance_snapshot = None
+            self.api.patch(
+                body=resource_dict,
+                name=self.name,
+                namespace=self.namespace,
+                content_type=PATCH_CONTENT_TYPES[patch_type],
+            )
+            return
+
+        if not isinstance(resource_dict, dict):
+            raise TypeError(f"A list of patch operations requires patch_type json, got {patch_type}")
 
         hashed_resource_dict = self.hash_resource_dict(resource_dict=resource_dict)
         self.logger.info(f"Update {self.kind} {self.name}:\n{hashed_resource_dict}")
         self.logger.debug(f"\n{yaml.dump(hashed_resource_dict)}")
+        self._instance_snapshot = None
         self.api.patch(
             body=resource_dict,
             namespace=self.namespace,
-            content_type="application/merge-patch+json",
+            content_type=PATCH_CONTENT_TYPES[patch_type],
         )
 
+    def apply(self, field_manager: str = DEFAULT_FIELD_MANAGER, force: bool = False, wait: bool = False) -> Any:
+        """
+        Create or update the resource with server-side apply.
+
+        The server merges the resource dict into the live object and records the applied fields as owned by
+        field_manager, so no read-modify-write loop or ConflictError retry is needed.
+
+        Args:
+            field_manager (str): Name of the field manager owning the applied fields.
+            force (bool): Take ownership of fields other field managers set to different values, instead of
+                raising ConflictError.
+            wait (bool): True to wait for resource status.
+
+        Returns:
+            ResourceInstance: The resource after the apply.
+
+        Raises:
+            ConflictError: If the applied fields are owned by other field managers and force is False.
+        """
+        self.to_dict()
+
+        # Validate the resource if auto-validation is enabled
+        if self.schema_validation_enabled:
+            self.validate()
+
+        hashed_res = self.hash_resource_dict(resource_dict=self.res)
+        self.logger.info(f"Apply {self.kind} {self.name} as {field_manager}")
+        self.logger.debug(f"\n{yaml.dump(hashed_res)}")
+        resource_kwargs: dict[str, Any] = {
+            "body": self.res,
+            "name": self.name,
+            "namespace": self.namespace,
+            "field_manager": field_manager,
+            "force_conflicts": force,
+        }
+        if self.dry_run:
+            resource_kwargs["dry_run"] = "All"
+        self._instance_snapshot = None
+        resource_ = self.api.server_side_apply(**resource_kwargs)
+
+        if wait and resource_:
+            self.wait()
+        return resource_
+
     def update_replace(self, resource_dict: dict[str, Any]) -> None:
         """
         Replace resource metadata.
@@ -1100,6 +1558,7 @@ class Resource(ResourceConstants):
         hashed_resource_dict = self.hash_resource_dict(resource_dict=resource_dict)
         self.logger.info(f"Replace {self.kind} {self.name}: \n{hashed_resource_dict}")
         self.logger.debug(f"\n{yaml.dump(hashed_resource_dict)}")
+        self._instance_snapshot = None
         self.api.replace(body=resource_dict, name=self.name, namespace=self.namespace)
 
     @staticmethod
@@ -1137,6 +1596,9 @@ class Resource(ResourceConstants):
         raw: bool = False,
         context: str | None = None,
         dyn_client: DynamicClient | None = None,
+        instance_snapshot_ttl: int = 0,
+        page_size: int = 0,
+        use_informer: bool = False,
         *args: Any,
         **kwargs: Any,
     ) -> Generator[Any, None, None]:
@@ -1150,27 +1612,73 @@ class Resource(ResourceConstants):
             singular_name (str): Resource kind (in lowercase), in use where we have multiple matches for resource.
             raw (bool): If True return raw object.
             exceptions_dict (dict): Exceptions dict for TimeoutSampler
+            instance_snapshot_ttl (int): Seconds the listed body of each resource is served by `instance`
+                before it is fetched again from the server; 0 (default) to always fetch. Saves a GET per
+                resource read right after listing, but polling `instance` sees data up to this old.
+            page_size (int): If set, list the resources in pages of this size (`limit`/`continue`) and yield
+                them as each page arrives instead of fetching them all in one response.
+            use_informer (bool): If True, serve the resources from the shared informer cache of
+                (client, kind, namespace), and their `instance` while they are cached. Selectors the cache
+                can't evaluate are sent to the server.
 
         Returns:
             generator: Generator of Resources of cls.kind.
         """
         if not dyn_client:
-            dyn_client = get_client(config_file=config_file, context=context)
+            dyn_client = get_client(config_file=config_file, context=context, shared=True)
+
+        def _get() -> Generator["Resource|ResourceInstance|ResourceField", None, None]:
+            if use_informer and not args:
+                try:
+                    informer, cached_resources = cls._list_from_informer(
+                        dyn_client=dyn_client, singular_name=singular_name, **kwargs
+                    )
+                except ValueError as exp:
+                    LOGGER.debug(f"Listing {cls.kind} from the server: {exp}")
+                else:
+                    for resource_field in cached_resources:
+                        if raw:
+                            yield resource_field
+                        else:
+                            _resource = cls(client=dyn_client, name=resource_field.metadata.name)
+                            _resource._informer = informer
+                            yield _resource
+
+                    return
+
+            if page_size:
+                for resource_field in cls._prepare_resources_pages(
+                    dyn_client, singular_name, page_size, *args, **kwargs
+                ):
+                    if raw:
+                        yield resource_field
+                    else:
+                        _resource = cls(client=dyn_client, name=resource_field.metadata.name)
+                        _resource._set_instance_snapshot(
+                            instance=resource_field, expiry=time.monotonic() + instance_snapshot_ttl
+                        )
+                        yield _resource
+
+                return
 
-        def _get() -> Generator["Resource|ResourceInstance", None, None]:
             _resources = cls._prepare_resources(dyn_client=dyn_client, singular_name=singular_name, *args, **kwargs)  # type: ignore[misc]
+            snapshot_expiry = time.monotonic() + instance_snapshot_ttl
             try:
                 for resource_field in _resources.items:
                     if raw:
                         yield _resources
                     else:
-                        yield cls(client=dyn_client, name=resource_field.metadata.name)
+                        _resource = cls(client=dyn_client, name=resource_field.metadata.name)
+                        _resource._set_instance_snapshot(instance=resource_field, expiry=snapshot_expiry)
+                        yield _resource
 
             except TypeError:
                 if raw:
                     yield _resources
                 else:
-                    yield cls(client=dyn_client, name=_resources.metadata.name)
+                    _resource = cls(client=dyn_client, name=_resources.metadata.name)
+                    _resource._set_instance_snapshot(instance=_resources, expiry=snapshot_expiry)
+                    yield _resource
 
         return Resource.retry_cluster_exceptions(func=_get, exceptions_dict=exceptions_dict)
 
@@ -1183,11 +1691,34 @@ class Resource(ResourceConstants):
             openshift.dynamic.client.ResourceInstance
         """
 
+        if snapshot := self._get_instance_snapshot():
+            return snapshot
+
+        if self._informer and self.name and (cached := self._informer.get(name=self.name)):
+            return cached
+
         def _instance() -> ResourceInstance | None:
             return self.api.get(name=self.name)
 
         return self.retry_cluster_exceptions(func=_instance)
 
+    def _set_instance_snapshot(self, instance: ResourceField | ResourceInstance, expiry: float) -> None:
+        """
+        Serve an already fetched body from `instance` instead of getting it from the server.
+
+        Args:
+            instance (ResourceField | ResourceInstance): Resource body, e.g. an item of a list response.
+            expiry (float): `time.monotonic()` value after which the body is considered stale.
+        """
+        self._instance_snapshot = instance
+        self._instance_snapshot_expiry = expiry
+
+    def _get_instance_snapshot(self) -> Any:
+        if self._instance_snapshot is not None and time.monotonic() >= self._instance_snapshot_expiry:
+            self._instance_snapshot = None
+
+        return self._instance_snapshot
+
     @property
     def labels(self) -> ResourceField:
         """
@@ -1228,27 +1759,14 @@ class Resource(ResourceConstants):
             condition (str): Condition to query.
             status (str): Expected condition status.
             timeout (int): Time to wait for the resource.
-            sleep_time(int): Interval between each retry when checking the resource's condition.
+            sleep_time(int): Interval between each retry when the watch falls back to polling.
 
         Raises:
             TimeoutExpiredError: If Resource condition in not in desire status.
         """
         self.logger.info(f"Wait for {self.kind}/{self.name}'s '{condition}' condition to be '{status}'")
 
-        timeout_watcher = TimeoutWatch(timeout=timeout)
-        for sample in TimeoutSampler(
-            wait_timeout=timeout,
-            sleep=sleep_time,
-            func=lambda: self.exists,
-        ):
-            if sample:
-                break
-
-        for sample in TimeoutSampler(
-            wait_timeout=timeout_watcher.remaining_time(),
-            sleep=sleep_time,
-            func=lambda: self.instance,
-        ):
+        for sample in self.watch_instance(timeout=timeout, sleep=sleep_time):
             if sample:
                 for cond in sample.get("status", {}).get("conditions", []):
                     if cond["type"] == condition and cond["status"] == status:
@@ -1295,22 +1813,8 @@ class Resource(ResourceConstants):
             return response.data
 
     def wait_for_conditions(self) -> None:
-        timeout_watcher = TimeoutWatch(timeout=30)
-        for sample in TimeoutSampler(
-            wait_timeout=TIMEOUT_30SEC,
-            sleep=1,
-            func=lambda: self.exists,
-        ):
-            if sample:
-                break
-
-        samples = TimeoutSampler(
-            wait_timeout=timeout_watcher.remaining_time(),
-            sleep=1,
-            func=lambda: self.instance.status.conditions,
-        )
-        for sample in samples:
-            if sample:
+        for sample in self.watch_instance(timeout=TIMEOUT_30SEC):
+            if sample and sample.get("status", {}).get("conditions"):
                 return
 
     def events(
@@ -1363,6 +1867,7 @@ class Resource(ResourceConstants):
         config_file: str = "",
         context: str | None = None,
         config_dict: dict[str, Any] | None = None,
+        page_size: int = 0,
         *args: Any,
         **kwargs: Any,
     ) -> Generator[ResourceField, None, None]:
@@ -1374,6 +1879,8 @@ class Resource(ResourceConstants):
             config_file (str): path to a kubeconfig file.
             config_dict (dict): dict with kubeconfig configuration.
             context (str): name of the context to use.
+            page_size (int): If set, list each resource type in pages of this size (`limit`/`continue`)
+                instead of fetching all its items in one response.
             *args (tuple): args to pass to client.get()
             **kwargs (dict): kwargs to pass to client.get()
 
@@ -1385,10 +1892,14 @@ class Resource(ResourceConstants):
                 print(f"Resource: {resource}")
         """
         if not client:
-            client = get_client(config_file=config_file, config_dict=config_dict, context=context)
+            client = get_client(config_file=config_file, config_dict=config_dict, context=context, shared=True)
 
         for _resource in client.resources.search():
             try:
+                if page_size:
+                    yield from _list_paginated(client.get, page_size, _resource, *args, **kwargs)
+                    continue
+
                 _resources = client.get(_resource, *args, **kwargs)
                 yield from _resources.items
 
@@ -1570,6 +2081,9 @@ class NamespacedResource(Resource):
         raw: bool = False,
         context: str | None = None,
         dyn_client: DynamicClient | None = None,
+        instance_snapshot_ttl: int = 0,
+        page_size: int = 0,
+        use_informer: bool = False,
         *args: Any,
         **kwargs: Any,
     ) -> Generator[Any, None, None]:
@@ -1583,34 +2097,88 @@ class NamespacedResource(Resource):
             singular_name (str): Resource kind (in lowercase), in use where we have multiple matches for resource.
             raw (bool): If True return raw object.
             exceptions_dict (dict): Exceptions dict for TimeoutSampler
+            instance_snapshot_ttl (int): Seconds the listed body of each resource is served by `instance`
+                before it is fetched again from the server; 0 (default) to always fetch. Saves a GET per
+                resource read right after listing, but polling `instance` sees data up to this old.
+            page_size (int): If set, list the resources in pages of this size (`limit`/`continue`) and yield
+                them as each page arrives instead of fetching them all in one response.
+            use_informer (bool): If True, serve the resources from the shared informer cache of
+                (client, kind, namespace), and their `instance` while they are cached. Selectors the cache
+                can't evaluate are sent to the server.
 
         Returns:
             generator: Generator of Resources of cls.kind
         """
         if not dyn_client:
-            dyn_client = get_client(config_file=config_file, context=context)
+            dyn_client = get_client(config_file=config_file, context=context, shared=True)
+
+        def _get() -> Generator["NamespacedResource|ResourceInstance|ResourceField", None, None]:
+            if use_informer and not args:
+                try:
+                    informer, cached_resources = cls._list_from_informer(
+                        dyn_client=dyn_client, singular_name=singular_name, **kwargs
+                    )
+                except ValueError as exp:
+                    LOGGER.debug(f"Listing {cls.kind} from the server: {exp}")
+                else:
+                    for resource_field in cached_resources:
+                        if raw:
+                            yield resource_field
+                        else:
+                            _resource = cls(
+                                client=dyn_client,
+                                name=resource_field.metadata.name,
+                                namespace=resource_field.metadata.namespace,
+                            )
+                            _resource._informer = informer
+                            yield _resource
+
+                    return
+
+            if page_size:
+                for resource_field in cls._prepare_resources_pages(
+                    dyn_client, singular_name, page_size, *args, **kwargs
+                ):
+                    if raw:
+                        yield resource_field
+                    else:
+                        _resource = cls(
+                            client=dyn_client,
+                            name=resource_field.metadata.name,
+                            namespace=resource_field.metadata.namespace,
+                        )
+                        _resource._set_instance_snapshot(
+                            instance=resource_field, expiry=time.monotonic() + instance_snapshot_ttl
+                        )
+                        yield _resource
+
+                return
 
-        def _get() -> Generator["NamespacedResource|ResourceInstance", None, None]:
             _resources = cls._prepare_resources(dyn_client=dyn_client, singular_name=singular_name, *args, **kwargs)  # type: ignore[misc]
+            snapshot_expiry = time.monotonic() + instance_snapshot_ttl
             try:
                 for resource_field in _resources.items:
                     if raw:
                         yield resource_field
                     else:
-                        yield cls(
+                        _resource = cls(
                             client=dyn_client,
                             name=resource_field.metadata.name,
                             namespace=resource_field.metadata.namespace,
                         )
+                        _resource._set_instance_snapshot(instance=resource_field, expiry=snapshot_expiry)
+                        yield _resource
             except TypeError:
                 if raw:
                     yield _resources
                 else:
-                    yield cls(
+                    _resource = cls(
                         client=dyn_client,
                         name=_resources.metadata.name,
                         namespace=_resources.metadata.namespace,
                     )
+                    _resource._set_instance_snapshot(instance=_resources, expiry=snapshot_expiry)
+                    yield _resource
 
         return Resource.retry_cluster_exceptions(func=_get, exceptions_dict=exceptions_dict)
 
@@ -1623,6 +2191,12 @@ class NamespacedResource(Resource):
             openshift.dynamic.client.ResourceInstance
         """
 
+        if snapshot := self._get_instance_snapshot():
+            return snapshot
+
+        if self._informer and self.name and (cached := self._informer.get(name=self.name, namespace=self.namespace)):
+            return cached
+
         def _instance() -> ResourceInstance:
             return self.api.get(name=self.name, namespace=self.namespace)
 
@@ -1644,14 +2218,22 @@ class NamespacedResource(Resource):
 
 
 class ResourceEditor:
+    max_workers: int = 10
+
     def __init__(
-        self, patches: dict[Any, Any], action: str = "update", user_backups: dict[Any, Any] | None = None
+        self,
+        patches: dict[Any, Any],
+        action: str = "update",
+        user_backups: dict[Any, Any] | None = None,
+        max_workers: int | None = None,
     ) -> None:
         """
         Args:
             patches (dict): {<Resource object>: <yaml patch as dict>}
                 e.g. {<Resource object>:
                         {'metadata': {'labels': {'label1': 'true'}}}
+            max_workers (int | None): Number of resources backed up and patched in parallel, defaults to
+                `max_workers`.
 
         Allows for temporary edits to cluster resources for tests. During
         __enter__ user-specified patches (see args) are applied and old values
@@ -1666,6 +2248,10 @@ class ResourceEditor:
         May also be used without being treated as a context manager by
         calling the methods update() and restore() after instantiation.
 
+        Backups are fetched and patches applied concurrently. A patch failing with a retryable cluster error
+        (e.g. a conflict) is retried alone, patches already applied are not applied again. If patches still fail,
+        ResourceEditorError reports the failed and the applied resources.
+
         *** the DynamicClient object used to get the resources must not be
          using an unprivileged_user; use default_client or similar instead.***
         """
@@ -1673,6 +2259,7 @@ class ResourceEditor:
         self._patches = self._dictify_resourcefield(res=patches)
         self.action = action
         self.user_backups = user_backups
+        self.max_workers = max_workers or self.max_workers
         self._backups: dict[Any, Any] = {}
 
     @property
@@ -1697,27 +2284,10 @@ class ResourceEditor:
                 self._backups = self.user_backups
 
             else:
-                for resource, update in self._patches.items():
-                    namespace = None
-                    # prepare backup
-                    try:
-                        original_resource_dict = resource.instance.to_dict()
-                    except NotFoundError:
-                        # Some resource cannot be found by name.
-                        # happens in 'ServiceMonitor' resource.
-                        original_resource_dict = list(
-                            resource.get(
-                                dyn_client=resource.client,
-                                field_selector=f"metadata.name={resource.name}",
-                            )
-                        )[0].to_dict()
-                        namespace = update.get("metadata", {}).get("namespace")
-
-                    backup = self._create_backup(original=original_resource_dict, patch=update)
-                    if namespace:
-                        # Add namespace to metadata for restore.
-                        backup["metadata"]["namespace"] = namespace
+                with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(self._patches)))) as executor:
+                    backups = list(executor.map(self._create_resource_backup, self._patches.keys()))
 
+                for resource, backup in zip(self._patches, backups):
                     # no need to back up if no changes have been made
                     # if action is 'replace' we need to update even if no backup (replace update can be empty )
                     if backup or self.action == "replace":
@@ -1738,6 +2308,30 @@ class ResourceEditor:
     def restore(self) -> None:
         self._apply_patches_sampler(patches=self._backups, action_text="Restoring", action=self.action)
 
+    def _create_resource_backup(self, resource: Any) -> dict[Any, Any]:
+        """Fetch a resource and build the backup of the fields its patch changes"""
+        update = self._patches[resource]
+        namespace = None
+        try:
+            original_resource_dict = resource.instance.to_dict()
+        except NotFoundError:
+            # Some resource cannot be found by name.
+            # happens in 'ServiceMonitor' resource.
+            original_resource_dict = list(
+                resource.get(
+                    dyn_client=resource.client,
+                    field_selector=f"metadata.name={resource.name}",
+                )
+            )[0].to_dict()
+            namespace = update.get("metadata", {}).get("namespace")
+
+        backup = self._create_backup(original=original_resource_dict, patch=update)
+        if namespace:
+            # Add namespace to metadata for restore.
+            backup["metadata"]["namespace"] = namespace
+
+        return backup
+
     def __enter__(self) -> Self:
         self.update(backup_resources=True)
         return self
@@ -1807,56 +2401,147 @@ class ResourceEditor:
             return None
 
     @staticmethod
-    def _apply_patches(patches: dict[Any, Any], action_text: str, action: str) -> None:
+    def _apply_patch(resource: Any, patch: dict[Any, Any], action_text: str, action: str) -> None:
         """
-        Updates provided Resource objects with provided yaml patches
+        Updates a provided Resource object with a provided yaml patch
 
         Args:
-            patches (dict): {<Resource object>: <yaml patch as dict>}
+            resource (Resource): resource to patch
+            patch (dict): yaml patch as dict
             action_text (str):
                 "ResourceEdit <action_text> for resource <resource name>"
-                will be printed for each resource; see below
+                will be printed for the resource; see below
         """
+        LOGGER.info(f"ResourceEdits: {action_text} data for resource {resource.kind} {resource.name}")
+
+        # add name to patch
+        if "metadata" not in patch:
+            patch["metadata"] = {}
 
-        for resource, patch in patches.items():
-            LOGGER.info(f"ResourceEdits: {action_text} data for resource {resource.kind} {resource.name}")
+        # the api requires this field to be present in a yaml patch for
+        # some resource kinds even if it is not changed
+        if "name" not in patch["metadata"]:
+            patch["metadata"]["name"] = resource.name
 
-            # add name to patch
+        if action == "update":
+            resource.update(resource_dict=patch)  # update the resource
+
+        if action == "replace":
             if "metadata" not in patch:
                 patch["metadata"] = {}
 
-            # the api requires this field to be present in a yaml patch for
-            # some resource kinds even if it is not changed
-            if "name" not in patch["metadata"]:
-                patch["metadata"]["name"] = resource.name
+            patch["metadata"]["name"] = resource.name
+            patch["metadata"]["namespace"] = resource.namespace
+            patch["metadata"]["resourceVersion"] = resource.instance.metadata.resourceVersion
+            patch["kind"] = resource.kind
+            patch["apiVersion"] = resource.api_version
+
+            resource.update_replace(resource_dict=patch)  # replace the resource metadata
+
+    @staticmethod
+    def _apply_patches(
+        patches: dict[Any, Any], action_text: str, action: str, max_workers: int = 10
+    ) -> dict[Any, Exception]:
+        """
+        Updates provided Resource objects with provided yaml patches, in parallel
+
+        Args:
+            patches (dict): {<Resource object>: <yaml patch as dict>}
+            action_text (str):
+                "ResourceEdit <action_text> for resource <resource name>"
+                will be printed for each resource
+            max_workers (int): number of resources patched in parallel
 
-            if action == "update":
-                resource.update(resource_dict=patch)  # update the resource
+        Returns:
+            dict: {<Resource object>: <exception>} of the patches that failed
+        """
+        errors: dict[Any, Exception] = {}
+        if not patches:
+            return errors
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(patches)))) as executor:
+            futures = {
+                executor.submit(
+                    ResourceEditor._apply_patch, resource=resource, patch=patch, action_text=action_text, action=action
+                ): resource
+                for resource, patch in patches.items()
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as exp:
+                    errors[futures[future]] = exp
 
-            if action == "replace":
-                if "metadata" not in patch:
-                    patch["metadata"] = {}
+        return errors
 
-                patch["metadata"]["name"] = resource.name
-                patch["metadata"]["namespace"] = resource.namespace
-                patch["metadata"]["resourceVersion"] = resource.instance.metadata.resourceVersion
-                patch["kind"] = resource.kind
-                patch["apiVersion"] = resource.api_version
+    @staticmethod
+    def _resource_key(resource: Any) -> str:
+        namespace = getattr(resource, "namespace", None)
+        return f"{resource.kind} {f'{namespace}/' if namespace else ''}{resource.name}"
 
-                resource.update_replace(resource_dict=patch)  # replace the resource metadata
+    @staticmethod
+    def _is_retryable(exp: Exception, exceptions_dict: dict[type[Exception], list[str]]) -> bool:
+        return any(
+            isinstance(exp, exception) and (not messages or any(message in str(exp) for message in messages))
+            for exception, messages in exceptions_dict.items()
+        )
 
-    def _apply_patches_sampler(self, patches: dict[Any, Any], action_text: str, action: str) -> ResourceInstance:
+    def _apply_patches_sampler(self, patches: dict[Any, Any], action_text: str, action: str) -> None:
         exceptions_dict: dict[type[Exception], list[str]] = {ConflictError: []}
         exceptions_dict.update(DEFAULT_CLUSTER_RETRY_EXCEPTIONS)
-        return Resource.retry_cluster_exceptions(
-            func=self._apply_patches,
-            exceptions_dict=exceptions_dict,
-            patches=patches,
-            action_text=action_text,
-            action=action,
+        # Patches not applied yet, a retry only applies the patches that failed
+        pending = dict(patches)
+        applied: list[str] = []
+        attempts = 0
+
+        def _apply_pending_patches() -> bool:
+            nonlocal attempts
+            attempts += 1
+            errors = self._apply_patches(
+                patches=pending, action_text=action_text, action=action, max_workers=self.max_workers
+            )
+            for resource in list(pending):
+                if resource not in errors:
+                    del pending[resource]
+                    applied.append(self._resource_key(resource=resource))
+
+            if errors:
+                retryable = all(self._is_retryable(exp=exp, exceptions_dict=exceptions_dict) for exp in errors.values())
+                raise (RetryableResourceEditorError if retryable else ResourceEditorError)(
+                    action=action_text.lower(),
+                    errors={self._resource_key(resource=resource): exp for resource, exp in errors.items()},
+                    applied=list(applied),
+                )
+
+            return True
+
+        Resource.retry_cluster_exceptions(
+            func=_apply_pending_patches,
+            exceptions_dict={RetryableResourceEditorError: []},
             timeout=TIMEOUT_30SEC,
             sleep_time=TIMEOUT_5SEC,
         )
+        LOGGER.info(f"ResourceEdits: {action_text} data done for {len(applied)} resource(s) in {attempts} attempt(s)")
+
+
+class _RateLimiter:
+    """
+    Spread calls from several threads to at most `rate` calls per second.
+    """
+
+    def __init__(self, rate: float) -> None:
+        self.interval = 1 / rate
+        self._next_slot = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+
+        if slot > now:
+            time.sleep(slot - now)
 
 
 class BaseResourceList(ABC):
@@ -1865,8 +2550,13 @@ class BaseResourceList(ABC):
 
     Provides common functionality for resource lists including context management,
     iteration, indexing, deployment, and cleanup operations.
+
+    Resources are deployed and cleaned up concurrently in tiers: consecutive resources of the same kind form a tier,
+    tiers are deployed in order and cleaned up in reverse order, and the resources of a tier run in parallel.
     """
 
+    max_workers: int = 10
+
     def __init__(self, client: DynamicClient) -> None:
         self.resources: list[Resource] = []
         self.client = client
@@ -1897,30 +2587,113 @@ class BaseResourceList(ABC):
         """Returns the number of resources in the list."""
         return len(self.resources)
 
-    def deploy(self, wait: bool = False) -> list[Resource | NamespacedResource]:
+    def deploy(
+        self, wait: bool = False, max_workers: int | None = None, requests_per_second: float | None = None
+    ) -> list[Resource | NamespacedResource]:
         """
         Deploys all resources in the list.
 
         Args:
             wait (bool): If True, wait for each resource to be ready.
+            max_workers (int | None): Number of resources deployed in parallel, defaults to `max_workers`.
+            requests_per_second (float | None): If set, limit the rate of deploy() calls.
 
         Returns:
             List[Any]: A list of the results from each resource's deploy() call.
-        """
-        return [resource.deploy(wait=wait) for resource in self.resources]
 
-    def clean_up(self, wait: bool = True) -> bool:
+        Raises:
+            ResourceListError: If any resource failed to deploy; later tiers are not deployed.
+        """
+        return self._run_in_tiers(
+            action="deploy",
+            func=lambda resource: resource.deploy(wait=wait),
+            reverse=False,
+            max_workers=max_workers or self.max_workers,
+            requests_per_second=requests_per_second,
+        )
+
+    def clean_up(
+        self, wait: bool = True, max_workers: int | None = None, requests_per_second: float | None = None
+    ) -> bool:
         """
         Deletes all resources in the list.
 
         Args:
             wait (bool): If True, wait for each resource to be deleted.
+            max_workers (int | None): Number of resources deleted in parallel, defaults to `max_workers`.
+            requests_per_second (float | None): If set, limit the rate of clean_up() calls.
 
         Returns:
             bool: Returns True if all resources are cleaned up correclty.
+
+        Raises:
+            ResourceListError: If any resource clean up raised; all tiers are still cleaned up.
         """
         # Deleting in reverse order to resolve dependencies correctly.
-        return all(resource.clean_up(wait=wait) for resource in reversed(self.resources))
+        return all(
+            self._run_in_tiers(
+                action="clean up",
+                func=lambda resource: resource.clean_up(wait=wait),
+                reverse=True,
+                max_workers=max_workers or self.max_workers,
+                requests_per_second=requests_per_second,
+                stop_on_error=False,
+            )
+        )
+
+    def _tiers(self) -> list[list[int]]:
+        """Group the indexes of consecutive resources of the same kind."""
+        tiers: list[list[int]] = []
+        for idx, resource in enumerate(self.resources):
+            if tiers and self.resources[tiers[-1][-1]].kind == resource.kind:
+                tiers[-1].append(idx)
+            else:
+                tiers.append([idx])
+
+        return tiers
+
+    def _run_in_tiers(
+        self,
+        action: str,
+        func: Callable[[Any], Any],
+        reverse: bool,
+        max_workers: int,
+        requests_per_second: float | None = None,
+        stop_on_error: bool = True,
+    ) -> list[Any]:
+        results: list[Any] = [None] * len(self.resources)
+        errors: dict[str, BaseException] = {}
+        rate_limiter = _RateLimiter(rate=requests_per_second) if requests_per_second else None
+
+        def _run(resource: Resource | NamespacedResource) -> Any:
+            if rate_limiter:
+                rate_limiter.acquire()
+
+            return func(resource)
+
+        tiers = self._tiers()
+        if reverse:
+            tiers = [list(reversed(tier)) for tier in reversed(tiers)]
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            for tier in tiers:
+                futures = {executor.submit(_run, self.resources[idx]): idx for idx in tier}
+                for future in as_completed(futures):
+                    idx = futures[future]
+                    try:
+                        results[idx] = future.result()
+                    except Exception as exp:
+                        resource = self.resources[idx]
+                        namespace = getattr(resource, "namespace", None)
+                        errors[f"{resource.kind} {f'{namespace}/' if namespace else ''}{resource.name}"] = exp
+
+                if errors and stop_on_error:
+                    break
+
+        if errors:
+            raise ResourceListError(action=action, errors=errors)
+
+        return results
 
     @abstractmethod
     def _create_resources(self, resource_class: Type, **kwargs: Any) -> None:
@@ -1,7 +1,11 @@
 """Utilities for archiving and extracting large schema files."""
 
 import gzip
+import hashlib
 import json
+import struct
+import zlib
+from collections.abc import Iterator, Mapping
 from pathlib import Path
 from typing import Any
 
@@ -9,6 +13,10 @@ from simple_logger.logger import get_logger
 
 LOGGER = get_logger(name=__name__)
 
+INDEX_FORMAT_VERSION: int = 1
+# Big-endian length of the JSON header at the start of an index file
+INDEX_HEADER_LENGTH = struct.Struct(">Q")
+
 
 def save_json_archive(data: dict[str, Any], json_file: Path) -> Path:
     """
@@ -50,3 +58,111 @@ def load_json_archive(json_file: Path) -> dict[str, Any]:
     LOGGER.info(f"Loading JSON from archive: {archive_file}")
     with gzip.open(archive_file, "rt", encoding="utf-8") as f:
         return json.load(f)
+
+
+def file_digest(file_path: Path) -> str:
+    """
+    Get the content digest of a file.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Hex digest of the file content
+    """
+    digest = hashlib.blake2b()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def save_json_index(data: dict[str, Any], index_file: Path, source_file: Path) -> Path:
+    """
+    Save JSON data as an index file holding one compressed blob per top-level key.
+
+    The file starts with a JSON header mapping each key to the offset and length of its blob, so a single key
+    can be read without decompressing the others. The header records the digest of `source_file`, the file the
+    data was saved to, to detect an index that is out of date.
+
+    Args:
+        data: JSON data to save
+        index_file: Path to the index file
+        source_file: Path to the file holding the same data (e.g. the .json.gz archive)
+
+    Returns:
+        Path to the created index file
+    """
+    entries: dict[str, list[int]] = {}
+    blobs: list[bytes] = []
+    offset = 0
+    for key in sorted(data):
+        blob = zlib.compress(json.dumps(data[key], sort_keys=True).encode("utf-8"))
+        entries[key] = [offset, len(blob)]
+        blobs.append(blob)
+        offset += len(blob)
+
+    header = json.dumps({
+        "version": INDEX_FORMAT_VERSION,
+        "source_digest": file_digest(file_path=source_file),
+        "entries": entries,
+    }).encode("utf-8")
+
+    with open(index_file, "wb") as f:
+        f.write(INDEX_HEADER_LENGTH.pack(len(header)))
+        f.write(header)
+        for blob in blobs:
+            f.write(blob)
+
+    LOGGER.info(f"Saved index: {index_file}")
+    return index_file
+
+
+class JsonIndex(Mapping):
+    """
+    Read-only mapping over an index file written by `save_json_index`.
+
+    Only the header is read when opening the index; each value is read and decompressed when accessed.
+    """
+
+    def __init__(self, index_file: Path, source_file: Path) -> None:
+        """
+        Open an index file.
+
+        Args:
+            index_file: Path to the index file
+            source_file: Path to the file the index was saved with
+
+        Raises:
+            OSError: If the index or source file can't be read
+            ValueError: If the index is invalid or out of date with the source file
+        """
+        self.index_file = index_file
+        with open(index_file, "rb") as f:
+            (header_length,) = INDEX_HEADER_LENGTH.unpack(f.read(INDEX_HEADER_LENGTH.size))
+            header = json.loads(f.read(header_length))
+
+        if header.get("version") != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported index version {header.get('version')} in {index_file}")
+
+        if header.get("source_digest") != file_digest(file_path=source_file):
+            raise ValueError(f"Index {index_file} is out of date with {source_file}")
+
+        self._entries: dict[str, list[int]] = header["entries"]
+        self._data_offset = INDEX_HEADER_LENGTH.size + header_length
+
+    def __getitem__(self, key: str) -> Any:
+        offset, length = self._entries[key]
+        with open(self.index_file, "rb") as f:
+            f.seek(self._data_offset + offset)
+            return json.loads(zlib.decompress(f.read(length)))
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -30,3 +30,11 @@ TIMEOUT_1MINUTE: int = 60
 TIMEOUT_2MINUTES: int = 2 * 60
 TIMEOUT_4MINUTES: int = 4 * 60
 TIMEOUT_10MINUTES: int = 10 * 60
+
+# Content types of the Resource.update patch types
+PATCH_CONTENT_TYPES: dict[str, str] = {
+    "merge": "application/merge-patch+json",
+    "strategic": "application/strategic-merge-patch+json",
+    "json": "application/json-patch+json",
+}
+DEFAULT_FIELD_MANAGER: str = "openshift-python-wrapper"
@@ -0,0 +1,326 @@
+"""Persistent API discovery cache shared by the DynamicClient instances of all processes on a host."""
+
+import contextlib
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections.abc import Generator
+from typing import Any
+
+import kubernetes
+from kubernetes.dynamic.discovery import CacheDecoder, CacheEncoder, Discoverer, ResourceGroup
+from kubernetes.dynamic.exceptions import NotFoundError, ResourceNotFoundError
+from simple_logger.logger import get_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows, the atomic cache file replace still keeps readers safe
+    fcntl = None  # type: ignore[assignment]
+
+LOGGER = get_logger(name=__name__)
+
+DISCOVERY_CACHE_DIR_ENV: str = "OPENSHIFT_PYTHON_WRAPPER_DISCOVERY_CACHE_DIR"
+DISCOVERY_CACHE_TTL_ENV: str = "OPENSHIFT_PYTHON_WRAPPER_DISCOVERY_CACHE_TTL"
+# Same as the kubectl discovery cache
+DEFAULT_DISCOVERY_CACHE_TTL: float = 6 * 60 * 60
+CACHE_FORMAT_VERSION: int = 1
+
+
+def get_discovery_cache_dir() -> str:
+    """Get the discovery cache directory, from the environment or the user cache directory."""
+    return os.environ.get(DISCOVERY_CACHE_DIR_ENV) or os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "openshift-python-wrapper", "discovery"
+    )
+
+
+def get_discovery_cache_ttl() -> float:
+    """Get the discovery cache TTL in seconds, from the environment or the default."""
+    ttl = os.environ.get(DISCOVERY_CACHE_TTL_ENV)
+    return float(ttl) if ttl else DEFAULT_DISCOVERY_CACHE_TTL
+
+
+class CachedDiscoverer(Discoverer):
+    """
+    Lazy discoverer with a persistent cache file per server URL and cluster version.
+
+    Each DynamicClient using the kubernetes default discoverer lists all API groups on creation, and any lookup miss
+    drops the whole cache. This discoverer:
+
+    - Keeps the cache in a gzip JSON file under `cache_dir`, keyed by the server URL and the cluster version, so a
+      cluster upgrade starts a new cache. The file is used for `ttl` seconds after the API groups were listed.
+    - Writes the file atomically under a file lock, merging the group versions other processes discovered meanwhile,
+      so parallel workers (e.g. pytest-xdist) share one cache.
+    - On a lookup miss, lists the API groups again and only fetches the missed group version, keeping the resources
+      of all other group versions.
+
+    Like the kubernetes LazyDiscoverer, the resources of a group version are fetched on its first lookup. The lookup
+    is implemented here since LazyDiscoverer keeps it private.
+
+    Use with `kubernetes.dynamic.DynamicClient(client=..., discoverer=CachedDiscoverer)`, or through `get_client`.
+
+    Args:
+        client (DynamicClient): Client the discoverer belongs to.
+        cache_file (str | None): Cache file path, defaults to a file per server URL and cluster version in `cache_dir`.
+        cache_dir (str | None): Cache directory, see `get_discovery_cache_dir`.
+        ttl (float | None): Seconds the cache is used after the API groups were listed, see `get_discovery_cache_ttl`.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        cache_file: str | None = None,
+        cache_dir: str | None = None,
+        ttl: float | None = None,
+    ) -> None:
+        # Discoverer.__init__ loads the kubernetes default cache file, the cache is loaded here instead
+        self.client = client
+        self.ttl = get_discovery_cache_ttl() if ttl is None else ttl
+        self._cache_dir = cache_dir or get_discovery_cache_dir()
+        self._cache: dict[str, Any] = self._new_cache()
+        self._resources: dict[str, Any] = {}
+        self._update_cache = False
+
+        self._load_server_info()
+        self._custom_cache_file = cache_file
+        self._cache_file = cache_file or self._default_cache_file()
+        cached = self._read_cache()
+        if cached:
+            self._cache = cached
+        self.discover()
+
+    @property
+    def cache_file(self) -> str:
+        return self._cache_file
+
+    def _new_cache(self) -> dict[str, Any]:
+        return {"library_version": kubernetes.__version__, "format_version": CACHE_FORMAT_VERSION}
+
+    def _default_cache_file(self) -> str:
+        cluster_version = self._cache["version"]["kubernetes"].get("gitVersion", "")
+        cache_id = hashlib.sha256(f"{self.client.configuration.host}|{cluster_version}".encode()).hexdigest()
+        return os.path.join(self._cache_dir, f"{cache_id[:32]}.json.gz")
+
+    def _read_cache(self) -> dict[str, Any] | None:
+        """Read the cache file, None when it is missing, expired, or written by another kubernetes version."""
+        try:
+            with gzip.open(self._cache_file, "rt") as fd:
+                cache = json.load(fd, object_hook=CacheDecoder(self.client).object_hook)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError, KeyError, TypeError) as ex:
+            LOGGER.warning(f"Ignoring unreadable discovery cache {self._cache_file}: {ex}")
+            return None
+
+        if (
+            cache.get("library_version") != kubernetes.__version__
+            or cache.get("format_version") != CACHE_FORMAT_VERSION
+            or time.time() - cache.get("discovered_at", 0) >= self.ttl
+        ):
+            return None
+
+        return cache
+
+    @contextlib.contextmanager
+    def _locked(self) -> Generator[None, None, None]:
+        with open(f"{self._cache_file}.lock", "a") as lock_fd:
+            if fcntl:
+                fcntl.flock(lock_fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_fd, fcntl.LOCK_UN)
+
+    def _merge_cache(self, cached: dict[str, Any]) -> None:
+        """Take the resources of the group versions this discoverer did not fetch yet from `cached`."""
+        for prefix, groups in self._cache.get("resources", {}).items():
+            for group, versions in groups.items():
+                for version, resource_group in versions.items():
+                    cached_group = cached.get("resources", {}).get(prefix, {}).get(group, {}).get(version)
+                    if not resource_group.resources and cached_group is not None and cached_group.resources:
+                        resource_group.resources = cached_group.resources
+
+    def _write_cache(self) -> None:
+        if not self.ttl:
+            return
+
+        try:
+            cache_dir = os.path.dirname(self._cache_file) or "."
+            os.makedirs(cache_dir, exist_ok=True)
+            with self._locked():
+                cached = self._read_cache()
+                if cached and cached["discovered_at"] > self._cache["discovered_at"]:
+                    # Another process discovered the cluster again meanwhile, its cache is newer
+                    return
+
+                if cached and cached["discovered_at"] == self._cache["discovered_at"]:
+                    self._merge_cache(cached=cached)
+
+                fd, tmp_file = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "wb") as raw_fd, gzip.open(raw_fd, "wt") as tmp_fd:
+                        json.dump(self._cache, tmp_fd, cls=CacheEncoder, separators=(",", ":"))
+                    os.replace(tmp_file, self._cache_file)
+                except BaseException:
+                    os.unlink(tmp_file)
+                    raise
+        except (OSError, TypeError, ValueError) as ex:
+            # Failing to write the cache only costs a discovery on the next client creation
+            LOGGER.warning(f"Failed to write discovery cache {self._cache_file}: {ex}")
+
+    def parse_api_groups(self, request_resources: bool = False, update: bool = False) -> dict[str, Any]:
+        # A refresh after a lookup miss (update) keeps the age of the resources of the other groups
+        if not self._cache.get("resources"):
+            self._cache["discovered_at"] = time.time()
+        return super().parse_api_groups(request_resources=request_resources, update=update)
+
+    def discover(self) -> None:
+        self._resources = self.parse_api_groups(request_resources=False)
+
+    def invalidate_cache(self) -> None:
+        """Discover the cluster again, dropping the cache file content."""
+        self._cache = self._new_cache()
+        self._load_server_info()
+        self._cache_file = self._custom_cache_file or self._default_cache_file()
+        self.discover()
+
+    @property
+    def api_groups(self) -> Any:
+        return self.parse_api_groups(request_resources=False, update=True)["apis"].keys()
+
+    def search(
+        self,
+        prefix: str | None = None,
+        group: str | None = None,
+        api_version: str | None = None,
+        kind: str | None = None,
+        **kwargs: Any,
+    ) -> list[Any]:
+        search_kwargs = {"prefix": prefix, "group": group, "api_version": api_version, "kind": kind, **kwargs}
+        try:
+            results = self._search(**search_kwargs)
+        except ResourceNotFoundError:
+            results = []
+
+        if not results:
+            self._refresh(**search_kwargs)
+            results = self._search(**search_kwargs)
+
+        self._maybe_write_cache()
+        return results
+
+    def __iter__(self) -> Generator[Any, None, None]:
+        for prefix, groups in self._resources.items():
+            for group, versions in groups.items():
+                for version, resource_group in versions.items():
+                    self._load_group_version(prefix=prefix, group=group, version=version, resource_group=resource_group)
+                    # Same as LazyDiscoverer, the resources of each kind are yielded as one list
+                    yield from resource_group.resources.values()
+
+        self._maybe_write_cache()
+
+    def _maybe_write_cache(self) -> None:
+        if self._update_cache:
+            self._write_cache()
+            self._update_cache = False
+
+    def _load_group_version(self, prefix: str, group: str, version: str, resource_group: ResourceGroup) -> None:
+        """Fetch the resources of a group version on its first lookup."""
+        if resource_group.resources:
+            return
+
+        try:
+            resource_group.resources = self.get_resources_for_api_version(
+                prefix, group, version, resource_group.preferred
+            )
+        except NotFoundError as ex:
+            raise ResourceNotFoundError from ex
+
+        self._cache["resources"][prefix][group][version] = resource_group
+        self._update_cache = True
+
+    def _search(
+        self,
+        prefix: str | None = None,
+        group: str | None = None,
+        api_version: str | None = None,
+        kind: str | None = None,
+        **kwargs: Any,
+    ) -> list[Any]:
+        if not group and api_version and "/" in api_version:
+            group, api_version = api_version.split("/")
+
+        return self._search_parts(
+            parts=[prefix or "*", group or "*", api_version or "*", kind or "*", kwargs or "*"],
+            resources=self._resources,
+            request_params=[],
+        )
+
+    def _search_parts(self, parts: list[Any], resources: dict[str, Any], request_params: list[str]) -> list[Any]:
+        """Walk the prefix / group / version / kind resources tree, `*` parts match any key."""
+        part = parts[0]
+        if part == "*":
+            matches = []
+            for key in resources:
+                matches.extend(
+                    self._search_parts(parts=[key, *parts[1:]], resources=resources, request_params=request_params)
+                )
+            return matches
+
+        resource_part = resources.get(part)
+        if not resource_part:
+            return []
+
+        if isinstance(resource_part, ResourceGroup):
+            if len(request_params) != 2:
+                raise ValueError(f"prefix and group params should be present, have {request_params}")
+
+            prefix, group = request_params
+            self._load_group_version(prefix=prefix, group=group, version=part, resource_group=resource_part)
+            return self._search_parts(parts=parts[1:], resources=resource_part.resources, request_params=request_params)
+
+        if isinstance(resource_part, dict):
+            # The prefix, group, or version of the next level
+            return self._search_parts(parts=parts[1:], resources=resource_part, request_params=[*request_params, part])
+
+        if isinstance(parts[1], dict):
+            # Resources of the kind, filtered by their attributes
+            for _resource in resource_part:
+                if any(getattr(_resource, term) == value for term, value in parts[1].items()):
+                    return [_resource]
+
+            return []
+
+        return resource_part
+
+    def _refresh(
+        self,
+        prefix: str | None = None,
+        group: str | None = None,
+        api_version: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Refresh the discovery after a lookup miss.
+
+        The API groups are listed again to find new groups and versions, and the resources of the searched group
+        version are fetched again. Other group versions keep their resources.
+        """
+        if not group and api_version and "/" in api_version:
+            group, api_version = api_version.split("/")
+
+        resources = self.parse_api_groups(request_resources=False, update=True)
+        if not api_version:
+            return
+
+        for _prefix, groups in resources.items():
+            resource_group = groups.get(group or "", {}).get(api_version)
+            # Group versions without resources are fetched on lookup, "apis" has no core group to fetch
+            if prefix in (None, _prefix) and resource_group is not None and resource_group.resources and group:
+                resource_group.resources = self.get_resources_for_api_version(
+                    _prefix, group, api_version, resource_group.preferred
+                )
+                self._update_cache = True
@@ -0,0 +1,464 @@
+"""List+watch informer keeping a local, indexed cache of cluster resources."""
+
+import threading
+from collections import defaultdict
+from typing import Any
+
+from kubernetes.client.rest import ApiException
+from kubernetes.dynamic.exceptions import GoneError
+from simple_logger.logger import get_logger
+from urllib3.exceptions import MaxRetryError, ProtocolError
+
+LOGGER = get_logger(name=__name__)
+
+# Field selectors that can be answered from the store indexes
+INDEXED_FIELDS: dict[str, str] = {
+    "metadata.name": "name",
+    "metadata.namespace": "namespace",
+    "spec.nodeName": "node_name",
+}
+
+
+def _parse_selector(selector: str | None, allow_exists: bool) -> list[tuple[str, str, str]]:
+    """
+    Parse an equality based selector into (key, operator, value) requirements.
+
+    Args:
+        selector (str | None): Selector, e.g. `app=web,tier!=db,canary,!legacy`.
+        allow_exists (bool): Whether bare `key` / `!key` terms are allowed (label selectors only).
+
+    Returns:
+        list: Parsed requirements; the `exists` and `!` operators have an empty value.
+
+    Raises:
+        ValueError: If the selector uses a syntax that the store cannot evaluate, e.g. set based (`in`, `notin`).
+    """
+    requirements: list[tuple[str, str, str]] = []
+    for term in filter(None, (_term.strip() for _term in (selector or "").split(","))):
+        if " in " in term or " notin " in term or "(" in term:
+            raise ValueError(f"Unsupported selector: {term}")
+
+        for operator in ("==", "!=", "="):
+            if operator in term:
+                key, value = term.split(operator, 1)
+                requirements.append((key.strip(), "!=" if operator == "!=" else "=", value.strip()))
+                break
+        else:
+            if not allow_exists:
+                raise ValueError(f"Unsupported selector: {term}")
+
+            if term.startswith("!"):
+                requirements.append((term[1:].strip(), "!", ""))
+            else:
+                requirements.append((term, "exists", ""))
+
+    return requirements
+
+
+def parse_selectors(
+    label_selector: str | None = None, field_selector: str | None = None
+) -> tuple[list[tuple[str, str, str]], list[tuple[str, str, str]]]:
+    """
+    Parse the label and field selectors a `ResourceStore` can evaluate.
+
+    Args:
+        label_selector (str | None): Equality based label selector, e.g. `app=web,tier!=db`.
+        field_selector (str | None): Field selector on `metadata.name`, `metadata.namespace` or `spec.nodeName`.
+
+    Returns:
+        tuple: The (key, operator, value) requirements of the label selector and of the field selector.
+
+    Raises:
+        ValueError: If a selector cannot be evaluated from the store.
+    """
+    label_requirements = _parse_selector(selector=label_selector, allow_exists=True)
+    field_requirements = _parse_selector(selector=field_selector, allow_exists=False)
+    for field, _, _ in field_requirements:
+        if field not in INDEXED_FIELDS:
+            raise ValueError(f"Unsupported field selector: {field}")
+
+    return label_requirements, field_requirements
+
+
+class ResourceStore:
+    """
+    Thread-safe in-memory store of resource bodies with secondary indexes.
+
+    Objects are keyed by (namespace, name) and indexed by namespace, labels, owner UID and `spec.nodeName`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._objects: dict[tuple[str, str], Any] = {}
+        self._index_keys: dict[tuple[str, str], list[tuple[str, str]]] = {}
+        self._indexes: defaultdict[tuple[str, str], set[tuple[str, str]]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._objects)
+
+    @staticmethod
+    def _object_key(obj: Any) -> tuple[str, str]:
+        return obj.metadata.namespace or "", obj.metadata.name
+
+    @staticmethod
+    def _index_values(obj: Any) -> list[tuple[str, str]]:
+        body = obj.to_dict()
+        metadata = body.get("metadata", {})
+        index_values = [("namespace", metadata.get("namespace") or "")]
+        index_values.extend(("label", f"{key}={value}") for key, value in (metadata.get("labels") or {}).items())
+        index_values.extend(("label", key) for key in (metadata.get("labels") or {}))
+        index_values.extend(
+            ("owner", owner["uid"]) for owner in metadata.get("ownerReferences") or [] if "uid" in owner
+        )
+        if node_name := (body.get("spec") or {}).get("nodeName"):
+            index_values.append(("node_name", node_name))
+
+        return index_values
+
+    def _remove_locked(self, key: tuple[str, str]) -> None:
+        self._objects.pop(key, None)
+        for index_value in self._index_keys.pop(key, []):
+            self._indexes[index_value].discard(key)
+            if not self._indexes[index_value]:
+                del self._indexes[index_value]
+
+    def upsert(self, obj: Any) -> None:
+        """
+        Add or replace a resource body.
+
+        Args:
+            obj (ResourceField | ResourceInstance): Resource body.
+        """
+        key = self._object_key(obj=obj)
+        index_values = self._index_values(obj=obj)
+        with self._lock:
+            self._remove_locked(key=key)
+            self._objects[key] = obj
+            self._index_keys[key] = index_values
+            for index_value in index_values:
+                self._indexes[index_value].add(key)
+
+    def delete(self, obj: Any) -> None:
+        """
+        Remove a resource body.
+
+        Args:
+            obj (ResourceField | ResourceInstance): Resource body.
+        """
+        with self._lock:
+            self._remove_locked(key=self._object_key(obj=obj))
+
+    def replace(self, objects: list[Any]) -> None:
+        """
+        Replace the store content, e.g. after a (re)list.
+
+        Args:
+            objects (list): Resource bodies.
+        """
+        with self._lock:
+            self._objects.clear()
+            self._index_keys.clear()
+            self._indexes.clear()
+            for obj in objects:
+                self.upsert(obj=obj)
+
+    def get(self, name: str, namespace: str | None = None) -> Any:
+        """
+        Get a resource body.
+
+        Args:
+            name (str): Resource name.
+            namespace (str | None): Resource namespace, None for cluster scoped resources.
+
+        Returns:
+            ResourceField | ResourceInstance | None: Resource body, None if not in the store.
+        """
+        with self._lock:
+            return self._objects.get((namespace or "", name))
+
+    def list_resources(
+        self,
+        namespace: str | None = None,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+        owner_uid: str | None = None,
+    ) -> list[Any]:
+        """
+        List resource bodies matching the given filters.
+
+        Args:
+            namespace (str | None): Namespace to list from, None for all namespaces.
+            label_selector (str | None): Equality based label selector, e.g. `app=web,tier!=db`.
+            field_selector (str | None): Field selector on `metadata.name`, `metadata.namespace` or `spec.nodeName`.
+            owner_uid (str | None): UID of an owner reference.
+
+        Returns:
+            list: Matching resource bodies.
+
+        Raises:
+            ValueError: If a selector cannot be evaluated from the store.
+        """
+        label_requirements, field_requirements = parse_selectors(
+            label_selector=label_selector, field_selector=field_selector
+        )
+        with self._lock:
+            candidates: set[tuple[str, str]] | None = None
+
+            def _narrow(index_value: tuple[str, str]) -> None:
+                nonlocal candidates
+                keys = self._indexes.get(index_value, set())
+                candidates = set(keys) if candidates is None else candidates & keys
+
+            if namespace:
+                _narrow(index_value=("namespace", namespace))
+
+            if owner_uid:
+                _narrow(index_value=("owner", owner_uid))
+
+            for label, operator, value in label_requirements:
+                if operator == "=":
+                    _narrow(index_value=("label", f"{label}={value}"))
+                elif operator == "exists":
+                    _narrow(index_value=("label", label))
+
+            for field, operator, value in field_requirements:
+                if operator == "=" and field != "metadata.name":
+                    _narrow(index_value=(INDEXED_FIELDS[field], value))
+
+            keys = self._objects.keys() if candidates is None else candidates
+            results = []
+            for key in sorted(keys):
+                if not self._matches_negations(
+                    key=key, label_requirements=label_requirements, field_requirements=field_requirements
+                ):
+                    continue
+
+                results.append(self._objects[key])
+
+            return results
+
+    def _matches_negations(
+        self,
+        key: tuple[str, str],
+        label_requirements: list[tuple[str, str, str]],
+        field_requirements: list[tuple[str, str, str]],
+    ) -> bool:
+        index_values = set(self._index_keys[key])
+        for label, operator, value in label_requirements:
+            if operator == "!=" and ("label", f"{label}={value}") in index_values:
+                return False
+
+            if operator == "!" and ("label", label) in index_values:
+                return False
+
+        for field, operator, value in field_requirements:
+            if field == "metadata.name":
+                if (key[1] == value) != (operator == "="):
+                    return False
+
+            elif operator == "!=" and (INDEXED_FIELDS[field], value) in index_values:
+                return False
+
+        return True
+
+
+class Informer:
+    """
+    Keep a `ResourceStore` in sync with the cluster using list+watch (client-go informer pattern).
+
+    The initial LIST fills the store, then a background thread watches from the listed resourceVersion and applies
+    ADDED/MODIFIED/DELETED events. When the watch can't be resumed (e.g. 410 Gone) the resources are listed again.
+    The cache is only served while the informer is synced: after `stop()`, or if the watch thread dies, `get` and
+    `list_resources` stop answering so callers go to the server.
+    """
+
+    def __init__(self, resource_api: Any, kind: str, namespace: str | None = None, watch_timeout: int = 60) -> None:
+        """
+        Args:
+            resource_api (kubernetes.dynamic.Resource): API of the resource kind to cache.
+            kind (str): Resource kind, used in logs.
+            namespace (str | None): Namespace to cache, None for all namespaces.
+            watch_timeout (int): Server side timeout of each watch request.
+        """
+        self.resource_api = resource_api
+        self.kind = kind
+        self.namespace = namespace
+        self.watch_timeout = watch_timeout
+        self.store = ResourceStore()
+        self._resource_version: str | None = None
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._start_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def has_synced(self) -> bool:
+        return self._synced.is_set()
+
+    def start(self) -> "Informer":
+        """
+        List the resources and start watching them in the background.
+
+        Returns:
+            Informer: self, once the store holds the initial list.
+
+        Raises:
+            RuntimeError: If the informer was stopped and its watch thread did not exit yet.
+        """
+        with self._start_lock:
+            if self._thread and self._thread.is_alive():
+                if not self._stopped.is_set():
+                    return self
+
+                # The stopped thread exits once its current watch request returns
+                raise RuntimeError(f"Informer {self.kind} was stopped and its watch thread is still running")
+
+            self._stopped.clear()
+            self._relist()
+            self._thread = threading.Thread(
+                target=self._run, name=f"informer-{self.kind}-{self.namespace or 'all'}", daemon=True
+            )
+            self._thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop watching; the store keeps its last content.
+        """
+        self._stopped.set()
+        self._synced.clear()
+
+    def _relist(self) -> None:
+        response = self.resource_api.get(namespace=self.namespace)
+        self.store.replace(objects=list(response.items or []))
+        self._resource_version = response.metadata.resourceVersion
+        self._synced.set()
+
+    def _run(self) -> None:
+        try:
+            while not self._stopped.is_set():
+                try:
+                    self._watch()
+                    self._stopped.wait(timeout=1)
+
+                except (GoneError, ApiException, MaxRetryError, ProtocolError) as exp:
+                    LOGGER.warning(f"Informer {self.kind} watch failed, listing again: {exp}")
+                    self._relist_after_error()
+
+                except Exception as exp:
+                    # e.g. a malformed event; the store may have missed changes, list again
+                    LOGGER.error(f"Informer {self.kind} watch failed unexpectedly, listing again: {exp}")
+                    self._relist_after_error()
+        finally:
+            # A dead watch thread leaves a stale store, stop serving it
+            self._synced.clear()
+
+    def _relist_after_error(self) -> None:
+        self._stopped.wait(timeout=1)
+        if self._stopped.is_set():
+            return
+
+        try:
+            self._relist()
+        except (ApiException, MaxRetryError, ProtocolError) as list_exp:
+            LOGGER.warning(f"Informer {self.kind} list failed: {list_exp}")
+
+    def _watch(self) -> None:
+        for event in self.resource_api.watch(
+            namespace=self.namespace,
+            resource_version=self._resource_version,
+            timeout=self.watch_timeout,
+            allow_watch_bookmarks=True,
+        ):
+            if self._stopped.is_set():
+                return
+
+            event_type = event["type"]
+            if event_type == "ERROR":
+                raw_object = event.get("raw_object") or {}
+                raise ApiException(status=raw_object.get("code"), reason=raw_object.get("message"))
+
+            obj = event["object"]
+            if resource_version := obj.metadata.resourceVersion:
+                self._resource_version = resource_version
+
+            if event_type == "BOOKMARK":
+                continue
+
+            if event_type == "DELETED":
+                self.store.delete(obj=obj)
+            else:
+                self.store.upsert(obj=obj)
+
+    def get(self, name: str, namespace: str | None = None) -> Any:
+        """
+        Get a cached resource body.
+
+        Args:
+            name (str): Resource name.
+            namespace (str | None): Resource namespace.
+
+        Returns:
+            ResourceField | ResourceInstance | None: Cached body, None if not cached or the informer is not synced.
+        """
+        if not self.has_synced:
+            return None
+
+        return self.store.get(name=name, namespace=namespace)
+
+    def list_resources(self, **kwargs: Any) -> list[Any]:
+        """
+        List cached resource bodies, see `ResourceStore.list_resources` for the supported filters.
+
+        Returns:
+            list: Matching resource bodies.
+
+        Raises:
+            ValueError: If a selector cannot be evaluated from the store, or the informer is not synced.
+        """
+        if not self.has_synced:
+            raise ValueError(f"Informer {self.kind} is not synced")
+
+        return self.store.list_resources(**kwargs)
+
+
+_INFORMERS: dict[tuple[int, str, str, str], Informer] = {}
+_INFORMERS_LOCK = threading.Lock()
+
+
+def get_informer(client: Any, resource_api: Any, api_version: str, kind: str, namespace: str | None = None) -> Informer:
+    """
+    Get the shared, started informer of a (client, kind, namespace).
+
+    Args:
+        client (DynamicClient): Client the informer is bound to.
+        resource_api (kubernetes.dynamic.Resource): API of the resource kind to cache.
+        api_version (str): Resource api version, e.g. `apps/v1`.
+        kind (str): Resource kind.
+        namespace (str | None): Namespace to cache, None for all namespaces.
+
+    Returns:
+        Informer: Started informer.
+    """
+    # The informer references the client, so its id can't be reused while it is registered
+    key = (id(client), api_version, kind, namespace or "")
+    with _INFORMERS_LOCK:
+        informer = _INFORMERS.get(key)
+        if not informer:
+            informer = _INFORMERS[key] = Informer(resource_api=resource_api, kind=kind, namespace=namespace)
+
+    return informer.start()
+
+
+def stop_informers(client: Any = None) -> None:
+    """
+    Stop and forget shared informers.
+
+    Args:
+        client (DynamicClient | None): Only stop the informers of this client; all informers if None.
+    """
+    with _INFORMERS_LOCK:
+        for key in [_key for _key in _INFORMERS if client is None or _key[0] == id(client)]:
+            _INFORMERS.pop(key).stop()
@@ -0,0 +1,170 @@
+"""Shell session kept open in a Pod container to run many commands over one exec websocket."""
+
+from __future__ import annotations
+
+import re
+import shlex
+import uuid
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Self
+
+import kubernetes
+from timeout_sampler import TimeoutWatch
+
+from ocp_resources.exceptions import ExecOnPodError
+
+if TYPE_CHECKING:
+    from ocp_resources.pod import Pod
+
+STREAM_CLOSED_ERROR: str = "stream resp is closed"
+COMMAND_TIMEOUT_ERROR: str = "command timed out"
+
+
+class PodExecSession:
+    """
+    Run commands in one shell kept open in a Pod container.
+
+    `Pod.execute` opens a new exec websocket for each command. A session opens the websocket and the shell once,
+    and commands sent together with `execute_many` are pipelined: they are all written to the shell before their
+    output is read. Each command output is framed with a unique marker and its exit code on stdout and stderr.
+
+    Commands run in the session shell one after another, with stdin from /dev/null; `cd` and exported variables
+    persist between commands. The session opens on the first command, and is closed on exit when used as a context
+    manager.
+
+    Args:
+        pod (Pod): Pod to run the commands in.
+        container (str): Container name, defaults to the first container of the Pod.
+        shell (str): Shell to start in the container.
+
+    Example:
+        with pod.exec_session(container="compute") as session:
+            uptime, hostname = session.execute_many(commands=[["uptime"], ["hostname"]])
+    """
+
+    def __init__(self, pod: Pod, container: str = "", shell: str = "/bin/sh") -> None:
+        self.pod = pod
+        self.container = container
+        self.shell = shell
+        self._resp: Any = None
+        self._stdout = ""
+        self._stderr = ""
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        self.close()
+
+    @property
+    def is_open(self) -> bool:
+        return self._resp is not None and self._resp.is_open()
+
+    def open(self) -> None:
+        """Open the exec websocket and start the shell, if not open already."""
+        if self.is_open:
+            return
+
+        container, _ = self.pod._exec_metadata()
+        self.container = self.container or container
+        self._stdout = self._stderr = ""
+        self._resp = kubernetes.stream.stream(
+            api_method=self.pod._kube_v1_api.connect_get_namespaced_pod_exec,
+            name=self.pod.name,
+            namespace=self.pod.namespace,
+            command=[self.shell],
+            container=self.container,
+            stderr=True,
+            stdin=True,
+            stdout=True,
+            tty=False,
+            _preload_content=False,
+        )
+
+    def close(self) -> None:
+        """Close the shell and the exec websocket."""
+        if self._resp is not None:
+            self._resp.close()
+            self._resp = None
+
+    def execute(self, command: list[str], timeout: int = 60, ignore_rc: bool = False) -> str:
+        """
+        Run a command in the session shell.
+
+        Args:
+            command (list): Command to run.
+            timeout (int): Time to wait for the command.
+            ignore_rc (bool): If True ignore error rc from the shell and return out.
+
+        Returns:
+            str: Command output.
+
+        Raises:
+            ExecOnPodError: If the command failed.
+        """
+        return self.execute_many(commands=[command], timeout=timeout, ignore_rc=ignore_rc)[0]
+
+    def execute_many(self, commands: list[list[str]], timeout: int = 60, ignore_rc: bool = False) -> list[str]:
+        """
+        Run commands in the session shell, sending them all at once.
+
+        All the commands run, even when one of them fails.
+
+        Args:
+            commands (list): Commands to run.
+            timeout (int): Time to wait for all the commands.
+            ignore_rc (bool): If True ignore error rc from the shell and return out.
+
+        Returns:
+            list: The output of each command.
+
+        Raises:
+            ExecOnPodError: For the first command that failed. If the session broke or timed out, it is closed and
+                the next command opens a new one.
+        """
+        self.open()
+        _, node_name = self.pod._exec_metadata()
+        markers = [uuid.uuid4().hex for _ in commands]
+        script = ""
+        for command, marker in zip(commands, markers):
+            self.pod.logger.info(f"Execute {command} on {self.pod.name} ({node_name})")
+            script += f"{shlex.join(command)} </dev/null; printf '%s %d\\n' {marker} $?; printf '%s\\n' {marker} >&2\n"
+
+        self._resp.write_stdin(script)
+
+        timeout_watch = TimeoutWatch(timeout=timeout)
+        results = [
+            self._read_result(command=command, marker=marker, timeout_watch=timeout_watch)
+            for command, marker in zip(commands, markers)
+        ]
+
+        for command, (rc, out, err) in zip(commands, results):
+            if rc and not ignore_rc:
+                raise ExecOnPodError(command=command, rc=rc, out=out, err=err)
+
+        return [out for _, out, _ in results]
+
+    def _read_result(self, command: list[str], marker: str, timeout_watch: TimeoutWatch) -> tuple[int, str, str]:
+        """Read the (exit code, stdout, stderr) of the command framed by `marker`"""
+        rc_pattern = re.compile(rf"{marker} (\d+)\n")
+        stderr_marker = f"{marker}\n"
+        while not (rc_match := rc_pattern.search(self._stdout)) or stderr_marker not in self._stderr:
+            if not self.is_open:
+                self.close()
+                raise ExecOnPodError(command=command, rc=-1, out=self._stdout, err=STREAM_CLOSED_ERROR)
+
+            remaining = timeout_watch.remaining_time()
+            if remaining <= 0:
+                # The shell may still run the command, its output would mix with the next commands
+                self.close()
+                raise ExecOnPodError(command=command, rc=-1, out=self._stdout, err=COMMAND_TIMEOUT_ERROR)
+
+            self._resp.update(timeout=min(remaining, 2))
+            self._stdout += self._resp.read_channel(kubernetes.stream.ws_client.STDOUT_CHANNEL)
+            self._stderr += self._resp.read_channel(kubernetes.stream.ws_client.STDERR_CHANNEL)
+
+        out, self._stdout = self._stdout[: rc_match.start()], self._stdout[rc_match.end() :]
+        err, _, self._stderr = self._stderr.partition(stderr_marker)
+        return int(rc_match.group(1)), out, err
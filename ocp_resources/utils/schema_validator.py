@@ -5,14 +5,22 @@ the Resource class and the fake Kubernetes client.
 """
 
 import json
+import threading
+from collections.abc import Mapping
 from typing import Any
 
 import jsonschema
 from simple_logger.logger import get_logger
 
-from class_generator.constants import RESOURCES_MAPPING_ARCHIVE, RESOURCES_MAPPING_FILE, DEFINITIONS_FILE
+from class_generator.constants import (
+    DEFINITIONS_FILE,
+    DEFINITIONS_INDEX,
+    RESOURCES_MAPPING_ARCHIVE,
+    RESOURCES_MAPPING_FILE,
+    RESOURCES_MAPPING_INDEX,
+)
 
-from .archive_utils import load_json_archive
+from .archive_utils import JsonIndex, load_json_archive
 
 LOGGER = get_logger(name=__name__)
 
@@ -22,8 +30,15 @@ class SchemaValidator:
 
     # Class-level caches shared across all instances
     _mappings_data: dict[str, Any] | None = None
-    _definitions_data: dict[str, Any] | None = None
+    _definitions_data: Mapping[str, Any] | None = None
+    _mappings_index: JsonIndex | None = None
     _schema_cache: dict[str, dict[str, Any]] = {}
+    _validator_cache: dict[str, Any] = {}
+    # Resolved definitions shared by all cached schemas, valid for the definitions data they were resolved from
+    _resolved_definitions: dict[str, Any] = {}
+    _resolved_definitions_source: Mapping[str, Any] | None = None
+    _resolving_definitions: set[str] = set()
+    _resolve_lock = threading.RLock()
 
     @classmethod
     def load_mappings_data(cls, skip_cache: bool = False) -> bool:
@@ -37,6 +52,9 @@ class SchemaValidator:
             if not skip_cache:
                 return True
 
+        if skip_cache:
+            cls._mappings_index = None
+
         # Load mappings from archive
         if RESOURCES_MAPPING_ARCHIVE.exists():
             try:
@@ -64,6 +82,50 @@ class SchemaValidator:
 
         return True
 
+    @classmethod
+    def load_indexes(cls) -> bool:
+        """
+        Open the per-kind indexes of the mappings and definitions files.
+
+        Schemas and definitions are then read one kind at a time instead of loading the whole files.
+
+        Returns:
+            bool: True if both indexes exist and are up to date with their files, False otherwise
+        """
+        if cls._mappings_index is not None:
+            return True
+
+        try:
+            mappings_index = JsonIndex(index_file=RESOURCES_MAPPING_INDEX, source_file=RESOURCES_MAPPING_ARCHIVE)
+            definitions_index = JsonIndex(index_file=DEFINITIONS_INDEX, source_file=DEFINITIONS_FILE)
+        except (OSError, ValueError) as e:
+            LOGGER.debug(f"Schema indexes not usable, loading the full schema files: {e}")
+            return False
+
+        cls._mappings_index = mappings_index
+        if cls._definitions_data is None:
+            cls._definitions_data = definitions_index
+
+        return True
+
+    @classmethod
+    def get_mappings_source(cls) -> Mapping[str, Any] | None:
+        """
+        Get the resource mappings to read single kinds from.
+
+        Kinds are read one at a time from the index if available, else the mappings and definitions files are loaded.
+
+        Returns:
+            Mapping[str, Any] | None: The mappings index or data, None if not loaded
+        """
+        if cls._mappings_data is None and cls.load_indexes():
+            return cls._mappings_index
+
+        if cls.load_mappings_data():
+            return cls._mappings_data
+
+        return None
+
     @classmethod
     def get_mappings_data(cls, skip_cache: bool = False) -> dict[str, Any] | None:
         """
@@ -81,7 +143,7 @@ class SchemaValidator:
         return cls._mappings_data
 
     @classmethod
-    def get_definitions_data(cls) -> dict[str, Any] | None:
+    def get_definitions_data(cls) -> Mapping[str, Any] | None:
         """
         Get the resource definitions data.
 
@@ -89,7 +151,7 @@ class SchemaValidator:
         encapsulation. It ensures the data is loaded before returning.
 
         Returns:
-            dict[str, Any] | None: The definitions data or None if not loaded
+            Mapping[str, Any] | None: The definitions data or None if not loaded
         """
         # Ensure data is loaded
         if cls._definitions_data is None:
@@ -113,17 +175,15 @@ class SchemaValidator:
         if cache_key in cls._schema_cache:
             return cls._schema_cache[cache_key]
 
-        # Load the mappings and definitions files if not already loaded
-        if not cls.load_mappings_data():
-            return None
+        mappings_data = cls.get_mappings_source()
 
-        # Type guard - after load_mappings_data() succeeds, these cannot be None
-        if cls._mappings_data is None or cls._definitions_data is None:
+        # Type guard - after loading succeeds, these cannot be None
+        if mappings_data is None or cls._definitions_data is None:
             return None
 
         # Look up schema by lowercase kind
         kind_lower = kind.lower()
-        schemas = cls._mappings_data.get(kind_lower)
+        schemas = mappings_data.get(kind_lower)
 
         if not schemas or not isinstance(schemas, list) or len(schemas) == 0:
             LOGGER.warning(f"No schema found for {kind} (looked up as '{kind_lower}')")
@@ -160,7 +220,8 @@ class SchemaValidator:
             )
 
             # Resolve all $ref in the schema
-            resolved_schema = cls._resolve_refs(schema, resolver)
+            with cls._resolve_lock:
+                resolved_schema = cls._resolve_refs(schema, resolver)
 
             # Cache the resolved schema
             cls._schema_cache[cache_key] = resolved_schema
@@ -213,7 +274,7 @@ class SchemaValidator:
                         for key in possible_keys:
                             if key in cls._definitions_data:
                                 # Return the resolved definition (and resolve any refs within it)
-                                return cls._resolve_refs(cls._definitions_data[key], resolver)
+                                return cls._resolve_definition(key=key, resolver=resolver)
 
                         LOGGER.warning(f"Definition not found: {definition_name} (tried {possible_keys})")
                         # For core Kubernetes types that are missing, return a basic object schema
@@ -241,6 +302,45 @@ class SchemaValidator:
         else:
             return obj
 
+    @classmethod
+    def _resolve_definition(cls, key: str, resolver: Any) -> Any:
+        """
+        Resolve a definition once and share the result between all schemas referencing it.
+
+        Resolved schemas are read-only: a definition such as ObjectMeta is the same object in every schema.
+        A definition referencing itself (e.g. JSONSchemaProps) accepts any value at the recursion point.
+
+        Args:
+            key: The definition key in the definitions data
+            resolver: jsonschema RefResolver instance
+
+        Returns:
+            The resolved definition
+        """
+        if cls._resolved_definitions_source is not cls._definitions_data:
+            cls._resolved_definitions = {}
+            cls._resolved_definitions_source = cls._definitions_data
+
+        if key in cls._resolved_definitions:
+            return cls._resolved_definitions[key]
+
+        if key in cls._resolving_definitions:
+            LOGGER.debug(f"Recursive definition {key}, not resolving it further")
+            return {}
+
+        # Type guard for mypy
+        if cls._definitions_data is None:
+            return {}
+
+        cls._resolving_definitions.add(key)
+        try:
+            resolved = cls._resolve_refs(cls._definitions_data[key], resolver)
+        finally:
+            cls._resolving_definitions.discard(key)
+
+        cls._resolved_definitions[key] = resolved
+        return resolved
+
     @classmethod
     def validate(cls, resource_dict: dict[str, Any], kind: str, api_group: str | None = None) -> None:
         """
@@ -254,16 +354,43 @@ class SchemaValidator:
         Raises:
             jsonschema.ValidationError: If validation fails
         """
-        schema = cls.load_schema(kind=kind, api_group=api_group)
-        if not schema:
+        validator = cls.get_validator(kind=kind, api_group=api_group)
+        if not validator:
             LOGGER.debug(f"No schema found for {kind}, skipping validation")
             return
 
-        try:
-            jsonschema.validate(instance=resource_dict, schema=schema)
-        except jsonschema.ValidationError:
-            # Re-raise as-is so caller can format the error
-            raise
+        # Same error selection as jsonschema.validate, without re-checking the schema on every call
+        error = jsonschema.exceptions.best_match(validator.iter_errors(resource_dict))
+        if error is not None:
+            raise error
+
+    @classmethod
+    def get_validator(cls, kind: str, api_group: str | None = None) -> Any:
+        """
+        Get the compiled validator of a resource kind's schema.
+
+        The validator class matching the schema draft is picked and the schema itself is checked once,
+        then the validator is cached per (api_group, kind) for as long as its schema stays cached.
+
+        Args:
+            kind: The resource kind (e.g., "Pod", "Deployment")
+            api_group: Optional API group to disambiguate resources with same kind
+
+        Returns:
+            jsonschema validator instance or None if no schema found
+        """
+        schema = cls.load_schema(kind=kind, api_group=api_group)
+        if not schema:
+            return None
+
+        cache_key = f"{api_group}:{kind}" if api_group else kind
+        validator = cls._validator_cache.get(cache_key)
+        if validator is None or validator.schema is not schema:
+            validator_class = jsonschema.validators.validator_for(schema)
+            validator_class.check_schema(schema)
+            validator = cls._validator_cache[cache_key] = validator_class(schema)
+
+        return validator
 
     @classmethod
     def format_validation_error(
@@ -320,8 +447,12 @@ class SchemaValidator:
     def clear_cache(cls) -> None:
         """Clear the schema cache (useful for testing).
 
-        This only clears the _schema_cache which contains resolved schemas.
+        This only clears the _schema_cache which contains resolved schemas, the definitions they share and the
+        validators compiled from them.
         It does not clear _mappings_data or _definitions_data which are
         loaded from files.
         """
         cls._schema_cache.clear()
+        cls._validator_cache.clear()
+        cls._resolved_definitions = {}
+        cls._resolved_definitions_source = None
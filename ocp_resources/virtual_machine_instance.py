@@ -10,6 +10,9 @@ from ocp_resources.pod import Pod
 from ocp_resources.resource import NamespacedResource
 from ocp_resources.utils.constants import PROTOCOL_ERROR_EXCEPTION_DICT, TIMEOUT_4MINUTES, TIMEOUT_5SEC, TIMEOUT_30SEC
 
+# Seconds the listed Virt Launcher Pod body is served by its `instance`, enough to read its uid without a GET
+VIRT_LAUNCHER_POD_SNAPSHOT_TTL: int = 1
+
 
 class VirtualMachineInstance(NamespacedResource):
     """
@@ -76,11 +79,23 @@ class VirtualMachineInstance(NamespacedResource):
 
     @property
     def virt_launcher_pod(self):
+        return self._get_virt_launcher_pod()[0]
+
+    def _get_virt_launcher_pod(self):
+        """
+        Get the Virt Launcher Pod and its (name, uid) from the list.
+
+        The same Pod object is returned while the same Pod runs the VMI, so its exec metadata stays cached.
+
+        Returns:
+            tuple: (Pod, (name, uid)), (None, None) if the migration target Pod is not listed.
+        """
         pods = list(
             Pod.get(
                 dyn_client=self.client,
                 namespace=self.namespace,
                 label_selector=f"kubevirt.io=virt-launcher,kubevirt.io/created-by={self.instance.metadata.uid}",
+                instance_snapshot_ttl=VIRT_LAUNCHER_POD_SNAPSHOT_TTL,
             )
         )
         if not pods:
@@ -90,11 +105,14 @@ class VirtualMachineInstance(NamespacedResource):
         if migration_state:
             #  After VM migration there are two pods, one in Completed status and one in Running status.
             #  We need to return the Pod that is not in Completed status.
-            for pod in pods:
-                if migration_state.targetPod == pod.name:
-                    return pod
-        else:
-            return pods[0]
+            pods = [pod for pod in pods if migration_state.targetPod == pod.name]
+            if not pods:
+                return None, None
+
+        # The uid is read from the listed Pod body, without a GET
+        pod_key = (pods[0].name, pods[0].instance.metadata.uid)
+        launcher_pods = self.__dict__.setdefault("_virt_launcher_pods", {})
+        return launcher_pods.setdefault(pod_key, pods[0]), pod_key
 
     @property
     def virt_handler_pod(self):
@@ -131,7 +149,7 @@ class VirtualMachineInstance(NamespacedResource):
                 virt_pod = self.virt_launcher_pod
                 self.logger.error(f"Status of virt-launcher pod {virt_pod.name}: {virt_pod.status}")
                 self.logger.debug(f"{virt_pod.name} *****LOGS*****")
-                self.logger.debug(virt_pod.log(container="compute"))
+                self.logger.debug(virt_pod.tail_log(container="compute"))
             except ResourceNotFoundError as virt_pod_ex:
                 self.logger.error(virt_pod_ex)
                 raise sampler_ex
@@ -202,10 +220,13 @@ class VirtualMachineInstance(NamespacedResource):
         )
 
     def virsh_cmd(self, action):
-        return shlex.split(
-            f"virsh {self.virt_launcher_pod_hypervisor_connection_uri} {action} {self.namespace}_{self.name}"
+        return self._virsh_cmd(
+            action=action, hypervisor_connection_uri=self.virt_launcher_pod_hypervisor_connection_uri
         )
 
+    def _virsh_cmd(self, action, hypervisor_connection_uri):
+        return shlex.split(f"virsh {hypervisor_connection_uri} {action} {self.namespace}_{self.name}")
+
     def get_xml(self):
         """
         Get virtual machine instance XML
@@ -246,18 +267,35 @@ class VirtualMachineInstance(NamespacedResource):
         Returns:
             String: Hypervisor Connection URI
         """
-        if self.is_virt_launcher_pod_root:
-            hypervisor_connection_uri = ""
-        else:
-            virtqemud_socket = "virtqemud"
-            socket = (
-                virtqemud_socket
-                if virtqemud_socket
-                in self.virt_launcher_pod.execute(command=["ls", "/var/run/libvirt/"], container="compute")
-                else "libvirt"
-            )
-            hypervisor_connection_uri = f"-c qemu+unix:///session?socket=/var/run/libvirt/{socket}-sock"
-        return hypervisor_connection_uri
+        pod, pod_key = self._get_virt_launcher_pod()
+        with pod.exec_session(container="compute") as session:
+            return self._hypervisor_connection_uri(pod_key=pod_key, session=session)
+
+    def _hypervisor_connection_uri(self, pod_key, session):
+        """
+        Get the Hypervisor Connection URI of a Virt Launcher Pod, cached per Pod.
+
+        Args:
+            pod_key (tuple): (name, uid) of the Virt Launcher Pod.
+            session (PodExecSession): Session in the Pod compute container, used to find the libvirt socket.
+
+        Returns:
+            String: Hypervisor Connection URI
+        """
+        uris = self.__dict__.setdefault("_hypervisor_connection_uris", {})
+        if pod_key not in uris:
+            if self.is_virt_launcher_pod_root:
+                uris[pod_key] = ""
+            else:
+                virtqemud_socket = "virtqemud"
+                socket = (
+                    virtqemud_socket
+                    if virtqemud_socket in session.execute(command=["ls", "/var/run/libvirt/"])
+                    else "libvirt"
+                )
+                uris[pod_key] = f"-c qemu+unix:///session?socket=/var/run/libvirt/{socket}-sock"
+
+        return uris[pod_key]
 
     def get_domstate(self):
         """
@@ -321,7 +359,24 @@ class VirtualMachineInstance(NamespacedResource):
         return iface_ip[0] if iface_ip else None
 
     def execute_virsh_command(self, command):
-        return self.virt_launcher_pod.execute(
-            command=self.virsh_cmd(action=command),
-            container="compute",
-        )
+        return self.execute_virsh_commands(commands=[command])[0]
+
+    def execute_virsh_commands(self, commands):
+        """
+        Run virsh commands on the virtual machine instance domain, over one exec session in the Virt Launcher Pod.
+
+        Args:
+            commands (list): virsh actions, e.g. ["domstate", "dommemstat"].
+
+        Returns:
+            list: The output of each command.
+        """
+        pod, pod_key = self._get_virt_launcher_pod()
+        with pod.exec_session(container="compute") as session:
+            hypervisor_connection_uri = self._hypervisor_connection_uri(pod_key=pod_key, session=session)
+            return session.execute_many(
+                commands=[
+                    self._virsh_cmd(action=command, hypervisor_connection_uri=hypervisor_connection_uri)
+                    for command in commands
+                ]
+            )
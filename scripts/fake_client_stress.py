@@ -0,0 +1,89 @@
+"""
+Stress benchmark for the fake Kubernetes client storage.
+
+Hammers one FakeDynamicClient from many threads with creates, patches, compare-and-swap replaces, selector lists
+and deletes, then checks that no update was lost.
+
+Usage: python scripts/fake_client_stress.py [--threads 16] [--objects 200] [--namespaces 4]
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from fake_kubernetes_client.dynamic_client import FakeDynamicClient
+from fake_kubernetes_client.event_recorder import FakeEventRecorder
+from fake_kubernetes_client.exceptions import ConflictError
+
+SHARED_NAME: str = "shared"
+SHARED_NAMESPACE: str = "stress-0"
+
+
+def worker(api: Any, worker_id: int, objects: int, namespaces: int) -> int:
+    """Run one worker, returns the number of API operations it made"""
+    operations = 0
+    namespace = f"stress-{worker_id % namespaces}"
+    names = [f"obj-{worker_id}-{idx}" for idx in range(objects)]
+
+    for name in names:
+        api.create(namespace=namespace, body={"metadata": {"name": name, "labels": {"worker": str(worker_id)}}})
+        api.patch(name=name, namespace=namespace, body={"spec": {"step": 1}})
+        operations += 2
+
+        # Read-modify-write on the object all workers share, retried on resourceVersion conflicts
+        while True:
+            shared = api.get(name=SHARED_NAME, namespace=SHARED_NAMESPACE).to_dict()
+            shared["spec"]["counter"] += 1
+            operations += 2
+            try:
+                api.replace(name=SHARED_NAME, namespace=SHARED_NAMESPACE, body=shared)
+                break
+            except ConflictError:
+                continue
+
+    listed = api.get(namespace=namespace, label_selector=f"worker={worker_id}").items
+    operations += 1
+    if len(listed) != objects:
+        raise AssertionError(f"Worker {worker_id} listed {len(listed)} objects, expected {objects}")
+
+    for name in names:
+        api.delete(name=name, namespace=namespace)
+        operations += 1
+
+    return operations
+
+
+def main(threads: int, objects: int, namespaces: int) -> int:
+    client = FakeDynamicClient()
+    client.event_recorder = FakeEventRecorder(enabled=False)
+    client.register_resources(resources={"kind": "Stress", "api_version": "v1", "group": "stress.example.com"})
+    api = client.resources.get(api_version="stress.example.com/v1", kind="Stress")
+    api.create(namespace=SHARED_NAMESPACE, body={"metadata": {"name": SHARED_NAME}, "spec": {"counter": 0}})
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        futures = [
+            executor.submit(worker, api=api, worker_id=worker_id, objects=objects, namespaces=namespaces)
+            for worker_id in range(threads)
+        ]
+        operations = sum(future.result() for future in futures)
+    elapsed = time.perf_counter() - start
+
+    counter = api.get(name=SHARED_NAME, namespace=SHARED_NAMESPACE).spec.counter
+    leftovers = api.get().items
+    print(f"{operations} operations from {threads} threads in {elapsed:.2f}s ({operations / elapsed:.0f} ops/s)")
+    print(f"Shared counter: {counter} (expected {threads * objects}), objects left: {len(leftovers) - 1}")
+
+    return 0 if counter == threads * objects and len(leftovers) == 1 else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stress benchmark for the fake Kubernetes client")
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--objects", type=int, default=200, help="Objects created by each thread")
+    parser.add_argument("--namespaces", type=int, default=4)
+    args = parser.parse_args()
+
+    sys.exit(main(threads=args.threads, objects=args.objects, namespaces=args.namespaces))
@@ -0,0 +1,144 @@
+import functools
+import time
+from types import SimpleNamespace
+
+import pytest
+from kubernetes.dynamic import DynamicClient
+
+from ocp_resources.utils.discovery_cache import CachedDiscoverer
+
+HOST: str = "https://api.cluster.example.com:6443"
+
+
+class StubDynamicClient(DynamicClient):
+    """DynamicClient answering the discovery requests of a cluster with the given API groups"""
+
+    def __init__(self, cluster: "StubCluster", **kwargs) -> None:
+        self.cluster = cluster
+        super().__init__(client=SimpleNamespace(configuration=SimpleNamespace(host=HOST)), **kwargs)
+
+    def request(self, method, path, body=None, **params):
+        self.cluster.requests.append(path.strip("/"))
+        parts = path.strip("/").split("/")
+        if parts == ["version"]:
+            return params["serializer"](None, {"gitVersion": self.cluster.git_version})
+
+        if parts == ["apis"]:
+            return SimpleNamespace(
+                groups=[
+                    {
+                        "name": group,
+                        "versions": [{"version": version} for version in versions],
+                        "preferredVersion": {"version": next(iter(versions))},
+                    }
+                    for group, versions in self.cluster.groups.items()
+                    if group
+                ]
+            )
+
+        group, version = ("", parts[1]) if parts[0] == "api" else (parts[1], parts[2])
+        return SimpleNamespace(
+            resources=[
+                {"kind": kind, "name": f"{kind.lower()}s", "namespaced": True, "verbs": ["get"]}
+                for kind in self.cluster.groups.get(group, {}).get(version, [])
+            ]
+        )
+
+
+class StubCluster:
+    def __init__(self, groups: dict[str, dict[str, list[str]]], git_version: str = "v1.31.0") -> None:
+        # {group: {version: [kinds]}}, the core group is ""
+        self.groups = groups
+        self.git_version = git_version
+        self.requests: list[str] = []
+
+
+@pytest.fixture()
+def api_client():
+    return StubCluster(groups={"": {"v1": ["Pod"]}, "apps": {"v1": ["Deployment"]}, "batch": {"v1": ["Job"]}})
+
+
+def _dynamic_client(api_client, cache_dir, **kwargs):
+    return StubDynamicClient(
+        cluster=api_client, discoverer=functools.partial(CachedDiscoverer, cache_dir=str(cache_dir), **kwargs)
+    )
+
+
+class TestCachedDiscoverer:
+    def test_cache_shared_between_clients(self, api_client, tmp_path):
+        client = _dynamic_client(api_client=api_client, cache_dir=tmp_path)
+        assert client.resources.get(api_version="apps/v1", kind="Deployment").kind == "Deployment"
+        assert "apis/apps/v1" in api_client.requests
+
+        api_client.requests.clear()
+        other = _dynamic_client(api_client=api_client, cache_dir=tmp_path)
+        assert other.resources.get(api_version="apps/v1", kind="Deployment").kind == "Deployment"
+        assert api_client.requests == ["version"]
+
+    def test_cache_keyed_by_cluster_version(self, api_client, tmp_path):
+        client = _dynamic_client(api_client=api_client, cache_dir=tmp_path)
+        api_client.git_version = "v1.32.0"
+
+        assert _dynamic_client(api_client=api_client, cache_dir=tmp_path).resources.cache_file != (
+            client.resources.cache_file
+        )
+        assert "apis" in api_client.requests[api_client.requests.index("version", 1) :]
+
+    def test_cache_expired(self, api_client, tmp_path):
+        _dynamic_client(api_client=api_client, cache_dir=tmp_path, ttl=0.01)
+        time.sleep(0.02)
+
+        api_client.requests.clear()
+        _dynamic_client(api_client=api_client, cache_dir=tmp_path, ttl=0.01)
+        assert "apis" in api_client.requests
+
+    def test_miss_refreshes_only_the_missed_group(self, api_client, tmp_path):
+        client = _dynamic_client(api_client=api_client, cache_dir=tmp_path)
+        client.resources.get(api_version="apps/v1", kind="Deployment")
+        client.resources.get(api_version="batch/v1", kind="Job")
+
+        api_client.groups["batch"]["v1"].append("CronJob")
+        api_client.groups["example.com"] = {"v1": ["Widget"]}
+        api_client.requests.clear()
+
+        assert client.resources.get(api_version="batch/v1", kind="CronJob").kind == "CronJob"
+        assert client.resources.get(api_version="example.com/v1", kind="Widget").kind == "Widget"
+        assert client.resources.get(api_version="apps/v1", kind="Deployment").kind == "Deployment"
+        assert "apis/apps/v1" not in api_client.requests
+        assert "apis/batch/v1" in api_client.requests
+
+    def test_concurrent_writers_merge(self, api_client, tmp_path):
+        first = _dynamic_client(api_client=api_client, cache_dir=tmp_path)
+        second = _dynamic_client(api_client=api_client, cache_dir=tmp_path)
+        first.resources.get(api_version="apps/v1", kind="Deployment")
+        second.resources.get(api_version="batch/v1", kind="Job")
+
+        api_client.requests.clear()
+        third = _dynamic_client(api_client=api_client, cache_dir=tmp_path)
+        third.resources.get(api_version="apps/v1", kind="Deployment")
+        third.resources.get(api_version="batch/v1", kind="Job")
+        assert api_client.requests == ["version"]
+
+    def test_corrupt_cache_file(self, api_client, tmp_path):
+        client = _dynamic_client(api_client=api_client, cache_dir=tmp_path)
+        with open(client.resources.cache_file, "wb") as fd:
+            fd.write(b"not a cache")
+
+        api_client.requests.clear()
+        other = _dynamic_client(api_client=api_client, cache_dir=tmp_path)
+        assert other.resources.get(api_version="apps/v1", kind="Deployment").kind == "Deployment"
+        assert "apis" in api_client.requests
+
+    def test_search_by_name_and_iterate(self, api_client, tmp_path):
+        client = _dynamic_client(api_client=api_client, cache_dir=tmp_path)
+        assert "Job" in [resource.kind for resource in client.resources.search(name="jobs")]
+        assert {resource.kind for resources in client.resources for resource in resources} >= {
+            "Pod",
+            "Deployment",
+            "Job",
+        }
+
+        api_client.requests.clear()
+        other = _dynamic_client(api_client=api_client, cache_dir=tmp_path)
+        assert other.resources.get(api_version="v1", kind="Pod").kind == "Pod"
+        assert api_client.requests == ["version"]
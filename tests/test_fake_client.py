@@ -0,0 +1,767 @@
+import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from kubernetes.dynamic.exceptions import (
+    ConflictError,
+    GoneError,
+    InternalServerError,
+    TooManyRequestsError,
+    UnprocessibleEntityError,
+)
+
+from fake_kubernetes_client.cluster_profile import FakeClusterProfile
+from fake_kubernetes_client.dynamic_client import FakeDynamicClient
+from fake_kubernetes_client.event_recorder import FakeEventRecorder
+from fake_kubernetes_client.resource_field import FakeResourceField
+from fake_kubernetes_client.resource_registry import BuiltinResourceDefinitions
+from fake_kubernetes_client.resource_storage import FakeResourceStorage, freeze
+from fake_kubernetes_client.status_schema_parser import StatusSchemaParser
+from ocp_resources.resource import Resource
+from ocp_resources.utils.schema_validator import SchemaValidator
+
+RESOURCE_MAPPINGS: dict[str, list[dict]] = {
+    "pod": [{"namespaced": True, "x-kubernetes-group-version-kind": [{"group": "", "kind": "Pod", "version": "v1"}]}],
+    "deployment": [
+        {
+            "namespaced": True,
+            "x-kubernetes-group-version-kind": [{"group": "apps", "kind": "Deployment", "version": "v1"}],
+        }
+    ],
+}
+
+
+@pytest.fixture()
+def resource_mappings():
+    # A new mappings object makes the shared definitions rebuild from it
+    mappings = {kind: list(kind_mappings) for kind, kind_mappings in RESOURCE_MAPPINGS.items()}
+    with patch.object(SchemaValidator, "get_mappings_source", return_value=mappings):
+        yield mappings
+
+
+class TestFakeResourceRegistry:
+    def test_client_creation_does_not_load_mappings(self):
+        with patch.object(SchemaValidator, "load_mappings_data") as mock_load:
+            FakeDynamicClient()
+
+        mock_load.assert_not_called()
+
+    def test_definitions_built_per_kind(self, resource_mappings):
+        client = FakeDynamicClient()
+        assert client.resources.get(api_version="v1", kind="Pod").resource_def["kind"] == "Pod"
+        assert "pod" in BuiltinResourceDefinitions._loaded_kinds
+        assert "deployment" not in BuiltinResourceDefinitions._loaded_kinds
+        assert not BuiltinResourceDefinitions._fully_loaded
+
+    def test_create_does_not_load_mappings(self, resource_mappings):
+        client = FakeDynamicClient()
+        with (
+            patch.object(SchemaValidator, "_definitions_data", {}),
+            patch.object(SchemaValidator, "load_mappings_data") as mock_load,
+        ):
+            pod = client.resources.get(api_version="v1", kind="Pod").create(
+                namespace="default", body={"metadata": {"name": "pod-1"}, "spec": {"containers": [{"name": "c"}]}}
+            )
+
+        mock_load.assert_not_called()
+        assert pod.status.phase == "Running"
+
+    def test_definitions_shared_between_clients(self, resource_mappings):
+        first_client, second_client = FakeDynamicClient(), FakeDynamicClient()
+        first_definition = first_client.registry.get_resource_definition(kind="Deployment", api_version="apps/v1")
+        second_definition = second_client.registry.get_resource_definition(kind="Deployment", api_version="apps/v1")
+        assert first_definition is second_definition
+
+    def test_registered_resources_not_shared(self, resource_mappings):
+        first_client, second_client = FakeDynamicClient(), FakeDynamicClient()
+        first_client.register_resources(
+            resources={"kind": "MyApp", "api_version": "v1", "group": "example.com", "namespaced": True}
+        )
+        assert first_client.registry.get_resource_definitions(kind="MyApp")
+        assert not second_client.registry.get_resource_definitions(kind="MyApp")
+
+
+class TestFakeResourceStorage:
+    @pytest.fixture()
+    def storage(self):
+        _storage = FakeResourceStorage()
+        _storage.store_resource(
+            kind="Pod",
+            api_version="v1",
+            name="pod-1",
+            namespace="default",
+            resource={"metadata": {"name": "pod-1", "labels": {"app": "web"}}, "spec": {"containers": [{"name": "c"}]}},
+        )
+        return _storage
+
+    def test_reads_do_not_copy(self, storage):
+        resource = storage.get_resource(kind="Pod", api_version="v1", name="pod-1", namespace="default")
+        assert storage.get_resource(kind="Pod", api_version="v1", name="pod-1", namespace="default") is resource
+        assert storage.list_resources(kind="Pod", api_version="v1")[0] is resource
+
+    def test_snapshots_are_isolated(self, storage):
+        body = {"metadata": {"name": "pod-2", "labels": {}}}
+        storage.store_resource(kind="Pod", api_version="v1", name="pod-2", namespace="default", resource=body)
+        body["metadata"]["labels"]["app"] = "changed"
+
+        resource = storage.get_resource(kind="Pod", api_version="v1", name="pod-2", namespace="default")
+        assert resource["metadata"]["labels"] == {}
+        with pytest.raises(TypeError):
+            resource["metadata"]["labels"]["app"] = "changed"
+        with pytest.raises(TypeError):
+            resource["spec"] = {}
+
+    def test_copies_are_mutable(self, storage):
+        resource = storage.get_resource(kind="Pod", api_version="v1", name="pod-1", namespace="default")
+        resource_copy = copy.deepcopy(resource)
+        resource_copy["spec"]["containers"].append({"name": "d"})
+        assert type(resource_copy["spec"]["containers"]) is list
+        assert len(resource["spec"]["containers"]) == 1
+
+    def test_patch_shares_unchanged_parts(self):
+        client = FakeDynamicClient()
+        client.register_resources(resources={"kind": "MyApp", "api_version": "v1", "group": "example.com"})
+        api = client.resources.get(api_version="example.com/v1", kind="MyApp")
+        api.create(
+            namespace="default",
+            body={"metadata": {"name": "app-1"}, "spec": {"replicas": 1, "template": {"image": "a"}}},
+        )
+        existing = client.storage.get_resource(
+            kind="MyApp", api_version="example.com/v1", name="app-1", namespace="default"
+        )
+
+        api.patch(name="app-1", namespace="default", body={"spec": {"replicas": 2}})
+        patched = client.storage.get_resource(
+            kind="MyApp", api_version="example.com/v1", name="app-1", namespace="default"
+        )
+        assert patched["spec"]["replicas"] == 2
+        assert existing["spec"]["replicas"] == 1
+        assert patched["spec"]["template"] is existing["spec"]["template"]
+        assert patched["metadata"]["generation"] == 2
+
+
+class TestFakeWatch:
+    @pytest.fixture()
+    def myapp_api(self):
+        client = FakeDynamicClient()
+        client.storage = FakeResourceStorage(event_journal_size=5)
+        client.resources.storage = client.storage
+        client.register_resources(resources={"kind": "MyApp", "api_version": "v1", "group": "example.com"})
+        return client.resources.get(api_version="example.com/v1", kind="MyApp")
+
+    def test_resource_version_is_monotonic(self, myapp_api):
+        versions = [
+            int(
+                myapp_api.create(
+                    namespace="default", body={"metadata": {"name": f"app-{idx}"}}
+                ).metadata.resourceVersion
+            )
+            for idx in range(3)
+        ]
+        assert versions == sorted(set(versions))
+        assert myapp_api.get(namespace="default").metadata.resourceVersion == str(myapp_api.storage.resource_version)
+
+    def test_watch_from_resource_version(self, myapp_api):
+        created = myapp_api.create(namespace="default", body={"metadata": {"name": "app-1"}})
+        myapp_api.patch(name="app-1", namespace="default", body={"spec": {"replicas": 2}})
+        myapp_api.delete(name="app-1", namespace="default")
+
+        events = list(myapp_api.watch(namespace="default", resource_version=created.metadata.resourceVersion))
+        assert [event["type"] for event in events] == ["MODIFIED", "DELETED"]
+        assert events[0]["object"].spec.replicas == 2
+
+    def test_watch_blocks_for_new_events(self, myapp_api):
+        resource_version = myapp_api.get(namespace="default").metadata.resourceVersion
+        timer = threading.Timer(
+            interval=0.1,
+            function=myapp_api.create,
+            kwargs={"namespace": "default", "body": {"metadata": {"name": "app-late"}}},
+        )
+        timer.start()
+
+        events = myapp_api.watch(namespace="default", resource_version=resource_version, timeout=5)
+        event = next(events)
+        timer.join()
+        assert event["type"] == "ADDED"
+        assert event["object"].metadata.name == "app-late"
+
+    def test_watch_compacted_resource_version(self, myapp_api):
+        created = myapp_api.create(namespace="default", body={"metadata": {"name": "app-1"}})
+        for replicas in range(5):
+            myapp_api.patch(name="app-1", namespace="default", body={"spec": {"replicas": replicas}})
+
+        with pytest.raises(GoneError):
+            list(myapp_api.watch(namespace="default", resource_version=created.metadata.resourceVersion))
+
+
+class TestFakeSelectors:
+    @pytest.fixture()
+    def storage(self):
+        _storage = FakeResourceStorage()
+        for name, namespace, labels, phase in (
+            ("web-1", "ns-1", {"app": "web", "tier": "front"}, "Running"),
+            ("web-2", "ns-2", {"app": "web"}, "Pending"),
+            ("db-1", "ns-1", {"app": "db"}, "Running"),
+            ("cache-1", "ns-2", {}, "Running"),
+        ):
+            _storage.store_resource(
+                kind="Pod",
+                api_version="v1",
+                name=name,
+                namespace=namespace,
+                resource={
+                    "metadata": {"name": name, "namespace": namespace, "labels": labels},
+                    "status": {"phase": phase},
+                },
+            )
+        return _storage
+
+    def _list_names(self, storage, **kwargs):
+        return sorted(
+            resource["metadata"]["name"] for resource in storage.list_resources(kind="Pod", api_version="v1", **kwargs)
+        )
+
+    @pytest.mark.parametrize(
+        "label_selector, expected",
+        [
+            pytest.param("app=web", ["web-1", "web-2"], id="equals"),
+            pytest.param("app==db", ["db-1"], id="double-equals"),
+            pytest.param("app!=web", ["cache-1", "db-1"], id="not-equals"),
+            pytest.param("app in (web, db),tier notin (front)", ["db-1", "web-2"], id="in-notin"),
+            pytest.param("tier", ["web-1"], id="exists"),
+            pytest.param("!app", ["cache-1"], id="does-not-exist"),
+        ],
+    )
+    def test_label_selector(self, storage, label_selector, expected):
+        assert self._list_names(storage, label_selector=label_selector) == expected
+
+    def test_field_selector(self, storage):
+        assert self._list_names(storage, field_selector="status.phase!=Running") == ["web-2"]
+        assert self._list_names(storage, namespace="ns-1", field_selector="metadata.name==db-1") == ["db-1"]
+        assert self._list_names(storage, field_selector="metadata.name=web-2,status.phase=Running") == []
+
+    def test_label_index_follows_updates(self, storage):
+        storage.store_resource(
+            kind="Pod",
+            api_version="v1",
+            name="web-2",
+            namespace="ns-2",
+            resource={"metadata": {"name": "web-2", "labels": {"app": "db"}}},
+        )
+        storage.delete_resource(kind="Pod", api_version="v1", name="db-1", namespace="ns-1")
+        assert self._list_names(storage, label_selector="app=db") == ["web-2"]
+        assert self._list_names(storage, label_selector="app=web") == ["web-1"]
+
+    def test_invalid_selector(self, storage):
+        with pytest.raises(ValueError):
+            storage.list_resources(kind="Pod", api_version="v1", label_selector="app in web")
+
+
+class TestFakeEventRecorder:
+    @pytest.fixture()
+    def client(self):
+        _client = FakeDynamicClient()
+        _client.register_resources(resources={"kind": "MyApp", "api_version": "v1", "group": "example.com"})
+        return _client
+
+    def _create_and_patch(self, client, name, patches=0):
+        api = client.resources.get(api_version="example.com/v1", kind="MyApp")
+        api.create(namespace="default", body={"metadata": {"name": name}})
+        for replicas in range(patches):
+            api.patch(name=name, namespace="default", body={"spec": {"replicas": replicas}})
+
+    def _events(self, client):
+        return client.storage.list_resources(kind="Event", api_version="v1", namespace="default")
+
+    def test_repeated_events_aggregated(self, client):
+        self._create_and_patch(client=client, name="app-1", patches=3)
+        events = self._events(client=client)
+        assert sorted((event["reason"], event["count"]) for event in events) == [("Created", 1), ("Updated", 3)]
+
+    def test_disabled(self, client):
+        client.event_recorder = FakeEventRecorder(enabled=False)
+        self._create_and_patch(client=client, name="app-1", patches=1)
+        assert not self._events(client=client)
+
+    def test_sampled(self, client):
+        client.event_recorder = FakeEventRecorder(sample_rate=0)
+        self._create_and_patch(client=client, name="app-1")
+        assert not self._events(client=client)
+
+    def test_capped_per_namespace(self, client):
+        client.event_recorder = FakeEventRecorder(max_events_per_namespace=2)
+        for idx in range(4):
+            self._create_and_patch(client=client, name=f"app-{idx}")
+
+        events = self._events(client=client)
+        assert sorted(event["involvedObject"]["name"] for event in events) == ["app-2", "app-3"]
+
+    def test_ttl_expiry(self, client):
+        client.event_recorder = FakeEventRecorder(ttl_seconds=0)
+        for idx in range(3):
+            self._create_and_patch(client=client, name=f"app-{idx}")
+
+        assert [event["involvedObject"]["name"] for event in self._events(client=client)] == ["app-2"]
+
+
+class TestFakeConcurrency:
+    @pytest.fixture()
+    def myapp_api(self):
+        client = FakeDynamicClient()
+        client.event_recorder = FakeEventRecorder(enabled=False)
+        client.register_resources(resources={"kind": "MyApp", "api_version": "v1", "group": "example.com"})
+        return client.resources.get(api_version="example.com/v1", kind="MyApp")
+
+    def test_concurrent_create_conflicts(self, myapp_api):
+        def _create(_):
+            try:
+                myapp_api.create(namespace="default", body={"metadata": {"name": "app-1"}})
+                return True
+            except ConflictError:
+                return False
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            assert sorted(executor.map(_create, range(16))) == [False] * 15 + [True]
+
+    def test_concurrent_patches_not_lost(self, myapp_api):
+        myapp_api.create(namespace="default", body={"metadata": {"name": "app-1"}})
+
+        def _patch(replicas):
+            myapp_api.patch(name="app-1", namespace="default", body={"spec": {f"field-{replicas}": replicas}})
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(_patch, range(50)))
+
+        resource = myapp_api.get(name="app-1", namespace="default")
+        assert len(resource.spec) == 50
+        assert resource.metadata.generation == 51
+
+    def test_delete_during_patch_not_undone(self, myapp_api):
+        myapp_api.create(namespace="default", body={"metadata": {"name": "app-1"}})
+        storage = myapp_api.storage
+        get_resource, delete_resource = storage.get_resource, storage.delete_resource
+        patch_read, delete_done = threading.Event(), threading.Event()
+
+        def _get_resource(*args, **kwargs):
+            resource = get_resource(*args, **kwargs)
+            if threading.current_thread().name == "patcher" and not patch_read.is_set():
+                # Give the delete time to run between the patch read and store
+                patch_read.set()
+                delete_done.wait(timeout=0.5)
+            return resource
+
+        def _delete_resource(*args, **kwargs):
+            deleted = delete_resource(*args, **kwargs)
+            delete_done.set()
+            return deleted
+
+        with (
+            patch.object(storage, "get_resource", side_effect=_get_resource),
+            patch.object(storage, "delete_resource", side_effect=_delete_resource),
+        ):
+            patcher = threading.Thread(
+                name="patcher",
+                target=myapp_api.patch,
+                kwargs={"name": "app-1", "namespace": "default", "body": {"spec": {"replicas": 2}}},
+            )
+            patcher.start()
+            assert patch_read.wait(timeout=5)
+            myapp_api.delete(name="app-1", namespace="default")
+            patcher.join()
+
+        assert not storage.get_resource(kind="MyApp", api_version="example.com/v1", name="app-1", namespace="default")
+
+    def test_replace_compare_and_swap(self, myapp_api):
+        created = myapp_api.create(namespace="default", body={"metadata": {"name": "app-1"}}).to_dict()
+        myapp_api.replace(name="app-1", namespace="default", body=copy.deepcopy(created))
+
+        with pytest.raises(ConflictError):
+            myapp_api.replace(name="app-1", namespace="default", body=created)
+        with pytest.raises(ConflictError):
+            myapp_api.patch(name="app-1", namespace="default", body={"metadata": created["metadata"]})
+
+
+class TestFakeSnapshot:
+    @pytest.fixture()
+    def client(self):
+        client = FakeDynamicClient()
+        client.event_recorder = FakeEventRecorder(enabled=False)
+        client.register_resources(resources={"kind": "MyApp", "api_version": "v1", "group": "example.com"})
+        return client
+
+    @pytest.fixture()
+    def snapshot_path(self, client, tmp_path):
+        api = client.resources.get(api_version="example.com/v1", kind="MyApp")
+        for idx in range(3):
+            api.create(namespace="default", body={"metadata": {"name": f"app-{idx}", "labels": {"idx": str(idx)}}})
+        api.patch(name="app-0", namespace="default", body={"spec": {"replicas": 2}})
+        return client.save_snapshot(path=tmp_path / "cluster.json.gz")
+
+    def test_round_trip(self, client, snapshot_path):
+        loaded = FakeDynamicClient.from_snapshot(path=snapshot_path)
+        api = loaded.resources.get(api_version="example.com/v1", kind="MyApp")
+
+        assert loaded.storage.resource_version == client.storage.resource_version
+        assert api.get(name="app-0", namespace="default").spec.replicas == 2
+        assert [item.metadata.name for item in api.get(namespace="default", label_selector="idx=1").items] == ["app-1"]
+
+    def test_writes_continue_resource_version(self, client, snapshot_path):
+        loaded = FakeDynamicClient.from_snapshot(path=snapshot_path)
+        api = loaded.resources.get(api_version="example.com/v1", kind="MyApp")
+        created = api.create(namespace="default", body={"metadata": {"name": "app-3"}})
+
+        assert int(created.metadata.resourceVersion) == client.storage.resource_version + 1
+
+    def test_watch_before_snapshot_is_gone(self, snapshot_path):
+        loaded = FakeDynamicClient.from_snapshot(path=snapshot_path)
+        api = loaded.resources.get(api_version="example.com/v1", kind="MyApp")
+
+        with pytest.raises(GoneError):
+            list(api.watch(namespace="default", resource_version="1"))
+
+    def test_load_into_client_with_registered_resources(self, client, snapshot_path):
+        client.load_snapshot(path=snapshot_path)
+
+        assert len(client.registry.get_registered_resources()) == 1
+
+
+class TestFakePatch:
+    @pytest.fixture()
+    def myapp_api(self):
+        client = FakeDynamicClient()
+        client.event_recorder = FakeEventRecorder(enabled=False)
+        client.register_resources(resources={"kind": "MyApp", "api_version": "v1", "group": "example.com"})
+        api = client.resources.get(api_version="example.com/v1", kind="MyApp")
+        api.create(
+            namespace="default",
+            body={
+                "metadata": {"name": "app-1", "labels": {"app": "web", "tier": "front"}},
+                "spec": {"containers": [{"name": "web", "image": "web:1"}, {"name": "proxy", "image": "proxy:1"}]},
+            },
+        )
+        return api
+
+    def test_merge_patch_null_deletes(self, myapp_api):
+        patched = myapp_api.patch(
+            name="app-1",
+            namespace="default",
+            body={"metadata": {"labels": {"tier": None}}, "spec": {"containers": [{"name": "db"}]}},
+            content_type="application/merge-patch+json",
+        )
+
+        assert patched.metadata.labels.to_dict() == {"app": "web"}
+        assert [container.name for container in patched.spec.containers] == ["db"]
+
+    def test_strategic_merge_patch_merges_named_lists(self, myapp_api):
+        patched = myapp_api.patch(
+            name="app-1",
+            namespace="default",
+            body={"spec": {"containers": [{"name": "web", "image": "web:2"}, {"name": "proxy", "$patch": "delete"}]}},
+        )
+
+        assert patched.to_dict()["spec"]["containers"] == [{"name": "web", "image": "web:2"}]
+
+    def test_json_patch(self, myapp_api):
+        patched = myapp_api.patch(
+            name="app-1",
+            namespace="default",
+            body=[
+                {"op": "replace", "path": "/spec/containers/1/image", "value": "proxy:2"},
+                {"op": "add", "path": "/metadata/labels/team~1owner", "value": "infra"},
+                {"op": "move", "from": "/metadata/labels/tier", "path": "/metadata/labels/layer"},
+            ],
+            content_type="application/json-patch+json",
+        )
+
+        assert patched.spec.containers[1].image == "proxy:2"
+        assert patched.metadata.labels.to_dict() == {"app": "web", "team/owner": "infra", "layer": "front"}
+
+    @pytest.mark.parametrize(
+        "operations",
+        [
+            pytest.param([{"op": "test", "path": "/metadata/labels/app", "value": "db"}], id="failed-test"),
+            pytest.param([{"op": "remove", "path": "/spec/missing"}], id="missing-path"),
+            pytest.param([{"op": "copy", "path": "/spec/x"}], id="missing-from"),
+            pytest.param([{"op": "remove", "path": "/metadata"}], id="remove-metadata"),
+            pytest.param([{"op": "remove", "path": "/metadata/name"}], id="remove-name"),
+        ],
+    )
+    def test_json_patch_unprocessable(self, myapp_api, operations):
+        with pytest.raises(UnprocessibleEntityError):
+            myapp_api.patch(
+                name="app-1", namespace="default", body=operations, content_type="application/json-patch+json"
+            )
+
+        assert myapp_api.get(name="app-1", namespace="default").metadata.generation == 1
+
+
+class TestFakeServerSideApply:
+    @pytest.fixture()
+    def myapp_api(self):
+        client = FakeDynamicClient()
+        client.event_recorder = FakeEventRecorder(enabled=False)
+        client.register_resources(resources={"kind": "MyApp", "api_version": "v1", "group": "example.com"})
+        return client.resources.get(api_version="example.com/v1", kind="MyApp")
+
+    def _apply(self, myapp_api, spec, field_manager, force=False):
+        return myapp_api.server_side_apply(
+            body={"apiVersion": "example.com/v1", "kind": "MyApp", "metadata": {"name": "app-1"}, "spec": spec},
+            namespace="default",
+            field_manager=field_manager,
+            force_conflicts=force,
+        )
+
+    def test_apply_creates(self, myapp_api):
+        applied = self._apply(myapp_api=myapp_api, spec={"replicas": 1}, field_manager="tests")
+
+        assert applied.metadata.uid
+        assert applied.metadata.managedFields[0].fieldsV1.to_dict() == {"f:spec": {"f:replicas": {}}}
+
+    def test_apply_removes_fields_no_longer_applied(self, myapp_api):
+        self._apply(myapp_api=myapp_api, spec={"replicas": 1, "paused": True}, field_manager="tests")
+        applied = self._apply(myapp_api=myapp_api, spec={"replicas": 2}, field_manager="tests")
+
+        assert applied.spec.to_dict() == {"replicas": 2}
+        assert applied.metadata.generation == 2
+
+    def test_apply_conflict(self, myapp_api):
+        self._apply(myapp_api=myapp_api, spec={"replicas": 1}, field_manager="first")
+        # Same value is shared ownership, not a conflict
+        self._apply(myapp_api=myapp_api, spec={"replicas": 1, "paused": True}, field_manager="second")
+
+        with pytest.raises(ConflictError, match="conflict with"):
+            self._apply(myapp_api=myapp_api, spec={"replicas": 3}, field_manager="second")
+
+        applied = self._apply(myapp_api=myapp_api, spec={"replicas": 3}, field_manager="second", force=True)
+        assert applied.spec.to_dict() == {"replicas": 3}
+        assert [entry.manager for entry in applied.metadata.managedFields] == ["second"]
+
+    def test_apply_requires_field_manager(self, myapp_api):
+        with pytest.raises(ValueError):
+            myapp_api.server_side_apply(body={"metadata": {"name": "app-1"}}, namespace="default")
+
+
+class TestFakeResourceField:
+    @pytest.fixture()
+    def field(self):
+        # Stored resources are frozen, as served by the fake client
+        return FakeResourceField(
+            data=freeze(
+                value={
+                    "items": [{"metadata": {"name": "app-1"}}, {"metadata": {"name": "app-2"}}],
+                    "metadata": {"name": "list", "labels": {"app": "web"}},
+                    "ports": [80, 443],
+                }
+            )
+        )
+
+    def test_child_wrappers_reused(self, field):
+        assert field.metadata is field.metadata
+        assert field["metadata"] is field.metadata
+        assert field.items is field.items
+        assert field.items[0] is next(iter(field.items))
+
+    def test_list_compares_raw_items(self, field):
+        assert isinstance(field.items, list)
+        assert field.items == [{"metadata": {"name": "app-1"}}, {"metadata": {"name": "app-2"}}]
+        assert [item.metadata.name for item in field.items] == ["app-1", "app-2"]
+        assert field.items[-1].metadata.name == "app-2"
+        assert [item.metadata.name for item in field.items[1:]] == ["app-2"]
+        assert field.ports == [80, 443]
+
+    def test_missing_values(self, field):
+        assert not field.spec
+        assert not field.metadata.namespace
+        assert field.kind == ""
+
+    def test_items_method_without_items_data(self, field):
+        assert dict(field.metadata.labels.items()) == {"app": "web"}
+
+    def test_mutable_data_not_served_stale(self):
+        data = {"spec": {"replicas": 1}}
+        field = FakeResourceField(data=data)
+        assert field.spec.replicas == 1
+
+        data["spec"] = {"replicas": 2}
+        assert field.spec.replicas == 2
+
+    def test_mutable_list_appends_seen(self):
+        data = {"items": [{"metadata": {"name": "app-1"}}]}
+        field = FakeResourceField(data=data)
+        assert len(field.items) == 1
+
+        data["items"].append({"metadata": {"name": "app-2"}})
+        assert [item.metadata.name for item in field.items] == ["app-1", "app-2"]
+
+    def test_copies_are_plain_containers(self, field):
+        copied = field.to_dict()
+        copied["items"][0]["metadata"]["name"] = "changed"
+
+        assert field.items[0].metadata.name == "app-1"
+        assert type(copy.deepcopy(field.items)) is list
+        assert field.items.to_list() == field.to_dict()["items"]
+
+
+class TestStatusSchemaParser:
+    @pytest.fixture()
+    def parser(self):
+        status_schema = {
+            "type": "object",
+            "properties": {
+                "replicas": {"type": "integer"},
+                "phase": {"type": "string", "enum": ["Pending", "Running"]},
+                "details": {"type": "object", "properties": {"message": {"type": "string"}}},
+                "conditions": {"type": "array"},
+            },
+        }
+        mappings = {
+            "widget": [
+                {
+                    "x-kubernetes-group-version-kind": [{"kind": "Widget"}],
+                    "properties": {"status": status_schema},
+                }
+            ]
+        }
+        return StatusSchemaParser(resource_mappings=mappings)
+
+    def test_generator_compiled_once(self, parser):
+        with patch.object(
+            parser, "get_status_schema_for_resource", wraps=parser.get_status_schema_for_resource
+        ) as mock_schema:
+            for _ in range(3):
+                generator = parser.get_status_generator(kind="Widget", api_version="v1", is_ready=True)
+
+        assert mock_schema.call_count == 1
+        assert parser.get_status_generator(kind="Gadget", api_version="v1", is_ready=True) is None
+        assert generator({"spec": {"replicas": 3}})["replicas"] == 3
+        assert generator({"spec": {"replicas": 5}})["replicas"] == 5
+
+    def test_ready_state(self, parser):
+        ready = parser.get_status_generator(kind="Widget", api_version="v1", is_ready=True)({})
+        not_ready = parser.get_status_generator(kind="Widget", api_version="v1", is_ready=False)({})
+
+        assert (ready["phase"], ready["details"]["message"]) == ("Running", "Resource is ready")
+        assert (not_ready["phase"], not_ready["details"]["message"]) == ("Pending", "Resource is not ready")
+        assert not_ready["conditions"][0]["status"] == "False"
+
+    def test_generate_status_from_schema(self, parser):
+        schema = parser.get_status_schema_for_resource(kind="Widget", api_version="v1")
+        not_ready_body = {"metadata": {"annotations": {"fake-client.io/ready": "false"}}, "spec": {"replicas": 2}}
+
+        ready = parser.generate_status_from_schema(schema=schema, resource_body={"spec": {"replicas": 2}})
+        not_ready = parser.generate_status_from_schema(schema=schema, resource_body=not_ready_body)
+
+        assert (ready["replicas"], ready["phase"]) == (2, "Running")
+        assert (not_ready["replicas"], not_ready["phase"]) == (2, "Pending")
+
+    def test_generated_status_not_shared(self, parser):
+        generator = parser.get_status_generator(kind="Widget", api_version="v1", is_ready=True)
+        generator({})["details"]["message"] = "changed"
+
+        assert generator({})["details"]["message"] == "Resource is ready"
+
+    def test_parser_shared_per_mappings(self, parser):
+        mappings = parser.resource_mappings
+
+        assert StatusSchemaParser.for_mappings(resource_mappings=mappings) is StatusSchemaParser.for_mappings(
+            resource_mappings=mappings
+        )
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestFakeClusterProfile:
+    @pytest.fixture()
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture()
+    def client(self):
+        client = FakeDynamicClient()
+        client.event_recorder = FakeEventRecorder(enabled=False)
+        client.register_resources(resources={"kind": "MyApp", "api_version": "v1", "group": "example.com"})
+        return client
+
+    @pytest.fixture()
+    def myapp_api(self, client):
+        api = client.resources.get(api_version="example.com/v1", kind="MyApp")
+        api.create(namespace="default", body={"metadata": {"name": "app-1"}})
+        return api
+
+    def _set_profile(self, client, clock, **kwargs):
+        client.cluster_profile = FakeClusterProfile(seed=1, clock=clock, sleep=clock.sleep, **kwargs)
+
+    def test_latency_per_verb(self, client, clock, myapp_api):
+        self._set_profile(client=client, clock=clock, latency={"get": 0.5, "*": (0.1, 0.2)})
+        myapp_api.get(name="app-1", namespace="default")
+        myapp_api.patch(name="app-1", namespace="default", body={"spec": {"replicas": 2}})
+
+        assert clock.sleeps[0] == pytest.approx(0.5)
+        assert 0.1 <= clock.sleeps[1] <= 0.2
+
+    def test_throttling(self, client, clock, myapp_api):
+        self._set_profile(client=client, clock=clock, requests_per_second=1, burst=2)
+        for _ in range(2):
+            myapp_api.get(name="app-1", namespace="default")
+
+        with pytest.raises(TooManyRequestsError) as exc_info:
+            myapp_api.get(name="app-1", namespace="default")
+        assert exc_info.value.headers["Retry-After"] == "1"
+
+        clock.now += 1
+        myapp_api.get(name="app-1", namespace="default")
+
+    def test_server_errors_retried(self, client, clock, myapp_api):
+        self._set_profile(client=client, clock=clock, server_error_rate=1)
+        with pytest.raises(InternalServerError, match="etcdserver: leader changed"):
+            myapp_api.get(name="app-1", namespace="default")
+
+        self._set_profile(client=client, clock=clock, server_error_rate=0.5)
+        resource = Resource.retry_cluster_exceptions(
+            func=myapp_api.get, name="app-1", namespace="default", sleep_time=0
+        )
+        assert resource.metadata.name == "app-1"
+
+    def test_conflicts_on_writes(self, client, clock, myapp_api):
+        self._set_profile(client=client, clock=clock, conflict_rate=1)
+        myapp_api.get(name="app-1", namespace="default")
+
+        with pytest.raises(ConflictError):
+            myapp_api.patch(name="app-1", namespace="default", body={"spec": {"replicas": 2}})
+
+    def test_delayed_status_transition(self, client, clock):
+        self._set_profile(client=client, clock=clock, status_delays={"MyApp": 10})
+        api = client.resources.get(api_version="example.com/v1", kind="MyApp")
+        created = api.create(namespace="default", body={"metadata": {"name": "app-1"}})
+        assert created.status.conditions[0].status == "False"
+
+        clock.now += 5
+        assert api.get(name="app-1", namespace="default").status.conditions[0].status == "False"
+
+        clock.now += 5
+        resource = api.get(name="app-1", namespace="default")
+        assert resource.status.conditions[0].status == "True"
+        assert int(resource.metadata.resourceVersion) > int(created.metadata.resourceVersion)
+
+    def test_not_ready_resources_not_delayed(self, client, clock):
+        self._set_profile(client=client, clock=clock, status_delays={"MyApp": 10})
+        api = client.resources.get(api_version="example.com/v1", kind="MyApp")
+        api.create(
+            namespace="default",
+            body={"metadata": {"name": "app-1", "annotations": {"fake-client.io/ready": "false"}}},
+        )
+
+        assert client.cluster_profile.next_transition_in() is None
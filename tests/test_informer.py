@@ -0,0 +1,193 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fake_kubernetes_client.resource_field import FakeResourceField
+from fake_kubernetes_client.resource_instance import FakeResourceInstance
+from ocp_resources.pod import Pod
+from ocp_resources.utils.informer import Informer, ResourceStore, stop_informers
+
+INFORMER_NAMESPACE: str = "test-informer"
+
+
+def _pod_body(name: str, labels: dict[str, str], node_name: str = "", owner_uid: str = "") -> FakeResourceField:
+    metadata = {"name": name, "namespace": INFORMER_NAMESPACE, "labels": labels}
+    if owner_uid:
+        metadata["ownerReferences"] = [{"kind": "ReplicaSet", "name": "rs", "uid": owner_uid}]
+
+    return FakeResourceField(data={"metadata": metadata, "spec": {"nodeName": node_name}})
+
+
+@pytest.fixture()
+def resource_api():
+    api = MagicMock()
+    api.get.return_value.items = [_pod_body(name="web-1", labels={"app": "web"})]
+    api.get.return_value.metadata.resourceVersion = "1"
+    return api
+
+
+@pytest.fixture(scope="class")
+def store():
+    _store = ResourceStore()
+    _store.replace(
+        objects=[
+            _pod_body(name="web-1", labels={"app": "web", "tier": "front"}, node_name="node-1", owner_uid="rs-uid"),
+            _pod_body(name="web-2", labels={"app": "web"}, node_name="node-2", owner_uid="rs-uid"),
+            _pod_body(name="db-1", labels={"app": "db"}, node_name="node-1"),
+        ]
+    )
+    return _store
+
+
+@pytest.fixture()
+def informer_pods(fake_client):
+    pods = [
+        Pod(
+            client=fake_client,
+            name=f"informer-pod-{idx}",
+            namespace=INFORMER_NAMESPACE,
+            containers=[{"name": "test-container", "image": "nginx:latest"}],
+            label={"app": "informer"},
+        ).deploy()
+        for idx in range(2)
+    ]
+    yield pods
+    stop_informers(client=fake_client)
+    for pod in pods:
+        pod.clean_up(wait=False)
+
+
+class TestResourceStore:
+    def test_get(self, store):
+        assert store.get(name="web-1", namespace=INFORMER_NAMESPACE).metadata.name == "web-1"
+        assert store.get(name="web-1") is None
+
+    def test_list_by_label(self, store):
+        assert [obj.metadata.name for obj in store.list_resources(label_selector="app=web")] == ["web-1", "web-2"]
+        assert [obj.metadata.name for obj in store.list_resources(label_selector="app=web,tier!=front")] == ["web-2"]
+        assert [obj.metadata.name for obj in store.list_resources(label_selector="tier")] == ["web-1"]
+        assert [obj.metadata.name for obj in store.list_resources(label_selector="!tier,app")] == ["db-1", "web-2"]
+
+    def test_list_by_node_name(self, store):
+        assert [obj.metadata.name for obj in store.list_resources(field_selector="spec.nodeName=node-1")] == [
+            "db-1",
+            "web-1",
+        ]
+
+    def test_list_by_owner_uid(self, store):
+        assert len(store.list_resources(namespace=INFORMER_NAMESPACE, owner_uid="rs-uid")) == 2
+
+    def test_list_unsupported_selector(self, store):
+        with pytest.raises(ValueError):
+            store.list_resources(label_selector="app in (web,db)")
+
+    def test_delete(self, store):
+        store.delete(obj=_pod_body(name="db-1", labels={"app": "db"}))
+        assert store.get(name="db-1", namespace=INFORMER_NAMESPACE) is None
+        assert store.list_resources(label_selector="app=db") == []
+
+
+class TestInformer:
+    def test_get_from_informer(self, fake_client, informer_pods):
+        pods = list(
+            Pod.get(
+                dyn_client=fake_client, namespace=INFORMER_NAMESPACE, label_selector="app=informer", use_informer=True
+            )
+        )
+        assert sorted(pod.name for pod in pods) == sorted(pod.name for pod in informer_pods)
+
+        with patch.object(FakeResourceInstance, "get", autospec=True, side_effect=FakeResourceInstance.get) as mock_get:
+            list(
+                Pod.get(
+                    dyn_client=fake_client,
+                    namespace=INFORMER_NAMESPACE,
+                    label_selector="app=informer",
+                    use_informer=True,
+                )
+            )
+            for pod in pods:
+                assert pod.instance.metadata.name == pod.name
+
+        mock_get.assert_not_called()
+
+    def test_get_by_name_from_informer(self, fake_client, informer_pods):
+        list(Pod.get(dyn_client=fake_client, namespace=INFORMER_NAMESPACE, use_informer=True))
+        with patch.object(FakeResourceInstance, "get", autospec=True, side_effect=FakeResourceInstance.get) as mock_get:
+            pods = list(
+                Pod.get(
+                    dyn_client=fake_client,
+                    name=informer_pods[0].name,
+                    namespace=INFORMER_NAMESPACE,
+                    use_informer=True,
+                )
+            )
+
+        assert [pod.name for pod in pods] == [informer_pods[0].name]
+        mock_get.assert_not_called()
+
+    def test_get_unsupported_kwargs_uses_server(self, fake_client, informer_pods):
+        with patch.object(FakeResourceInstance, "get", autospec=True, side_effect=FakeResourceInstance.get) as mock_get:
+            list(
+                Pod.get(
+                    dyn_client=fake_client,
+                    namespace=INFORMER_NAMESPACE,
+                    resource_version="0",
+                    use_informer=True,
+                )
+            )
+
+        mock_get.assert_called_once()
+        assert mock_get.call_args.kwargs["resource_version"] == "0"
+
+    def test_get_unsupported_selector_uses_server(self, fake_client, informer_pods):
+        with patch.object(FakeResourceInstance, "get", autospec=True, side_effect=FakeResourceInstance.get) as mock_get:
+            pods = list(
+                Pod.get(
+                    dyn_client=fake_client,
+                    namespace=INFORMER_NAMESPACE,
+                    field_selector="status.phase=Running",
+                    use_informer=True,
+                )
+            )
+
+        assert pods
+        mock_get.assert_called_once()
+
+    def test_watch_thread_died(self, resource_api):
+        informer = Informer(resource_api=resource_api, kind="Pod", namespace=INFORMER_NAMESPACE)
+        # A malformed event, then the list after it fails unexpectedly too
+        resource_api.watch.side_effect = AttributeError("'NoneType' object has no attribute 'metadata'")
+        informer.start()
+        resource_api.get.side_effect = TypeError("unexpected list response")
+        assert informer.get(name="web-1", namespace=INFORMER_NAMESPACE)
+
+        informer._thread.join(timeout=5)
+
+        assert resource_api.get.call_count == 2
+        assert not informer.has_synced
+        assert informer.get(name="web-1", namespace=INFORMER_NAMESPACE) is None
+        with pytest.raises(ValueError):
+            informer.list_resources(namespace=INFORMER_NAMESPACE)
+
+    def test_start_while_stopped_thread_alive(self, resource_api):
+        informer = Informer(resource_api=resource_api, kind="Pod", namespace=INFORMER_NAMESPACE)
+        watching, release = threading.Event(), threading.Event()
+
+        def _watch(**kwargs):
+            watching.set()
+            release.wait(timeout=5)
+            return iter([])
+
+        resource_api.watch.side_effect = _watch
+        informer.start()
+        assert watching.wait(timeout=5)
+        informer.stop()
+
+        with pytest.raises(RuntimeError):
+            informer.start()
+
+        release.set()
+        informer._thread.join(timeout=5)
+        assert informer.start().has_synced
+        informer.stop()
@@ -0,0 +1,151 @@
+import os
+import select
+import subprocess
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+from kubernetes.stream.ws_client import STDERR_CHANNEL, STDOUT_CHANNEL
+
+from ocp_resources.exceptions import ExecOnPodError
+from ocp_resources.pod import Pod
+from ocp_resources.utils.pod_exec_session import COMMAND_TIMEOUT_ERROR, PodExecSession
+from ocp_resources.virtual_machine_instance import VirtualMachineInstance
+
+
+class LocalShellStream:
+    """WSClient stand-in bridging the exec channels to a local shell process"""
+
+    def __init__(self, command: list[str], **kwargs) -> None:
+        self.process = subprocess.Popen(
+            command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        )
+        self._channels = {STDOUT_CHANNEL: "", STDERR_CHANNEL: ""}
+        self._fds = {self.process.stdout.fileno(): STDOUT_CHANNEL, self.process.stderr.fileno(): STDERR_CHANNEL}
+
+    def is_open(self) -> bool:
+        return bool(self._fds)
+
+    def write_stdin(self, data: str) -> None:
+        self.process.stdin.write(data)
+        self.process.stdin.flush()
+
+    def update(self, timeout: float = 0) -> None:
+        ready, _, _ = select.select(list(self._fds), [], [], timeout)
+        for fd in ready:
+            data = os.read(fd, 65536).decode()
+            if data:
+                self._channels[self._fds[fd]] += data
+            else:
+                del self._fds[fd]
+
+    def read_channel(self, channel: int, timeout: float = 0) -> str:
+        data, self._channels[channel] = self._channels[channel], ""
+        return data
+
+    def close(self) -> None:
+        self.process.kill()
+        self.process.wait()
+
+
+@pytest.fixture()
+def stream():
+    streams = []
+
+    def _stream(api_method, command, **kwargs):
+        streams.append(LocalShellStream(command=command))
+        return streams[-1]
+
+    with patch("kubernetes.stream.stream", side_effect=_stream) as mock_stream:
+        yield mock_stream
+
+    for _stream in streams:
+        _stream.close()
+
+
+@pytest.fixture()
+def pod():
+    pod = MagicMock()
+    pod.name = "test-pod"
+    pod._exec_metadata.return_value = ("test-container", "node-1")
+    return pod
+
+
+class TestPodExecSession:
+    def test_execute_many(self, pod, stream):
+        with PodExecSession(pod=pod) as session:
+            assert session.execute_many(commands=[["echo", "one"], ["printf", "two"], ["echo", "a b"]]) == [
+                "one\n",
+                "two",
+                "a b\n",
+            ]
+            assert session.execute(command=["echo", "three"]) == "three\n"
+
+        stream.assert_called_once()
+        assert stream.call_args.kwargs["container"] == "test-container"
+        assert not session.is_open
+
+    def test_shell_state_kept(self, pod, stream):
+        with PodExecSession(pod=pod) as session:
+            session.execute(command=["cd", "/"])
+            assert session.execute(command=["pwd"]) == "/\n"
+
+    def test_failed_command(self, pod, stream):
+        with PodExecSession(pod=pod) as session:
+            with pytest.raises(ExecOnPodError) as exc_info:
+                session.execute_many(commands=[["sh", "-c", "echo out; echo err >&2; exit 3"], ["echo", "after"]])
+
+            assert (exc_info.value.rc, exc_info.value.out, exc_info.value.err) == (3, "out\n", "err\n")
+            assert session.execute(command=["sh", "-c", "exit 4"], ignore_rc=True) == ""
+            assert session.execute(command=["echo", "next"]) == "next\n"
+
+        stream.assert_called_once()
+
+    def test_closed_session_reopens(self, pod, stream):
+        with PodExecSession(pod=pod) as session:
+            with pytest.raises(ExecOnPodError) as exc_info:
+                session.execute(command=["exit", "0"])
+
+            assert exc_info.value.rc == -1
+            assert session.execute(command=["echo", "reopened"]) == "reopened\n"
+
+        assert stream.call_count == 2
+
+    def test_command_timeout(self, pod, stream):
+        with PodExecSession(pod=pod) as session:
+            with pytest.raises(ExecOnPodError) as exc_info:
+                session.execute(command=["sleep", "5"], timeout=1)
+
+            assert exc_info.value.err == COMMAND_TIMEOUT_ERROR
+            assert not session.is_open
+
+
+class TestVirshCommands:
+    def test_execute_virsh_commands(self, fake_client):
+        launcher_pod = MagicMock()
+        launcher_pod.name = "virt-launcher-test-vmi"
+        launcher_pod.instance.metadata.uid = "launcher-uid"
+        launcher_pod.instance.spec.securityContext.runAsUser = 107
+        session = launcher_pod.exec_session.return_value.__enter__.return_value
+        session.execute.return_value = "virtqemud-sock\n"
+        session.execute_many.side_effect = lambda commands: [command[-2] for command in commands]
+        with patch("ocp_resources.resource._get_api_version", return_value="kubevirt.io/v1"):
+            vmi = VirtualMachineInstance(client=fake_client, name="test-vmi", namespace="test-ns")
+
+        with (
+            patch.object(VirtualMachineInstance, "instance", new_callable=PropertyMock) as mock_instance,
+            patch.object(Pod, "get", side_effect=lambda **kwargs: iter([launcher_pod])) as mock_get,
+        ):
+            mock_instance.return_value.status.migrationState = None
+            assert vmi.execute_virsh_commands(commands=["domstate", "dommemstat"]) == ["domstate", "dommemstat"]
+            assert vmi.get_domstate() == "domstate"
+            assert vmi.virt_launcher_pod is launcher_pod
+
+        session.execute.assert_called_once_with(command=["ls", "/var/run/libvirt/"])
+        assert all(call.kwargs["instance_snapshot_ttl"] for call in mock_get.call_args_list)
+        assert session.execute_many.call_args.kwargs["commands"][0] == [
+            "virsh",
+            "-c",
+            "qemu+unix:///session?socket=/var/run/libvirt/virtqemud-sock",
+            "domstate",
+            "test-ns_test-vmi",
+        ]
@@ -0,0 +1,76 @@
+import datetime
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+
+from ocp_resources import pod as pod_module
+from ocp_resources.pod import Pod
+
+
+@pytest.fixture()
+def log_api():
+    with patch.object(Pod, "_kube_v1_api", new_callable=PropertyMock) as mock_api:
+        yield mock_api.return_value.read_namespaced_pod_log
+
+
+@pytest.fixture()
+def pod(fake_client):
+    return Pod(client=fake_client, name="test-log-pod", namespace="test-log")
+
+
+def _response(chunks: list[bytes]) -> MagicMock:
+    response = MagicMock()
+    response.stream.return_value = iter(chunks)
+    return response
+
+
+class TestPodStreamLog:
+    def test_stream_log_lines(self, pod, log_api):
+        # "é" is split between chunks
+        log_api.return_value = _response(chunks=[b"first\nsec", b"ond\ncaf\xc3", b"\xa9\n", b"last"])
+
+        assert list(pod.stream_log(container="test-container", follow=True)) == ["first", "second", "café", "last"]
+        assert log_api.call_args.kwargs == {
+            "name": "test-log-pod",
+            "namespace": "test-log",
+            "_preload_content": False,
+            "container": "test-container",
+            "follow": True,
+            "previous": False,
+            "timestamps": False,
+        }
+        log_api.return_value.release_conn.assert_called_once()
+
+    def test_stream_log_long_line(self, pod, log_api):
+        log_api.return_value = _response(chunks=[b"x" * 25, b"\n"])
+
+        with patch.object(pod_module, "MAX_LOG_LINE_LENGTH", 10):
+            assert list(pod.stream_log()) == ["x" * 10, "x" * 10, "x" * 5]
+
+    def test_stream_log_closed_early(self, pod, log_api):
+        log_api.return_value = _response(chunks=[b"one\ntwo\n", b"three\n"])
+
+        log_lines = pod.stream_log(follow=True)
+        assert next(log_lines) == "one"
+        log_lines.close()
+
+        log_api.return_value.close.assert_called_once()
+
+    def test_stream_log_since_time(self, pod, log_api):
+        log_api.return_value = _response(chunks=[])
+
+        list(pod.stream_log(since_time=datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(minutes=5)))
+        assert 300 <= log_api.call_args.kwargs["since_seconds"] <= 302
+
+    def test_stream_log_zero_tail_lines(self, pod, log_api):
+        log_api.return_value = _response(chunks=[])
+
+        assert list(pod.stream_log(tail_lines=0)) == []
+        assert log_api.call_args.kwargs["tail_lines"] == 0
+
+    def test_tail_log(self, pod, log_api):
+        log_api.return_value = _response(chunks=[b"nine\nten\n"])
+
+        assert pod.tail_log(container="test-container", lines=2, limit_bytes=100) == "nine\nten"
+        assert log_api.call_args.kwargs["tail_lines"] == 2
+        assert log_api.call_args.kwargs["limit_bytes"] == 100
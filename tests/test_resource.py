@@ -1,12 +1,28 @@
 import os
-from unittest.mock import patch
+import pickle
+import time
+from unittest.mock import MagicMock, patch
 
 import pytest
+from kubernetes.client.rest import ApiException
+from kubernetes.dynamic.exceptions import ConflictError, GoneError
 
-from ocp_resources.exceptions import ResourceTeardownError
+from fake_kubernetes_client.resource_field import FakeResourceField
+from fake_kubernetes_client.resource_instance import FakeResourceInstance
+from ocp_resources.config_map import ConfigMap
+from ocp_resources.exceptions import ResourceEditorError, ResourceListError, ResourceTeardownError
 from ocp_resources.namespace import Namespace
 from ocp_resources.pod import Pod
-from ocp_resources.resource import NamespacedResourceList, Resource, ResourceList
+from ocp_resources.resource import (
+    NamespacedResourceList,
+    Resource,
+    ResourceEditor,
+    ResourceList,
+    _get_api_version,
+    close_clients,
+    get_client,
+    invalidate_api_versions_cache,
+)
 from ocp_resources.secret import Secret
 
 BASE_NAMESPACE_NAME: str = "test-namespace"
@@ -131,6 +147,228 @@ class TestResource:
                 pass
 
 
+class TestResourceGet:
+    def test_get_serves_instance_from_list(self, fake_client):
+        namespace = Namespace(client=fake_client, name="test-get-snapshot").deploy()
+
+        with patch.object(FakeResourceInstance, "get", autospec=True, side_effect=FakeResourceInstance.get) as mock_get:
+            namespaces = list(Namespace.get(dyn_client=fake_client, instance_snapshot_ttl=60))
+            for ns in namespaces:
+                assert ns.instance.metadata.name == ns.name
+
+        assert mock_get.call_count == 1
+        namespace.clean_up(wait=False)
+
+    def test_get_without_instance_snapshot(self, fake_client):
+        namespace = Namespace(client=fake_client, name="test-get-no-snapshot").deploy()
+
+        with patch.object(FakeResourceInstance, "get", autospec=True, side_effect=FakeResourceInstance.get) as mock_get:
+            namespaces = list(Namespace.get(dyn_client=fake_client))
+            for ns in namespaces:
+                assert ns.instance.metadata.name == ns.name
+
+        assert mock_get.call_count == len(namespaces) + 1
+        namespace.clean_up(wait=False)
+
+    def test_update_drops_instance_snapshot(self, fake_client):
+        namespace = Namespace(client=fake_client, name="test-get-snapshot-update").deploy()
+        listed = next(
+            ns for ns in Namespace.get(dyn_client=fake_client, instance_snapshot_ttl=60) if ns.name == namespace.name
+        )
+        listed.update(resource_dict={"metadata": {"name": listed.name, "labels": {"updated": "true"}}})
+
+        assert listed.labels["updated"] == "true"
+        namespace.clean_up(wait=False)
+
+    def test_get_paginated(self, fake_client):
+        namespaces = [Namespace(client=fake_client, name=f"test-get-page-{idx}").deploy() for idx in range(3)]
+        all_names = [ns.name for ns in Namespace.get(dyn_client=fake_client)]
+
+        with patch.object(FakeResourceInstance, "get", autospec=True, side_effect=FakeResourceInstance.get) as mock_get:
+            paged_names = [ns.name for ns in Namespace.get(dyn_client=fake_client, page_size=2)]
+
+        assert paged_names == all_names
+        assert mock_get.call_count == -(-len(all_names) // 2)
+        assert all(call.kwargs["limit"] == 2 for call in mock_get.call_args_list)
+        for namespace in namespaces:
+            namespace.clean_up(wait=False)
+
+    def test_get_paginated_restarts_on_expired_continue(self, fake_client):
+        namespaces = [Namespace(client=fake_client, name=f"test-get-page-gone-{idx}").deploy() for idx in range(3)]
+        all_names = [ns.name for ns in Namespace.get(dyn_client=fake_client)]
+        expired = []
+        list_resources = FakeResourceInstance.get
+
+        def _get(self, *args, **kwargs):
+            if kwargs.get("_continue") and not expired:
+                expired.append(kwargs["_continue"])
+                raise GoneError(ApiException(status=410, reason="Expired"))
+
+            return list_resources(self, *args, **kwargs)
+
+        with patch.object(FakeResourceInstance, "get", autospec=True, side_effect=_get):
+            paged_names = [ns.name for ns in Namespace.get(dyn_client=fake_client, page_size=1)]
+
+        assert expired
+        assert paged_names == all_names
+        for namespace in namespaces:
+            namespace.clean_up(wait=False)
+
+    def test_get_paginated_by_name(self, fake_client):
+        namespace = Namespace(client=fake_client, name="test-get-page-name").deploy()
+
+        paged_names = [ns.name for ns in Namespace.get(dyn_client=fake_client, name=namespace.name, page_size=2)]
+
+        assert paged_names == [namespace.name]
+        namespace.clean_up(wait=False)
+
+
+class TestResourceApply:
+    def test_apply_creates_and_updates(self, fake_client):
+        config_map = ConfigMap(client=fake_client, name="test-apply", namespace="default", data={"a": "1", "b": "2"})
+        config_map.apply()
+        config_map.data = {"a": "3"}
+        config_map.apply()
+
+        assert config_map.instance.data.to_dict() == {"a": "3"}
+        assert [entry.manager for entry in config_map.instance.metadata.managedFields] == ["openshift-python-wrapper"]
+        config_map.clean_up(wait=False)
+
+    def test_apply_conflict(self, fake_client):
+        config_map = ConfigMap(client=fake_client, name="test-apply-conflict", namespace="default", data={"a": "1"})
+        config_map.apply(field_manager="first")
+        config_map.data = {"a": "2"}
+
+        with pytest.raises(ConflictError):
+            config_map.apply(field_manager="second")
+
+        config_map.apply(field_manager="second", force=True)
+        assert config_map.instance.data.a == "2"
+        config_map.clean_up(wait=False)
+
+    def test_update_json_patch(self, fake_client):
+        config_map = ConfigMap(client=fake_client, name="test-json-patch", namespace="default", data={"a": "1"})
+        config_map.deploy()
+        config_map.update(
+            resource_dict=[{"op": "test", "path": "/data/a", "value": "1"}, {"op": "remove", "path": "/data/a"}],
+            patch_type="json",
+        )
+
+        assert not config_map.instance.data
+        config_map.clean_up(wait=False)
+
+    def test_update_unsupported_patch_type(self, fake_client):
+        with pytest.raises(ValueError):
+            ConfigMap(client=fake_client, name="test-patch-type", namespace="default").update(
+                resource_dict={}, patch_type="yaml"
+            )
+
+    def test_update_patch_operations_require_json_patch(self, fake_client):
+        with pytest.raises(TypeError, match="json"):
+            ConfigMap(client=fake_client, name="test-patch-type", namespace="default").update(
+                resource_dict=[{"op": "remove", "path": "/data/a"}]
+            )
+
+
+class TestSharedClient:
+    @pytest.fixture()
+    def kubeconfig(self, tmp_path):
+        kubeconfig = tmp_path / "kubeconfig"
+        kubeconfig.write_text("{}")
+        return str(kubeconfig)
+
+    @pytest.fixture()
+    def new_client_from_config(self):
+        with (
+            patch("kubernetes.config.new_client_from_config") as mock_new_client,
+            patch("kubernetes.dynamic.DynamicClient", side_effect=lambda client, **kwargs: MagicMock(client=client)),
+            patch("kubernetes.client.Configuration.set_default"),
+        ):
+            yield mock_new_client
+
+        close_clients()
+
+    def test_shared_client_reused(self, kubeconfig, new_client_from_config):
+        client = get_client(config_file=kubeconfig, context="ctx", shared=True)
+
+        assert get_client(config_file=kubeconfig, context="ctx", shared=True) is client
+        assert get_client(config_file=kubeconfig, context="other", shared=True) is not client
+        assert get_client(config_file=kubeconfig, context="ctx") is not client
+        assert new_client_from_config.call_count == 3
+
+    def test_shared_client_per_discovery_cache_dir(self, kubeconfig, new_client_from_config, tmp_path):
+        client = get_client(config_file=kubeconfig, shared=True)
+
+        assert get_client(config_file=kubeconfig, discovery_cache_dir=str(tmp_path), shared=True) is not client
+
+    def test_shared_client_replaced_on_kubeconfig_change(self, kubeconfig, new_client_from_config):
+        client = get_client(config_file=kubeconfig, shared=True)
+        os.utime(kubeconfig, (time.time() + 10, time.time() + 10))
+
+        assert get_client(config_file=kubeconfig, shared=True) is not client
+        client.client.close.assert_called_once()
+
+    def test_close_clients(self, kubeconfig, new_client_from_config):
+        client = get_client(config_file=kubeconfig, shared=True)
+        close_clients()
+
+        client.client.close.assert_called_once()
+        assert get_client(config_file=kubeconfig, shared=True) is not client
+
+    def test_connection_pool_maxsize(self, kubeconfig, new_client_from_config):
+        get_client(config_file=kubeconfig, connection_pool_maxsize=4)
+
+        assert new_client_from_config.call_args.kwargs["client_configuration"].connection_pool_maxsize == 4
+
+
+class TestApiVersionsCache:
+    def test_api_version_resolved_once(self, fake_client):
+        with patch.object(fake_client.resources, "search", wraps=fake_client.resources.search) as mock_search:
+            for _ in range(3):
+                assert _get_api_version(dyn_client=fake_client, api_group="apps", kind="Deployment") == "apps/v1"
+
+        mock_search.assert_called_once()
+
+    def test_invalidate_api_versions_cache(self, fake_client):
+        _get_api_version(dyn_client=fake_client, api_group="apps", kind="Deployment")
+        invalidate_api_versions_cache(dyn_client=fake_client)
+
+        with patch.object(fake_client.resources, "search", wraps=fake_client.resources.search) as mock_search:
+            _get_api_version(dyn_client=fake_client, api_group="apps", kind="Deployment")
+
+        mock_search.assert_called_once()
+
+
+class TestWatchInstance:
+    def test_watch_instance_yields_watch_events(self, fake_client):
+        namespace = Namespace(client=fake_client, name="test-watch-instance").deploy()
+        modified = namespace.instance.to_dict()
+        modified["status"]["phase"] = "Terminating"
+        watch_events = iter([{"type": "MODIFIED", "object": FakeResourceField(data=modified), "raw_object": modified}])
+
+        with patch.object(FakeResourceInstance, "watch", return_value=watch_events) as mock_watch:
+            samples = namespace.watch_instance(timeout=5)
+            assert next(samples).status.phase == Namespace.Status.ACTIVE
+            assert next(samples).status.phase == "Terminating"
+
+        mock_watch.assert_called_once()
+        assert mock_watch.call_args.kwargs["field_selector"] == f"metadata.name=={namespace.name}"
+        namespace.clean_up(wait=False)
+
+    def test_watch_instance_falls_back_to_polling(self, fake_client):
+        namespace = Namespace(client=fake_client, name="test-watch-instance-fallback").deploy()
+
+        with patch.object(
+            FakeResourceInstance, "watch", side_effect=ApiException(status=410, reason="Gone")
+        ) as mock_watch:
+            samples = namespace.watch_instance(timeout=5)
+            next(samples)
+            assert next(samples).status.phase == Namespace.Status.ACTIVE
+
+        mock_watch.assert_called_once()
+        namespace.clean_up(wait=False)
+
+
 @pytest.mark.incremental
 class TestResourceList:
     def test_resource_list_deploy(self, namespaces):
@@ -154,6 +392,115 @@ class TestResourceList:
             assert namespaces
 
 
+class TestResourceListParallel:
+    def test_deploy_aggregates_errors(self, fake_client):
+        namespaces = ResourceList(
+            client=fake_client, resource_class=Namespace, num_resources=3, name="test-parallel-errors"
+        )
+        with (
+            patch.object(Namespace, "deploy", autospec=True, side_effect=ApiException(status=500)) as mock_deploy,
+            pytest.raises(ResourceListError) as exc_info,
+        ):
+            namespaces.deploy(max_workers=3)
+
+        assert mock_deploy.call_count == 3
+        assert len(exc_info.value.errors) == 3
+        assert str(pickle.loads(pickle.dumps(exc_info.value))) == str(exc_info.value)
+
+    def test_clean_up_reverse_tiers(self, fake_client):
+        namespaces = ResourceList(client=fake_client, resource_class=Namespace, num_resources=2, name="test-tiers")
+        pods = NamespacedResourceList(
+            client=fake_client,
+            resource_class=Pod,
+            namespaces=namespaces,
+            name="test-tiers-pod",
+            containers=POD_CONTAINERS,
+        )
+        namespaces.resources.extend(pods.resources)
+        cleaned_up = []
+
+        def _clean_up(resource, wait=True, timeout=None):
+            cleaned_up.append(resource.kind)
+            return True
+
+        with (
+            patch.object(Namespace, "clean_up", autospec=True, side_effect=_clean_up),
+            patch.object(Pod, "clean_up", autospec=True, side_effect=_clean_up),
+        ):
+            assert namespaces.clean_up(max_workers=4, requests_per_second=100)
+
+        assert cleaned_up == ["Pod", "Pod", "Namespace", "Namespace"]
+
+
+class TestResourceEditor:
+    @pytest.fixture()
+    def namespaces(self, fake_client):
+        namespaces = ResourceList(client=fake_client, resource_class=Namespace, num_resources=3, name="test-editor")
+        namespaces.deploy()
+        yield namespaces
+        namespaces.clean_up(wait=False)
+
+    def test_update_and_restore(self, namespaces):
+        with ResourceEditor(
+            patches={namespace: {"metadata": {"labels": {"edited": "true"}}} for namespace in namespaces},
+            max_workers=2,
+        ) as editor:
+            assert len(editor.backups) == 3
+            assert all(namespace.labels["edited"] == "true" for namespace in namespaces)
+
+        assert all("edited" not in (namespace.labels or {}) for namespace in namespaces)
+
+    def test_retry_only_failed_patches(self, namespaces):
+        conflicted = namespaces[1]
+        updated = []
+        original_update = Namespace.update
+
+        def _update(resource, resource_dict, patch_type="merge"):
+            updated.append(resource.name)
+            if resource is conflicted and updated.count(resource.name) == 1:
+                raise ConflictError(ApiException(status=409, reason="Conflict"))
+            return original_update(resource, resource_dict=resource_dict, patch_type=patch_type)
+
+        with (
+            patch("ocp_resources.resource.TIMEOUT_5SEC", 0),
+            patch.object(Namespace, "update", autospec=True, side_effect=_update),
+        ):
+            ResourceEditor(
+                patches={namespace: {"metadata": {"labels": {"retried": "true"}}} for namespace in namespaces}
+            ).update()
+
+        assert sorted(updated) == sorted([namespace.name for namespace in namespaces] + [conflicted.name])
+        assert conflicted.labels["retried"] == "true"
+
+    def test_failed_patches_report(self, namespaces):
+        failed = namespaces[0]
+        original_update = Namespace.update
+
+        def _update(resource, resource_dict, patch_type="merge"):
+            if resource is failed:
+                raise ApiException(status=422, reason="Unprocessable Entity")
+            return original_update(resource, resource_dict=resource_dict, patch_type=patch_type)
+
+        with (
+            patch.object(Namespace, "update", autospec=True, side_effect=_update),
+            pytest.raises(ResourceEditorError) as exc_info,
+        ):
+            ResourceEditor(
+                patches={namespace: {"metadata": {"labels": {"failed": "true"}}} for namespace in namespaces}
+            ).update()
+
+        assert list(exc_info.value.errors) == [f"Namespace {failed.name}"]
+        assert sorted(exc_info.value.applied) == sorted(f"Namespace {namespace.name}" for namespace in namespaces[1:])
+        assert type(exc_info.value) is ResourceEditorError
+        unpickled = pickle.loads(pickle.dumps(exc_info.value))
+        assert (unpickled.action, list(unpickled.errors), unpickled.applied) == (
+            exc_info.value.action,
+            list(exc_info.value.errors),
+            exc_info.value.applied,
+        )
+        assert str(unpickled) == str(exc_info.value)
+
+
 @pytest.mark.incremental
 class TestNamespacedResourceList:
     def test_namespaced_resource_list_deploy(self, fake_client, pods):
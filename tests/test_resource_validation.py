@@ -3,6 +3,7 @@
 import copy
 from unittest.mock import patch
 
+import jsonschema
 import pytest
 
 from ocp_resources.exceptions import ValidationError
@@ -222,6 +223,26 @@ class TestResourceValidation:
             # Clean up
             SchemaValidator.clear_cache()
 
+    def test_validator_compiled_once(self, monkeypatch):
+        """Test that the compiled validator is cached and reused across validations."""
+        monkeypatch.setattr(SchemaValidator, "_mappings_data", {"pod": [POD_SCHEMA]})
+        monkeypatch.setattr(SchemaValidator, "_definitions_data", {})
+
+        try:
+            with patch.object(SchemaValidator, "load_mappings_data", return_value=True):
+                SchemaValidator.validate(resource_dict=POD_VALID, kind="Pod")
+                validator = SchemaValidator.get_validator(kind="Pod")
+                SchemaValidator.validate(resource_dict=POD_VALID, kind="Pod")
+
+                assert SchemaValidator.get_validator(kind="Pod") is validator
+
+                invalid_pod = copy.deepcopy(POD_VALID)
+                del invalid_pod["spec"]["containers"]
+                with pytest.raises(jsonschema.ValidationError):
+                    SchemaValidator.validate(resource_dict=invalid_pod, kind="Pod")
+        finally:
+            SchemaValidator.clear_cache()
+
     def test_validate_with_additional_properties(self, fake_client, enable_validation_by_default):
         """Test validation passes even with additional properties not in schema."""
         pod = Pod(
@@ -1,9 +1,12 @@
 """Tests for schema loading functionality."""
 
+import json
 from unittest.mock import mock_open, patch
 
 import pytest
 
+from ocp_resources.utils import schema_validator
+from ocp_resources.utils.archive_utils import save_json_archive, save_json_index
 from ocp_resources.utils.schema_validator import SchemaValidator
 from tests.fixtures.validation_schemas import POD_SCHEMA
 
@@ -153,6 +156,29 @@ class TestSchemaLoading:
         assert "image" in resolved["properties"]["spec"]["properties"]["container"]["properties"]
         assert resolved["properties"]["spec"]["properties"]["container"]["type"] == "object"
 
+    def test_resolve_refs_shares_definitions(self, monkeypatch):
+        """Test that a definition referenced by several kinds is resolved once and shared."""
+        definitions = {
+            "ObjectMeta": {"type": "object", "properties": {"name": {"type": "string"}}},
+            "Props": {"type": "object", "properties": {"items": {"$ref": "#/definitions/Props"}}},
+        }
+        mock_mappings = {
+            "first": [{"type": "object", "properties": {"metadata": {"$ref": "#/definitions/ObjectMeta"}}}],
+            "second": [{"type": "object", "properties": {"metadata": {"$ref": "#/definitions/ObjectMeta"}}}],
+            "recursive": [{"type": "object", "properties": {"spec": {"$ref": "#/definitions/Props"}}}],
+        }
+
+        monkeypatch.setattr(SchemaValidator, "_mappings_data", mock_mappings)
+        monkeypatch.setattr(SchemaValidator, "_definitions_data", definitions)
+
+        with patch.object(SchemaValidator, "load_mappings_data", return_value=True):
+            first = SchemaValidator.load_schema(kind="First")
+            second = SchemaValidator.load_schema(kind="Second")
+            recursive = SchemaValidator.load_schema(kind="Recursive")
+
+        assert first["properties"]["metadata"] is second["properties"]["metadata"]
+        assert recursive["properties"]["spec"]["properties"]["items"] == {}
+
     def test_schema_caching_across_instances(self, monkeypatch):
         """Test that schema cache is shared across instances."""
         # Clear cache
@@ -312,3 +338,52 @@ class TestSchemaLoadingWithApiGroup:
             # If validation fails, it should be because of schema requirements,
             # not because we picked the wrong schema
             assert "ValidationError" in str(type(e))
+
+
+class TestSchemaIndex:
+    """Test loading schemas from the per-kind indexes."""
+
+    @pytest.fixture()
+    def schema_index(self, tmp_path, monkeypatch):
+        mappings = {
+            "pod": [POD_SCHEMA],
+            "deployment": [{"type": "object", "properties": {"metadata": {"$ref": "#/definitions/ObjectMeta"}}}],
+        }
+        definitions = {"ObjectMeta": {"type": "object", "properties": {"name": {"type": "string"}}}}
+        mappings_archive = save_json_archive(data=mappings, json_file=tmp_path / "__resources-mappings.json")
+        definitions_file = tmp_path / "_definitions.json"
+        definitions_file.write_text(json.dumps({"definitions": definitions}))
+
+        mappings_index = save_json_index(
+            data=mappings, index_file=tmp_path / "__resources-mappings.idx", source_file=mappings_archive
+        )
+        definitions_index = save_json_index(
+            data=definitions, index_file=tmp_path / "_definitions.idx", source_file=definitions_file
+        )
+
+        monkeypatch.setattr(schema_validator, "RESOURCES_MAPPING_FILE", tmp_path / "__resources-mappings.json")
+        monkeypatch.setattr(schema_validator, "RESOURCES_MAPPING_ARCHIVE", mappings_archive)
+        monkeypatch.setattr(schema_validator, "RESOURCES_MAPPING_INDEX", mappings_index)
+        monkeypatch.setattr(schema_validator, "DEFINITIONS_FILE", definitions_file)
+        monkeypatch.setattr(schema_validator, "DEFINITIONS_INDEX", definitions_index)
+        monkeypatch.setattr(SchemaValidator, "_mappings_index", None)
+        yield mappings_archive
+        SchemaValidator.clear_cache()
+
+    def test_load_schema_from_index(self, schema_index):
+        with patch.object(SchemaValidator, "load_mappings_data") as mock_load:
+            schema = SchemaValidator.load_schema(kind="Deployment")
+
+        mock_load.assert_not_called()
+        assert schema["properties"]["metadata"]["properties"]["name"]["type"] == "string"
+
+    def test_index_reads_single_kind(self, schema_index):
+        assert SchemaValidator.load_indexes()
+        assert sorted(SchemaValidator._mappings_index) == ["deployment", "pod"]
+        assert SchemaValidator._mappings_index["pod"] == [POD_SCHEMA]
+
+    def test_stale_index_not_used(self, schema_index):
+        save_json_archive(data={"pod": [POD_SCHEMA]}, json_file=schema_index.with_suffix(""))
+
+        assert not SchemaValidator.load_indexes()
+        assert SchemaValidator.load_schema(kind="Deployment") is None